@@ -0,0 +1,57 @@
+import pytest
+from tests.page_objects import base_page
+from tests.page_objects.base_page import BasePage
+from tests.stub_app.server import StubAppServer
+from tests.utils.auth_client import AuthClient
+from tests.utils.wait_history import WaitHistory
+
+
+@pytest.fixture
+def benchmark(request):
+    """Medir una función y fallar si hay una regresión respecto a la línea base
+
+    Returns:
+        callable: ``benchmark(nombre, funcion, **opciones)`` con las opciones de
+                  ``BenchmarkRecorder.measure``
+
+    Note:
+        Con ``--benchmark-save`` no se compara: los resultados reemplazan la
+        línea base al final de la sesión.
+    """
+    recorder = request.config.benchmark_recorder
+
+    def run(name, func, **options):
+        result = recorder.measure(name, func, **options)
+        regressions = recorder.regressions(name)
+        if regressions and not request.config.getoption("--benchmark-save"):
+            pytest.fail("Regresión de rendimiento:\n" + "\n".join(regressions))
+        return result
+
+    return run
+
+
+@pytest.fixture(scope="module")
+def benchmark_app():
+    """Simulación local de la aplicación para que los benchmarks no dependan de la red
+
+    Yields:
+        StubAppServer: Servidor local; ``BasePage.BASE_URL`` apunta a él
+                       mientras se ejecuta el módulo
+
+    Note:
+        Las esperas de los benchmarks no se agregan al historial de la
+        aplicación configurada (``wait_history``)
+    """
+    original = BasePage.BASE_URL, base_page.wait_history
+    with StubAppServer() as server:
+        BasePage.BASE_URL = server.base_url
+        base_page.wait_history = WaitHistory()
+        yield server
+    BasePage.BASE_URL, base_page.wait_history = original
+
+
+@pytest.fixture(scope="module")
+def benchmark_user(benchmark_app):
+    """Usuario registrado en la simulación local para el flujo de inicio de sesión"""
+    with AuthClient(benchmark_app.base_url) as client:
+        return client.create_user()
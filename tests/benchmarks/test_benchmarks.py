@@ -0,0 +1,105 @@
+import pytest
+from selenium.webdriver.common.by import By
+from tests.page_objects.locators import compile_locator
+from tests.page_objects.login_page import LoginPage
+from tests.page_objects.register_page import RegisterPage
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.validation_rules import REGISTER_PASSWORD
+
+pytestmark = pytest.mark.benchmark
+
+CLEAR_STORAGE_SCRIPT = "try { localStorage.clear(); } catch (e) {}"
+
+
+def open_page(page):
+    """Navegar y cargar la página de inmediato (sin esperar a la primera interacción)"""
+    page.navigate()
+    page._ensure_loaded()
+
+
+class TestPurePythonBenchmarks:
+    """Benchmarks de las rutas que no usan el navegador"""
+
+    def test_generar_usuario_prueba(self, benchmark):
+        benchmark("TestDataGenerator.generar_usuario_prueba", TestDataGenerator.generar_usuario_prueba, number=1000)
+
+    def test_register_password_rules(self, benchmark):
+        benchmark("REGISTER_PASSWORD.validate", lambda: REGISTER_PASSWORD.validate("Password123"), number=1000)
+
+    def test_login_validators(self, benchmark):
+        login_page = LoginPage(None)
+
+        def validate():
+            login_page.validate_email_format("usuario@inlaze.test")
+            login_page.validate_password_format("Password1*")
+
+        benchmark("LoginPage.validate_*_format", validate, number=1000)
+
+    def test_compile_locator_translation(self, benchmark):
+        translate = compile_locator.__wrapped__
+        benchmark(
+            "compile_locator (:contains a XPath)",
+            lambda: translate(By.CSS_SELECTOR, ".error-message:contains('correo'), mat-error:contains('correo')"),
+            number=1000
+        )
+
+
+class TestPageObjectBenchmarks:
+    """Benchmarks de los page objects contra la simulación local de la aplicación"""
+
+    def test_navigate_to(self, driver, benchmark_app, benchmark):
+        login_page = LoginPage(driver)
+        benchmark("LoginPage.navigate", lambda: open_page(login_page), driver=driver)
+
+    def test_type_text(self, driver, benchmark_app, benchmark):
+        login_page = LoginPage(driver)
+        open_page(login_page)
+        benchmark(
+            "BasePage.type_text",
+            lambda: login_page.type_text(*login_page.EMAIL_INPUT, "usuario@inlaze.test"),
+            driver=driver
+        )
+
+    def test_click_element(self, driver, benchmark_app, benchmark):
+        login_page = LoginPage(driver)
+        open_page(login_page)
+        benchmark("BasePage.click_element", lambda: login_page.click_element(*login_page.LOGIN_BUTTON), driver=driver)
+
+    def test_get_error_message(self, driver, benchmark_app, benchmark):
+        login_page = LoginPage(driver)
+        open_page(login_page)
+        login_page.click_element(*login_page.LOGIN_BUTTON)
+        benchmark("LoginPage.get_error_message", login_page.get_error_message, driver=driver)
+
+    def test_login_flow(self, driver, benchmark_app, benchmark_user, benchmark):
+        login_page = LoginPage(driver)
+
+        def login():
+            open_page(login_page)
+            success, message = login_page.login(benchmark_user['email'], benchmark_user['password'])
+            assert success, message
+
+        benchmark(
+            "LoginPage flujo completo",
+            login,
+            setup=lambda: driver.execute_script(CLEAR_STORAGE_SCRIPT),
+            driver=driver
+        )
+
+    def test_register_flow(self, driver, benchmark_app, benchmark):
+        register_page = RegisterPage(driver)
+        usuario = {}
+
+        def register():
+            open_page(register_page)
+            success, message = register_page.register(
+                usuario['name'], usuario['email'], usuario['password'], usuario['password']
+            )
+            assert success, message
+
+        benchmark(
+            "RegisterPage flujo completo",
+            register,
+            setup=lambda: usuario.update(TestDataGenerator.generar_usuario_prueba()),
+            driver=driver
+        )
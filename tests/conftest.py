@@ -1,53 +1,592 @@
 import os
+import copy
+import random
 import shutil
+import time
 import pytest
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from tests.page_objects import base_page
+from tests.page_objects.base_page import BasePage
+from tests.page_objects.login_page import LoginPage
+from tests.page_objects.register_page import RegisterPage
+from tests.stub_app.server import StubAppServer, static_fingerprint
+from tests.utils.auth_client import AuthClient
+from tests.utils.benchmark import DEFAULT_BASELINE, BenchmarkRecorder
+from tests.utils.browser_pool import BrowserPool
+from tests.utils.browser_resources import BrowserResourceAllocator
+from tests.utils.duration_scheduler import DurationScheduling, duration_history
+from tests.utils.driver_resolver import ChromeDriverResolver, STATS_SECTION as DRIVER_STATS
+from tests.utils.instrumentation import instrumentation
+from tests.utils.launch_profiles import PROFILES as LAUNCH_PROFILES, ProfileTemplate, launch, warm
+from tests.utils.lazy_driver import LazyDriver, STATS_SECTION as LAZY_STATS
+from tests.utils.fakes import FakeDriver
+from tests.utils.failure_bundle import (
+    LOGGING_PREFS, MODES as FAILURE_ARTIFACT_MODES, PERF_LOGGING_PREFS, failure_bundles
+)
+from tests.utils.response_stubs import ResponseStubs
+from tests.utils.result_cache import result_cache
+from tests.utils.screenshot_service import FORMATS as SCREENSHOT_FORMATS, screenshot_service
+from tests.utils.session_stats import session_stats
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.unique_ids import SEED_ENV, unique_ids
+from tests.utils.user_pool import UserPool, ledger_path_for
+from tests.utils.wait_history import WaitHistory, history_path_for, wait_history
 
-def pytest_configure():
+def pytest_addoption(parser):
+    """Opciones de línea de comandos del framework"""
+    group = parser.getgroup("inlaze", "Framework de pruebas Inlaze")
+    group.addoption(
+        "--browser-pool-size",
+        type=int,
+        default=int(os.environ.get("BROWSER_POOL_SIZE", "1")),
+        help="Número de navegadores inactivos que conserva el pool de cada worker (por defecto: 1)"
+    )
+    group.addoption(
+        "--driver-cache-dir",
+        default=os.environ.get("CHROMEDRIVER_CACHE_DIR"),
+        help="Directorio de caché de chromedriver (por defecto: ~/.cache/inlaze-qa/chromedriver)"
+    )
+    group.addoption(
+        "--driver-offline",
+        action="store_true",
+        default=os.environ.get("CHROMEDRIVER_OFFLINE") == "1",
+        help="No descargar chromedriver; usar únicamente la caché local"
+    )
+    group.addoption(
+        "--launch-profile",
+        choices=sorted(LAUNCH_PROFILES),
+        default=os.environ.get("LAUNCH_PROFILE", "default"),
+        help="Perfil de arranque de Chrome: 'default' o 'throughput' (perfil precalentado, "
+             "sin actividad en segundo plano y chrome-headless-shell si está instalado)"
+    )
+
+    group.addoption(
+        "--base-url",
+        default=os.environ.get("INLAZE_BASE_URL"),
+        help="URL de la aplicación bajo prueba, o 'local' para usar la simulación incluida en tests/stub_app"
+    )
+    group.addoption(
+        "--api-url",
+        default=os.environ.get("INLAZE_API_URL"),
+        help="URL base de la API de autenticación (por defecto, la misma URL de la aplicación)"
+    )
+    group.addoption(
+        "--user-pool-size",
+        type=int,
+        default=int(os.environ.get("USER_POOL_SIZE", "5")),
+        help="Usuarios de prueba que se registran por API al iniciar la sesión (por defecto: 5)"
+    )
+    group.addoption(
+        "--user-ledger-dir",
+        default=os.environ.get("USER_LEDGER_DIR"),
+        help="Directorio del registro de usuarios compartido (por defecto: ~/.cache/inlaze-qa/users)"
+    )
+    group.addoption(
+        "--data-seed",
+        default=os.environ.get(SEED_ENV),
+        help="Semilla de los datos de prueba generados, para reproducir una ejecución"
+    )
+    group.addoption(
+        "--instrument",
+        action="store_true",
+        default=os.environ.get("INSTRUMENT") == "1",
+        help="Medir comandos de WebDriver, esperas y navegaciones por prueba (reports/profiles)"
+    )
+    group.addoption(
+        "--instrument-top",
+        type=int,
+        default=10,
+        help="Elementos que muestra el resumen de medición por categoría (por defecto: 10)"
+    )
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Ejecutar los benchmarks de tests/benchmarks (omitidos por defecto)"
+    )
+    group.addoption(
+        "--benchmark-iterations",
+        type=int,
+        default=20,
+        help="Iteraciones medidas por benchmark (por defecto: 20)"
+    )
+    group.addoption(
+        "--benchmark-baseline",
+        default=DEFAULT_BASELINE,
+        help=f"Archivo de la línea base de benchmarks (por defecto: {DEFAULT_BASELINE})"
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=0.2,
+        help="Aumento de la mediana, respecto a la línea base, que se considera regresión (por defecto: 0.2 = 20%%)"
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        default=False,
+        help="Guardar los resultados como nueva línea base en lugar de compararlos"
+    )
+    group.addoption(
+        "--failure-artifacts",
+        choices=FAILURE_ARTIFACT_MODES,
+        default=os.environ.get("FAILURE_ARTIFACTS", "screenshot"),
+        help="Artefactos de los fallos: 'screenshot', 'bundle' (DOM, consola y red en JSON comprimido) o 'both'"
+    )
+    group.addoption(
+        "--screenshot-format",
+        choices=SCREENSHOT_FORMATS,
+        default=os.environ.get("SCREENSHOT_FORMAT", "png"),
+        help="Formato de las capturas de error: 'png' o 'jpeg' comprimido (por defecto: png)"
+    )
+    group.addoption(
+        "--screenshot-quality",
+        type=int,
+        default=int(os.environ.get("SCREENSHOT_QUALITY", "70")),
+        help="Calidad de las capturas jpeg, de 1 a 100 (por defecto: 70)"
+    )
+    group.addoption(
+        "--screenshot-max-kb",
+        type=int,
+        default=int(os.environ.get("SCREENSHOT_MAX_KB", "0")),
+        help="Tamaño máximo de cada captura jpeg en KB; 0 sin límite"
+    )
+    group.addoption(
+        "--screenshot-max-files",
+        type=int,
+        default=int(os.environ.get("SCREENSHOT_MAX_FILES", "200")),
+        help="Capturas que se conservan por worker; las más antiguas se eliminan (por defecto: 200)"
+    )
+    group.addoption(
+        "--screenshots-per-test",
+        type=int,
+        default=int(os.environ.get("SCREENSHOTS_PER_TEST", "1")),
+        help="Capturas máximas por prueba; 0 sin límite (por defecto: 1)"
+    )
+    group.addoption(
+        "--stub-latency-ms",
+        type=float,
+        default=float(os.environ.get("STUB_LATENCY_MS", "0")),
+        help="Latencia agregada a cada llamada a la API de la simulación local"
+    )
+    group.addoption(
+        "--stub-error-rate",
+        type=float,
+        default=float(os.environ.get("STUB_ERROR_RATE", "0")),
+        help="Probabilidad (0-1) de que la API de la simulación local responda con error 500"
+    )
+    group.addoption(
+        "--navigation-mode",
+        choices=("soft", "full"),
+        default=os.environ.get("NAVIGATION_MODE", "soft"),
+        help="Navegar con el router de la aplicación ya cargada (soft) o recargar la página en cada navegación (full)"
+    )
+    group.addoption(
+        "--readiness",
+        choices=("angular", "dom"),
+        default=os.environ.get("READINESS", "angular"),
+        help="Esperar a que Angular esté estable con su API de testability y carga 'eager' (angular), "
+             "o esperar los elementos del DOM tras la carga completa del documento (dom)"
+    )
+    group.addoption(
+        "--fixed-timeouts",
+        action="store_true",
+        default=os.environ.get("FIXED_TIMEOUTS") == "1",
+        help="Usar siempre el timeout fijo de los page objects en lugar del adaptativo"
+    )
+    group.addoption(
+        "--timeout-multiplier",
+        type=float,
+        default=3.0,
+        help="Timeout adaptativo: múltiplo del p99 histórico de cada espera"
+    )
+    group.addoption(
+        "--timeout-floor",
+        type=float,
+        default=1.0,
+        help="Timeout adaptativo mínimo en segundos"
+    )
+    group.addoption(
+        "--timeout-ceiling",
+        type=float,
+        default=float(BasePage.TIMEOUT),
+        help="Timeout adaptativo máximo en segundos"
+    )
+    group.addoption(
+        "--wait-history-dir",
+        default=os.environ.get("WAIT_HISTORY_DIR"),
+        help="Directorio del historial de duración de las esperas (por defecto ~/.cache/inlaze-qa/waits)"
+    )
+    group.addoption(
+        "--xdist-default-scheduler",
+        action="store_true",
+        default=False,
+        help="Usar el reparto por defecto de pytest-xdist en lugar del reparto por duración"
+    )
+    group.addoption(
+        "--result-cache",
+        action="store_true",
+        default=os.environ.get("RESULT_CACHE") == "1",
+        help="Omitir las pruebas que ya pasaron sin cambios en su código, dependencias, datos ni en la aplicación"
+    )
+    group.addoption(
+        "--app-fingerprint",
+        default=os.environ.get("APP_FINGERPRINT"),
+        help="Huella de la compilación de la aplicación (versión, commit...) para la caché de resultados"
+    )
+    group.addoption(
+        "--eager-browser",
+        action="store_true",
+        default=os.environ.get("EAGER_BROWSER") == "1",
+        help="Obtener el navegador al iniciar cada prueba en lugar de hacerlo en el primer uso"
+    )
+
+def pytest_configure(config):
     """Configuración inicial de pytest
     
     Prepara el directorio para reportes y capturas de pantalla de errores
     
     Note:
         - Limpia reportes anteriores
+        - Con ``--data-seed`` los datos generados se vuelven reproducibles
         - Crea estructura de directorios necesaria
         - Las capturas se guardan en reports/screenshots
+        - Con pytest-xdist solo el proceso principal limpia los reportes, para
+          que un worker no elimine las capturas de otro
     """
+    config.addinivalue_line(
+        "markers",
+        "fill_mode(modo): modo de llenado de formularios para la prueba ('script' o 'keys')"
+    )
+    config.addinivalue_line(
+        "markers",
+        "navigation_mode(modo): modo de navegación de la prueba ('soft' o 'full')"
+    )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: benchmark del framework; solo se ejecuta con --benchmark"
+    )
+    config.addinivalue_line(
+        "markers",
+        "browser_dirty: la prueba deja el navegador en un estado que no se puede limpiar; se recicla al terminar"
+    )
+    seed = config.getoption("--data-seed")
+    if seed is not None:
+        unique_ids.configure(seed=seed)
+        # Misma semilla en todos los procesos: los workers de xdist deben
+        # recolectar las mismas pruebas; los correos se distinguen por worker
+        # mediante ``unique_ids``
+        random.seed(str(seed))
+
+    instrumentation.configure(
+        enabled=config.getoption("--instrument"),
+        top_n=config.getoption("--instrument-top")
+    )
+    config.benchmark_recorder = BenchmarkRecorder(
+        baseline_path=config.getoption("--benchmark-baseline"),
+        threshold=config.getoption("--benchmark-threshold"),
+        iterations=config.getoption("--benchmark-iterations")
+    ) if config.getoption("--benchmark") else None
+    wait_history.configure(
+        path=history_path_for(config.getoption("--base-url") or BasePage.BASE_URL, config.getoption("--wait-history-dir")),
+        enabled=not config.getoption("--fixed-timeouts"),
+        multiplier=config.getoption("--timeout-multiplier"),
+        floor=config.getoption("--timeout-floor"),
+        ceiling=config.getoption("--timeout-ceiling")
+    )
+    config.duration_scheduler = None
+    if not hasattr(config, "workerinput"):
+        duration_history.load(getattr(config, "cache", None))
+    base_url = config.getoption("--base-url") or BasePage.BASE_URL
+    # La simulación local no tiene huella de compilación: su versión es el
+    # contenido de sus archivos estáticos y sus opciones
+    stub_details = None
+    if base_url == "local":
+        stub_details = {
+            "static": static_fingerprint(),
+            "latency_ms": config.getoption("--stub-latency-ms"),
+            "error_rate": config.getoption("--stub-error-rate"),
+        }
+    try:
+        result_cache.configure(
+            enabled=config.getoption("--result-cache"),
+            base_url=base_url,
+            fingerprint=config.getoption("--app-fingerprint"),
+            cache=getattr(config, "cache", None),
+            details=stub_details
+        )
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    failure_bundles.configure(config.getoption("--failure-artifacts"))
+    screenshot_service.configure(
+        image_format=config.getoption("--screenshot-format"),
+        quality=config.getoption("--screenshot-quality"),
+        max_bytes=config.getoption("--screenshot-max-kb") * 1024,
+        max_files=config.getoption("--screenshot-max-files"),
+        per_test_limit=config.getoption("--screenshots-per-test")
+    )
+
     reports_dir = os.path.join(os.getcwd(), 'reports')
-    if os.path.exists(reports_dir):
+    is_worker = hasattr(config, "workerinput")
+    if os.path.exists(reports_dir) and not is_worker:
         shutil.rmtree(reports_dir)
     os.makedirs(os.path.join(reports_dir, 'screenshots'), exist_ok=True)
 
+def pytest_collection_modifyitems(config, items):
+    """Omitir pruebas según las opciones de la ejecución
+
+    Note:
+        - Los benchmarks solo se ejecutan con ``--benchmark`` y nunca se toman
+          de la caché de resultados
+        - Con ``--result-cache`` se omiten las pruebas que ya pasaron con las
+          mismas entradas (ver ``ResultCache``)
+    """
+    run_benchmarks = config.getoption("--benchmark")
+    skip_benchmark = pytest.mark.skip(reason="benchmark: ejecutar con --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            if not run_benchmarks:
+                item.add_marker(skip_benchmark)
+            continue
+        if result_cache.enabled:
+            passed_at = result_cache.lookup(item)
+            if passed_at:
+                item.add_marker(pytest.mark.skip(
+                    reason=f"resultado en caché: pasó el {passed_at} sin cambios en sus entradas"
+                ))
+
+@pytest.fixture(scope="session")
+def launch_profile(request):
+    """Perfil de arranque de Chrome de la sesión (``--launch-profile``)
+
+    Returns:
+        LaunchProfile: Argumentos, binario y plantilla de los navegadores
+    """
+    return LAUNCH_PROFILES[request.config.getoption("--launch-profile")]
+
 @pytest.fixture(scope="session")
-def chrome_options():
+def chrome_options(launch_profile, request):
     """Configuración del navegador Chrome para las pruebas
     
     Returns:
         Options: Opciones configuradas para Chrome
+
+    Note:
+        - Los argumentos y el binario dependen del perfil de arranque
+        - Con ``--readiness=angular`` la estrategia de carga es ``eager``: la
+          navegación vuelve con el documento listo, sin esperar imágenes ni
+          hojas de estilo, y los page objects esperan a que Angular esté estable
+        - El puerto de DevTools y el perfil de usuario se asignan por navegador
+          en ``create_driver`` para que los workers de xdist no compitan entre sí
+        - Con los paquetes de diagnóstico activos se habilitan los registros
+          de consola y de red de Chrome
     """
-    options = Options()
-    options.add_argument('--headless=new')
-    options.add_argument('--start-maximized')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-software-rasterizer')
-    options.add_argument('--remote-debugging-port=9222')
-    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    options = launch_profile.options()
+    if request.config.getoption("--readiness") == "angular":
+        options.page_load_strategy = 'eager'
+    if failure_bundles.enabled:
+        options.set_capability('goog:loggingPrefs', LOGGING_PREFS)
+        options.add_experimental_option('perfLoggingPrefs', PERF_LOGGING_PREFS)
     return options
 
-@pytest.fixture(scope="class")
-def driver(chrome_options, request):
+@pytest.fixture(scope="session")
+def stub_app(request):
+    """Aplicación simulada local, si la sesión se ejecuta con ``--base-url=local``
+
+    Yields:
+        StubAppServer: Servidor local o None si se prueba contra otra URL
+
+    Note:
+        Cada worker inicia su propia instancia, con un almacén de usuarios en
+        memoria; así las pruebas no dependen de la red ni del backend real.
+    """
+    if request.config.getoption("--base-url") != "local":
+        yield None
+        return
+
+    server = StubAppServer(
+        latency=request.config.getoption("--stub-latency-ms") / 1000,
+        error_rate=request.config.getoption("--stub-error-rate")
+    )
+    server.start()
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session", autouse=True)
+def app_base_url(stub_app, request):
+    """URL base de la aplicación bajo prueba
+
+    Yields:
+        str: URL que usan los page objects (``BasePage.BASE_URL``)
+    """
+    base_url = stub_app.base_url if stub_app else request.config.getoption("--base-url")
+    original = BasePage.BASE_URL
+    if base_url:
+        BasePage.BASE_URL = base_url.rstrip("/")
+    yield BasePage.BASE_URL
+    BasePage.BASE_URL = original
+
+@pytest.fixture(scope="session")
+def auth_client(app_base_url, request):
+    """Cliente de la API de autenticación compartido por la sesión
+
+    Yields:
+        AuthClient: Cliente con conexiones persistentes a la API
+    """
+    client = AuthClient(request.config.getoption("--api-url") or app_base_url)
+    yield client
+    client.close()
+
+@pytest.fixture(scope="session")
+def chromedriver_resolver(launch_profile, request):
+    """Resolución de chromedriver compartida por toda la sesión
+
+    Returns:
+        ChromeDriverResolver: Resolvedor con caché local de drivers
+
+    Note:
+        Si el perfil usa ``chrome-headless-shell``, el driver se resuelve para
+        la versión de ese binario.
+    """
+    return ChromeDriverResolver(
+        cache_dir=request.config.getoption("--driver-cache-dir"),
+        offline=request.config.getoption("--driver-offline"),
+        chrome_binary=launch_profile.binary
+    )
+
+@pytest.fixture(scope="session")
+def browser_resources():
+    """Asignador de puertos DevTools y perfiles temporales del worker
+
+    Yields:
+        BrowserResourceAllocator: Asignador de recursos por navegador
+    """
+    allocator = BrowserResourceAllocator()
+    yield allocator
+    allocator.release_all()
+
+@pytest.fixture(scope="session")
+def profile_template(launch_profile, chrome_options, chromedriver_resolver, app_base_url, request):
+    """Plantilla de perfil precalentada del perfil de arranque, si la usa
+
+    Returns:
+        ProfileTemplate: Plantilla lista para clonarse, o None
+
+    Note:
+        La plantilla se crea una sola vez (bloqueo entre workers) y se
+        conserva entre ejecuciones en ``~/.cache/inlaze-qa/chrome-templates``.
+    """
+    if not launch_profile.template:
+        return None
+    template = ProfileTemplate(
+        launch_profile,
+        chromedriver_resolver.detect_chrome_version(),
+        request.config.getoption("--base-url") or app_base_url
+    )
+    template.ensure(lambda user_data_dir: warm(
+        copy.deepcopy(chrome_options), chromedriver_resolver.service(), user_data_dir, app_base_url
+    ))
+    return template
+
+def create_driver(chrome_options, resolver, allocator, profile=LAUNCH_PROFILES["default"], template=None):
+    """Crear y configurar una nueva instancia de Chrome
+
+    Args:
+        chrome_options: Opciones de configuración de Chrome
+        resolver: Resolvedor de chromedriver de la sesión
+        allocator: Asignador de puerto DevTools y perfil temporal
+        profile: Perfil de arranque de la sesión
+        template: Plantilla de perfil que se clona en el perfil temporal
+
+    Returns:
+        WebDriver: Navegador configurado con los tiempos de espera del framework
+
+    Note:
+        El tiempo de arranque se registra en el resumen de la sesión, separado
+        según si el driver se obtuvo de la caché o tuvo que descargarse, y el
+        tiempo hasta el primer comando se registra por perfil de arranque.
+    """
+    resources = allocator.allocate()
+    options = copy.deepcopy(chrome_options)
+    for argument in resources.chrome_arguments():
+        options.add_argument(argument)
+
+    start = time.perf_counter()
+    try:
+        if template is not None:
+            template.clone(resources.user_data_dir)
+        driver, _ = launch(profile, options, resolver.service())
+    except Exception:
+        allocator.release(resources)
+        raise
+    driver.browser_resources = resources
+    
+    if instrumentation.enabled:
+        instrumentation.attach(driver)
+    driver.set_page_load_timeout(30)
+    driver.implicitly_wait(0)
+    driver.wait = WebDriverWait(driver, 10)
+
+    session_stats.add_timing(
+        DRIVER_STATS,
+        'arranque de Chrome (driver en caché)' if resolver.cache_hit else 'arranque de Chrome (driver descargado)',
+        time.perf_counter() - start
+    )
+    return driver
+
+@pytest.fixture(scope="session")
+def browser_pool(chrome_options, chromedriver_resolver, browser_resources, launch_profile, profile_template, request):
+    """Pool de navegadores reutilizables del worker actual
+
+    Yields:
+        BrowserPool: Pool que entrega navegadores ya iniciados
+
+    Note:
+        El alcance de sesión hace que cada worker de xdist tenga su propio pool.
+        Al finalizar la sesión se cierran los navegadores inactivos.
+    """
+    pool = BrowserPool(
+        factory=lambda: create_driver(
+            chrome_options, chromedriver_resolver, browser_resources, launch_profile, profile_template
+        ),
+        disposer=lambda driver: browser_resources.release(getattr(driver, "browser_resources", None)),
+        max_idle=request.config.getoption("--browser-pool-size")
+    )
+    yield pool
+    pool.close()
+
+@pytest.fixture(autouse=True)
+def command_profile(request):
+    """Medición de comandos, esperas y navegaciones de cada prueba
+
+    Note:
+        Solo mide con ``--instrument``; el perfil de la prueba se escribe en
+        ``reports/profiles/<prueba>.json`` al terminar, incluida la limpieza
+        del navegador.
+    """
+    instrumentation.begin_test(request.node.nodeid)
+    yield
+    rep_call = getattr(request.node, "rep_call", None)
+    instrumentation.end_test(rep_call.outcome if rep_call else "error")
+
+@pytest.fixture
+def fake_driver(monkeypatch):
+    """Navegador simulado para las pruebas unitarias que no necesitan Chrome
+
+    Note:
+        Las esperas de los page objects contra el navegador simulado no se
+        agregan al historial de esperas de la sesión.
+    """
+    monkeypatch.setattr(base_page, "wait_history", WaitHistory())
+    return FakeDriver()
+
+@pytest.fixture
+def driver(browser_pool, request):
     """Fixture principal para el navegador web
     
     Args:
-        chrome_options: Opciones de configuración de Chrome
+        browser_pool: Pool de navegadores del worker
         request: Objeto de solicitud de pytest
     
     Yields:
@@ -55,39 +594,248 @@ def driver(chrome_options, request):
     
     Note:
         - Timeout de carga de página: 30 segundos
-        - Tiempo de espera implícito: 10 segundos
-        - Captura automática de pantalla en caso de fallo
+        - Sin espera implícita: los page objects usan solo esperas explícitas
+        - Captura automática de pantalla (o paquete de diagnóstico, según
+          ``--failure-artifacts``) en caso de fallo, salvo que la prueba ya
+          haya guardado uno
+        - El marcador ``fill_mode`` selecciona el modo de llenado de formularios
+        - El marcador ``navigation_mode`` (o ``--navigation-mode``) selecciona
+          si las navegaciones usan el router de la aplicación o recargan la página
+        - ``--readiness`` selecciona si los page objects esperan la estabilidad
+          de Angular o solo los elementos del DOM
+        - El navegador se toma del pool y se limpia al terminar la prueba;
+          con el marcador ``browser_dirty`` se recicla en lugar de limpiarse
+        - Por defecto se entrega un ``LazyDriver``: el navegador se toma del
+          pool en el primer comando de WebDriver, y las pruebas que no lo usan
+          no lo lanzan (``--eager-browser`` desactiva este comportamiento)
     """
-    screenshots_dir = os.path.join('reports', 'screenshots')
-    
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=chrome_options
-    )
-    driver.set_window_size(1920, 1080)
-    
-    driver.set_page_load_timeout(30)
-    driver.implicitly_wait(10)
-    driver.wait = WebDriverWait(driver, 10)
+    screenshot_service.begin_test(request.node.name)
+    failure_bundles.begin_test(request.node.name)
     
+    if request.config.getoption("--eager-browser"):
+        driver = browser_pool.acquire()
+    else:
+        driver = LazyDriver(browser_pool.acquire)
     driver.test_name = request.node.name if request else "prueba_desconocida"
+    fill_mode = request.node.get_closest_marker("fill_mode")
+    driver.fill_mode = fill_mode.args[0] if fill_mode else None
+    navigation_mode = request.node.get_closest_marker("navigation_mode")
+    driver.navigation_mode = (
+        navigation_mode.args[0] if navigation_mode else request.config.getoption("--navigation-mode")
+    )
+    driver.readiness = request.config.getoption("--readiness")
     
     yield driver
     
+    if getattr(driver, "lazy", False):
+        if driver.pending_navigation:
+            session_stats.incr(LAZY_STATS, 'cargas de página evitadas')
+        if not driver.materialized:
+            session_stats.incr(LAZY_STATS, 'navegadores evitados')
+            return
+        driver = driver.wrapped_driver
+
     try:
         if request.node.rep_call.failed:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            screenshot_path = os.path.join(
-                screenshots_dir,
-                f"error_{request.node.name}_{timestamp}.png"
-            )
-            driver.save_screenshot(screenshot_path)
+            BasePage(driver).capture_failure(reason=request.node.rep_call.longreprtext[-2000:])
     except AttributeError:
         pass
+    if failure_bundles.enabled:
+        failure_bundles.discard_logs(driver)
     
-    driver.quit()
+    browser_pool.release(
+        driver,
+        recycle=request.node.get_closest_marker("browser_dirty") is not None
+    )
+
+@pytest.fixture(scope="session")
+def user_pool(auth_client, stub_app, request, tmp_path_factory):
+    """Pool de usuarios ya registrados, compartido por todos los workers
+
+    Returns:
+        UserPool: Pool lleno con ``--user-pool-size`` usuarios libres
+
+    Note:
+        Con la simulación local cada worker tiene su propio backend en
+        memoria, por lo que el registro se guarda en el directorio temporal
+        del worker en lugar del directorio compartido.
+    """
+    ledger_dir = (
+        str(tmp_path_factory.mktemp("usuarios")) if stub_app
+        else request.config.getoption("--user-ledger-dir")
+    )
+    pool = UserPool(
+        auth_client,
+        ledger_path_for(auth_client.base_url, ledger_dir),
+        size=request.config.getoption("--user-pool-size")
+    )
+    pool.fill()
+    return pool
+
+@pytest.fixture
+def pooled_user(user_pool):
+    """Usuario registrado prestado en exclusiva a la prueba
+
+    Yields:
+        dict: Credenciales del usuario (name, email, password)
+
+    Note:
+        Al terminar la prueba el usuario vuelve al pool; una prueba que
+        modifique la cuenta debe retirarla con ``user_pool.retire(usuario)``.
+    """
+    user = user_pool.lease()
+    yield user
+    user_pool.release(user)
+
+@pytest.fixture
+def response_stubs(driver):
+    """Respuestas del backend simuladas en el navegador de la prueba
+
+    Yields:
+        ResponseStubs: Registro donde la prueba declara las respuestas
+
+    Example:
+        stub = response_stubs.add('POST', '/auth/sign-up', 409, {'message': '...'})
+        ...
+        assert len(stub.hits) == 1
+
+    Note:
+        Las peticiones se resuelven en Chrome (dominio Fetch), sin llegar al
+        backend; al terminar la prueba se deja de interceptar.
+    """
+    stubs = ResponseStubs(driver)
+    yield stubs
+    stubs.stop()
+
+def api_provisioning_enabled(config, stub_app):
+    """Indica si los usuarios de prueba pueden prepararse por API
+
+    Note:
+        Las rutas de la API y el contrato de la sesión en el navegador son los
+        de la simulación local; contra otra aplicación solo se usan si la API
+        se indicó explícitamente (``--api-url``).
+    """
+    return stub_app is not None or bool(config.getoption("--api-url"))
+
+@pytest.fixture
+def authenticated_user(driver, stub_app, request):
+    """Usuario con la sesión ya iniciada en el navegador, en el panel
+
+    Returns:
+        dict: Credenciales del usuario (name, email, password)
+
+    Note:
+        - Con la simulación local o ``--api-url`` el usuario se toma del pool
+          de usuarios ya registrados (``pooled_user``), inicia sesión por API
+          y el token se inyecta en el navegador: no se crea ninguna cuenta
+          durante la prueba
+        - En otro caso se registra e inicia sesión con los formularios
+    """
+    login_page = LoginPage(driver)
+    if api_provisioning_enabled(request.config, stub_app):
+        user = dict(request.getfixturevalue("pooled_user"))
+        user.update(request.getfixturevalue("auth_client").sign_in(user['email'], user['password']))
+        login_page.set_auth_state(user['token'], user['user'])
+        login_page.open_dashboard()
+        return user
+
+    user = TestDataGenerator.generar_usuario_prueba()
+    register_page = RegisterPage(driver)
+    register_page.navigate()
+    success, message = register_page.register(user['name'], user['email'], user['password'], user['password'])
+    if not success:
+        raise Exception(f"No se pudo registrar el usuario de prueba: {message}")
+    login_page.navigate()
+    success, message = login_page.login(user['email'], user['password'])
+    if not success:
+        raise Exception(f"No se pudo iniciar sesión con el usuario de prueba: {message}")
+    return user
+
+def pytest_sessionfinish(session):
+    """Enviar las métricas del worker al proceso principal de xdist
+
+    Note:
+        - Antes se escriben las capturas de pantalla pendientes, para que sus
+          métricas se incluyan en el resumen
+        - Cada proceso agrega sus duraciones de espera al historial compartido
+        - Con ``--benchmark-save`` el proceso principal guarda la línea base
+        - El proceso principal guarda en la caché de pytest la duración de
+          las pruebas (reparto por duración) y las que pasaron (caché de
+          resultados)
+    """
+    screenshot_service.close()
+    wait_history.save()
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["session_stats"] = session_stats.as_dict()
+        workeroutput["instrumentation"] = instrumentation.as_dict()
+        if session.config.benchmark_recorder:
+            workeroutput["benchmarks"] = session.config.benchmark_recorder.results
+        return
+    if session.config.benchmark_recorder and session.config.getoption("--benchmark-save"):
+        session.config.benchmark_recorder.save()
+    if session.config.duration_scheduler:
+        session.config.duration_scheduler.finish()
+    duration_history.save(getattr(session.config, "cache", None))
+    result_cache.save(getattr(session.config, "cache", None))
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Repartir las pruebas entre los workers por duración (``DurationScheduling``)
+
+    Note:
+        Solo reemplaza la distribución ``load`` (la de ``-n``); con
+        ``--xdist-default-scheduler`` o con otro ``--dist`` se usa la de xdist.
+    """
+    if config.getoption("dist") != "load" or config.getoption("--xdist-default-scheduler"):
+        return None
+    config.duration_scheduler = DurationScheduling(config, log, history=duration_history)
+    return config.duration_scheduler
+
+def pytest_runtest_logreport(report):
+    """Registrar la duración y el resultado de cada fase de las pruebas
+
+    Note:
+        - La duración se usa en el reparto por duración y el resultado en la
+          caché de resultados
+        - Con xdist se registra en el proceso principal, que recibe los
+          reportes de todos los workers
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+    node = getattr(report, "node", None)
+    duration_history.record(report.nodeid, report.duration, node.gateway.id if node else "main")
+    result_cache.record(report)
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Combinar las métricas enviadas por cada worker de xdist"""
+    workeroutput = getattr(node, "workeroutput", {})
+    if workeroutput.get("session_stats"):
+        session_stats.merge(workeroutput["session_stats"])
+    if workeroutput.get("instrumentation"):
+        instrumentation.merge(workeroutput["instrumentation"])
+    if workeroutput.get("benchmarks"):
+        node.config.benchmark_recorder.results.update(workeroutput["benchmarks"])
 
+def pytest_terminal_summary(terminalreporter):
+    """Mostrar las métricas del framework al final de la sesión"""
+    for title, lines in session_stats.summary_lines() + instrumentation.summary_lines():
+        terminalreporter.write_sep("-", title)
+        for line in lines:
+            terminalreporter.write_line(line)
+    scheduler = terminalreporter.config.duration_scheduler
+    if scheduler and scheduler.summary_lines():
+        terminalreporter.write_sep("-", "Reparto de pruebas por duración")
+        for line in scheduler.summary_lines():
+            terminalreporter.write_line(line)
+    recorder = terminalreporter.config.benchmark_recorder
+    if recorder and recorder.results:
+        terminalreporter.write_sep("-", "Benchmarks")
+        for line in recorder.summary_lines():
+            terminalreporter.write_line(line)
+        if terminalreporter.config.getoption("--benchmark-save"):
+            terminalreporter.write_line(f"Línea base guardada en {recorder.baseline_path}")
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -1,5 +1,7 @@
 import os
-from datetime import datetime
+import json
+import time
+from urllib.parse import urlsplit
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
@@ -8,69 +10,518 @@ from selenium.common.exceptions import (
     TimeoutException,
     ElementClickInterceptedException
 )
+from .locators import compile_locator, locator
+from ..utils.lazy_driver import STATS_SECTION as LAZY_STATS_SECTION
+from ..utils.failure_bundle import failure_bundles
+from ..utils.instrumentation import describe_condition, instrumentation
+from ..utils.screenshot_service import screenshot_service
+from ..utils.session_stats import session_stats
+from ..utils.wait_history import wait_history
+
+FIND_ELEMENTS_JS = """
+function find(by, value) {
+    var found = [];
+    if (by === 'xpath') {
+        var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < snapshot.snapshotLength; i++) { found.push(snapshot.snapshotItem(i)); }
+        return found;
+    }
+    if (by === 'id') { return [document.getElementById(value)].filter(Boolean); }
+    if (by === 'name') { return Array.prototype.slice.call(document.getElementsByName(value)); }
+    if (by === 'class name') { return Array.prototype.slice.call(document.getElementsByClassName(value)); }
+    if (by === 'tag name') { return Array.prototype.slice.call(document.getElementsByTagName(value)); }
+    return Array.prototype.slice.call(document.querySelectorAll(value));
+}
+"""
+
+# Asigna el valor con el setter nativo y emite los eventos que escuchan los
+# formularios reactivos de Angular (input/change para el valor, blur para touched)
+SET_VALUE_JS = """
+function setValue(element, text) {
+    var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, text);
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.dispatchEvent(new FocusEvent('blur'));
+    element.dispatchEvent(new FocusEvent('focusout', {bubbles: true}));
+    return element.value;
+}
+"""
+
+READ_STATE_SCRIPT = FIND_ELEMENTS_JS + """
+var specs = arguments[0];
+var result = {};
+
+function text(element) {
+    return (element.innerText || element.textContent || '').trim();
+}
+
+function read(element, attribute) {
+    if (attribute === 'text') { return text(element); }
+    if (attribute === 'enabled') { return !element.disabled; }
+    if (attribute === 'displayed') {
+        var style = window.getComputedStyle(element);
+        return element.getClientRects().length > 0 && style.visibility !== 'hidden';
+    }
+    if (attribute === 'class') { return element.getAttribute('class'); }
+    var property = element[attribute];
+    if (property !== undefined && property !== null && typeof property !== 'object' && typeof property !== 'function') {
+        return property;
+    }
+    return element.getAttribute(attribute);
+}
+
+specs.forEach(function (spec) {
+    var elements = find(spec.by, spec.value);
+    var entry = {present: elements.length > 0, count: elements.length};
+    spec.attributes.forEach(function (attribute) {
+        if (attribute === 'texts') {
+            entry.texts = elements.map(text).filter(function (t) { return t.length > 0; });
+        } else {
+            entry[attribute] = elements.length ? read(elements[0], attribute) : null;
+        }
+    });
+    result[spec.name] = entry;
+});
+return result;
+"""
+
+FILL_FORM_SCRIPT = FIND_ELEMENTS_JS + SET_VALUE_JS + """
+var fields = arguments[0];
+var result = {values: [], missing: []};
+fields.forEach(function (field, index) {
+    var element = find(field.by, field.value)[0];
+    if (!element) {
+        result.missing.push(index);
+        result.values.push(null);
+        return;
+    }
+    result.values.push(setValue(element, field.text));
+});
+return result;
+"""
+
+SET_ELEMENT_VALUE_SCRIPT = SET_VALUE_JS + "return setValue(arguments[0], arguments[1]);"
+
+SET_AUTH_STATE_SCRIPT = """
+var tokenKey = arguments[0], token = arguments[1], userKey = arguments[2], user = arguments[3];
+localStorage.setItem(tokenKey, token);
+if (user !== null) { localStorage.setItem(userKey, user); }
+"""
+
+# Reinicia el formulario con la API de depuración de Angular (``ng``): primero
+# ``FormGroupDirective.resetForm`` (también limpia el estado "enviado") y si no
+# está disponible el ``FormGroup`` del componente; luego aplica la detección de
+# cambios. Las compilaciones de producción no exponen ``ng``: entonces se vacía
+# cada campo con eventos input/blur y se llama a ``form.reset()``, cuyo evento
+# ``reset`` atienden ``FormGroupDirective`` y ``NgForm`` reiniciando el modelo.
+# Con ``arguments[2]`` en false solo lee el estado del formulario.
+RESET_FORM_SCRIPT = FIND_ELEMENTS_JS + SET_VALUE_JS + """
+var form = find(arguments[0], arguments[1])[0];
+var reset = arguments[2];
+var result = {method: null, fields: [], errors: 0};
+if (!form) { return result; }
+
+if (reset && window.ng && typeof ng.getComponent === 'function') {
+    var directives = typeof ng.getDirectives === 'function' ? ng.getDirectives(form) : [];
+    for (var i = 0; i < directives.length && !result.method; i++) {
+        if (typeof directives[i].resetForm === 'function') {
+            directives[i].resetForm();
+            result.method = 'FormGroupDirective.resetForm';
+        }
+    }
+    var component = null;
+    for (var node = form; node && !component; node = node.parentElement) {
+        component = ng.getComponent(node);
+    }
+    if (component && !result.method) {
+        for (var key in component) {
+            var group = component[key];
+            if (group && typeof group.reset === 'function' && group.controls) {
+                group.reset();
+                result.method = 'FormGroup.reset';
+                break;
+            }
+        }
+    }
+    if (component && result.method && typeof ng.applyChanges === 'function') {
+        ng.applyChanges(component);
+    }
+}
+
+if (reset && !result.method) {
+    Array.prototype.forEach.call(form.querySelectorAll('input, textarea'), function (field) {
+        if (/^(checkbox|radio|submit|button|hidden|file)$/.test(field.type)) { return; }
+        setValue(field, '');
+    });
+    form.reset();
+    result.method = 'form.reset';
+}
+
+Array.prototype.forEach.call(form.querySelectorAll('input, textarea, select'), function (field) {
+    result.fields.push({
+        name: field.getAttribute('formcontrolname') || field.name || field.id,
+        value: field.value,
+        classes: field.getAttribute('class') || ''
+    });
+});
+result.errors = form.querySelectorAll('mat-error').length;
+return result;
+"""
+
+# Navegación dentro de la aplicación ya cargada: el router de Angular (y la
+# simulación local) atienden el evento popstate después de cambiar la URL con
+# la API de historial. Devuelve el motivo si la navegación debe ser completa.
+SOFT_NAVIGATE_SCRIPT = """
+var origin = arguments[0], path = arguments[1], appSelector = arguments[2];
+if (location.origin !== origin) { return 'origen distinto'; }
+if (!document.querySelector(appSelector)) { return 'aplicación no cargada'; }
+if (location.pathname + location.search === path) { return 'misma ruta'; }
+history.pushState(null, '', path);
+window.dispatchEvent(new PopStateEvent('popstate', {state: null}));
+return null;
+"""
+
+# Estabilidad de Angular con su API de testability: responde cuando no quedan
+# tareas de zone.js (temporizadores, peticiones HTTP) ni detección de cambios
+# pendiente. Mientras la aplicación arranca (raíz vacía) se considera ocupada;
+# si la raíz ya se renderizó y la API no aparece en ``arguments[1]`` ms, la
+# aplicación no la expone. Devuelve 'estable', 'ocupada' o 'sin testability'
+# y nunca espera más de ``arguments[2]`` ms.
+WAIT_FOR_ANGULAR_SCRIPT = """
+var rootSelector = arguments[0], graceMs = arguments[1], sliceMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var start = Date.now(), renderedAt = null;
+function testabilities() {
+  return window.getAllAngularTestabilities ? window.getAllAngularTestabilities() : [];
+}
+(function waitForRegistration() {
+  var list = testabilities();
+  if (!list.length) {
+    var now = Date.now();
+    if (renderedAt === null && document.querySelector(rootSelector)) { renderedAt = now; }
+    if (renderedAt !== null && now - renderedAt >= graceMs) { done('sin testability'); return; }
+    if (now - start >= sliceMs) { done('ocupada'); return; }
+    setTimeout(waitForRegistration, 10);
+    return;
+  }
+  var pending = list.length;
+  var timer = setTimeout(function () { done('ocupada'); }, Math.max(0, sliceMs - (Date.now() - start)));
+  list.forEach(function (testability) {
+    testability.whenStable(function () {
+      if (--pending === 0) { clearTimeout(timer); done('estable'); }
+    });
+  });
+})();
+"""
+
+RESET_STATS_SECTION = 'reset_form'
 
 class BasePage:
-    BASE_URL = "https://test-qa.inlaze.com"
-    ANGULAR_APP_LOADED = (By.CSS_SELECTOR, "app-root:not(:empty)")
+    BASE_URL = os.environ.get("INLAZE_BASE_URL", "https://test-qa.inlaze.com").rstrip("/")
+    ANGULAR_APP_LOADED = locator(By.CSS_SELECTOR, "app-root:not(:empty)")
     AUTH_PATH = "/auth"
     TIMEOUT = 10
+    FILL_MODES = ("script", "keys")
+    FILL_MODE = "script"
+    # Formulario principal de la página, para ``reset_form``
+    FORM_LOCATOR = None
+    NAVIGATION_MODES = ("soft", "full")
+    NAVIGATION_MODE = "soft"
+    READINESS_MODES = ("angular", "dom")
+    READINESS = "angular"
+    # Tiempo que se espera la API de testability con la aplicación ya
+    # renderizada y duración máxima de cada consulta de estabilidad (ms)
+    TESTABILITY_GRACE_MS = 500
+    STABILITY_SLICE_MS = 1000
+    ERROR_SELECTOR = locator(By.CSS_SELECTOR, ".error-message, .alert-error, .form-error, .validation-error")
+    # Contrato de la sesión en el navegador que usa ``set_auth_state``. Los
+    # valores por defecto son los de la simulación local (tests/stub_app); para
+    # otra aplicación se ajustan con variables de entorno (ver README).
+    # Recurso liviano del mismo origen: permite escribir el almacenamiento local
+    # sin arrancar la aplicación Angular
+    AUTH_BOOTSTRAP_PATH = os.environ.get("INLAZE_AUTH_BOOTSTRAP_PATH", "/favicon.ico")
+    AUTH_TOKEN_KEY = os.environ.get("INLAZE_AUTH_TOKEN_KEY", "token")
+    AUTH_USER_KEY = os.environ.get("INLAZE_AUTH_USER_KEY", "user")
+    AUTH_COOKIE_NAME = os.environ.get("INLAZE_AUTH_COOKIE_NAME", "token")
     
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, self.TIMEOUT)
+
+    def _ensure_explicit_waits_only(self):
+        """Verificar que el navegador no tenga una espera implícita configurada
+
+        Raises:
+            RuntimeError: Si el driver tiene una espera implícita mayor que cero
+
+        Note:
+            Las esperas implícitas se suman a las explícitas y convierten cada
+            comprobación de ausencia en una espera completa. La verificación se
+            hace una sola vez por navegador.
+        """
+        if getattr(self.driver, "_explicit_waits_only", False):
+            return
+        implicit_wait = self.driver.timeouts.implicit_wait
+        if implicit_wait:
+            raise RuntimeError(
+                f"El navegador tiene una espera implícita de {implicit_wait}s. "
+                "El framework usa solo esperas explícitas; configura driver.implicitly_wait(0)."
+            )
+        self.driver._explicit_waits_only = True
     
-    def _wait_for_condition(self, condition, timeout=None, message=None):
+    def _wait_for_condition(self, condition, timeout=None, message=None, locator=None):
         """Esperar hasta que se cumpla una condición en la página
 
         Args:
             condition: Condición a esperar (expected_condition)
-            timeout: Tiempo máximo de espera en segundos (por defecto: TIMEOUT)
+            timeout: Tiempo máximo de espera en segundos (por defecto, el
+                timeout adaptativo de la espera o TIMEOUT)
             message: Mensaje personalizado en caso de error
+            locator: Localizador esperado, para la medición de esperas
+                (por defecto se obtiene de la condición)
 
         Returns:
             El elemento o resultado esperado cuando se cumple la condición
 
         Raises:
             TimeoutException: Si la condición no se cumple en el tiempo especificado.
-                             Se incluye captura de pantalla del error.
                              
         Note:
             Si no se especifica un mensaje de error, se usará uno genérico.
-            La captura de pantalla se guarda en el directorio de reportes.
+            No se guarda diagnóstico: el que llama puede esperar el timeout
+            (por ejemplo, un error de credenciales); si la prueba falla, el
+            fixture ``driver`` guarda la captura y/o el paquete de fallo.
+            La duración de cada espera se registra por localizador y condición
+            (``wait_history``); con historial suficiente el timeout por defecto
+            se ajusta a un múltiplo de su p99. Si ese timeout adaptativo se
+            agota se concede una única prórroga acotada; si la espera tampoco
+            se cumple, el tiempo esperado se registra como muestra censurada.
+            Con ``--instrument`` se mide la duración de cada espera por
+            localizador, incluidas las que terminan en timeout.
         """
+        self._ensure_loaded()
+        self._ensure_explicit_waits_only()
+        key = describe_condition(condition, locator)
+        adaptive = timeout is None
+        if adaptive:
+            timeout = wait_history.timeout_for(key, self.TIMEOUT)
+            adaptive = timeout != self.TIMEOUT
+        wait = self.wait if timeout == self.TIMEOUT else WebDriverWait(self.driver, timeout)
+        start = time.perf_counter()
+        limit = timeout
         try:
-            return self.wait.until(condition)
+            try:
+                result = wait.until(condition)
+            except TimeoutException:
+                if not adaptive:
+                    raise
+                # Una única prórroga acotada (una fracción del p99, sin pasar
+                # de TIMEOUT) para las esperas algo más lentas que su historial
+                limit = wait_history.grace_deadline(key, timeout, self.TIMEOUT)
+                wait_history.record_timeout(key, timeout)
+                remaining = max(0, limit - (time.perf_counter() - start))
+                result = WebDriverWait(self.driver, remaining).until(condition)
         except TimeoutException as e:
-            screenshot_path = self.take_screenshot()
+            elapsed = time.perf_counter() - start
+            if instrumentation.active:
+                instrumentation.record('esperas', key, elapsed, timed_out=True)
+            if adaptive:
+                wait_history.record_censored(key, elapsed)
             error_msg = message or "La operación no se completó en el tiempo esperado"
             raise TimeoutException(
                 f"{error_msg}\n" 
-                f"Se ha guardado una captura de pantalla: {screenshot_path}\n"
+                f"Timeout de {limit:.1f}s{f' (adaptativo de {timeout:.1f}s más prórroga)' if adaptive else ''} para {key}\n"
                 f"Por favor, verifica que la página esté cargada correctamente."
             ) from e
+        elapsed = time.perf_counter() - start
+        wait_history.record(key, elapsed)
+        if instrumentation.active:
+            instrumentation.record('esperas', key, elapsed)
+        return result
     
-    def navigate_to(self, path):
+    def navigate_to(self, path, verify=None):
         """Navegar a una ruta específica de la aplicación
 
         Args:
             path: Ruta relativa a navegar
+            verify: Función sin argumentos que verifica la página cargada
+                (por defecto ``_verify_loaded``)
 
         Raises:
             TimeoutException: Si la navegación no se completa correctamente
+
+        Note:
+            Con un driver diferido (``LazyDriver``) la navegación solo se
+            registra y se realiza en la primera interacción con el DOM. Si la
+            prueba termina sin interactuar, la carga de la página se evita.
         """
+        if getattr(self.driver, "lazy", False):
+            if getattr(self.driver, "pending_navigation", None):
+                session_stats.incr(LAZY_STATS_SECTION, 'cargas de página evitadas')
+            self.driver.pending_navigation = (path, verify or self._verify_loaded)
+            return
+        self._load(path, verify or self._verify_loaded)
+
+    def _ensure_loaded(self):
+        """Realizar la navegación pendiente, si la hay, antes de usar el DOM"""
+        pending = getattr(self.driver, "pending_navigation", None)
+        if pending:
+            self.driver.pending_navigation = None
+            path, verify = pending
+            self._load(path, verify)
+
+    def _load(self, path, verify):
+        """Cargar la ruta en el navegador y verificar la página
+
+        Note:
+            En modo ``"soft"`` (por defecto; ``driver.navigation_mode`` o
+            ``NAVIGATION_MODE``) la ruta se abre con el router de la aplicación
+            ya cargada y solo se espera el componente destino. Se hace una
+            carga completa si la aplicación no está cargada, el origen es otro
+            o la ruta es la actual: el router no vuelve a crear el componente
+            de la ruta activa.
+        """
+        mode = getattr(self.driver, "navigation_mode", None) or self.NAVIGATION_MODE
+        if mode not in self.NAVIGATION_MODES:
+            raise ValueError(
+                f"Modo de navegación no soportado: {mode}. Opciones: {', '.join(self.NAVIGATION_MODES)}"
+            )
+        if mode == "soft" and self._soft_load(path, verify):
+            return
+
+        start = time.perf_counter()
         self.driver.get(f"{self.BASE_URL}{path}")
+        session_stats.incr(LAZY_STATS_SECTION, 'cargas de página realizadas')
         
-        # Esperar a que la aplicación Angular cargue
-        self._wait_for_condition(
-            EC.presence_of_element_located(self.ANGULAR_APP_LOADED),
-            message="La aplicación Angular no cargó correctamente"
-        )
+        # Esperar a que la aplicación Angular cargue: estable según su API de
+        # testability o, si no la expone, con el componente raíz renderizado
+        if not self.wait_for_angular(message="La aplicación Angular no cargó correctamente"):
+            self._wait_for_condition(
+                EC.presence_of_element_located(self.ANGULAR_APP_LOADED),
+                message="La aplicación Angular no cargó correctamente"
+            )
         
         # Verificar que estamos en la ruta correcta
         self._wait_for_condition(
             EC.url_contains(path),
             message=f"Error al navegar a la página {path}"
         )
+        verify()
+        instrumentation.record('navegaciones', path, time.perf_counter() - start)
+
+    def _soft_load(self, path, verify):
+        """Navegar dentro de la aplicación sin recargar la página
+
+        Returns:
+            bool: True si se navegó con el router; False si hace falta una
+                  carga completa
+        """
+        if not getattr(self.driver, "materialized", True):
+            # Navegador recién obtenido: todavía no hay aplicación cargada
+            return False
+        start = time.perf_counter()
+        base = urlsplit(self.BASE_URL)
+        fallback = self.driver.execute_script(
+            SOFT_NAVIGATE_SCRIPT, f"{base.scheme}://{base.netloc}", f"{base.path}{path}", self.ANGULAR_APP_LOADED[1]
+        )
+        if fallback:
+            session_stats.incr(LAZY_STATS_SECTION, f"navegaciones completas ({fallback})")
+            return False
+        session_stats.incr(LAZY_STATS_SECTION, 'navegaciones dentro de la aplicación')
+
+        self.wait_for_angular(message=f"La aplicación no se estabilizó al navegar a {path}")
+        self._wait_for_condition(
+            EC.url_contains(path),
+            message=f"Error al navegar a la página {path}"
+        )
+        verify()
+        instrumentation.record('navegaciones', f"{path} (en la aplicación)", time.perf_counter() - start)
+        return True
+
+    def wait_for_angular(self, timeout=None, message=None):
+        """Esperar a que Angular esté estable, sin tareas ni peticiones pendientes
+
+        Args:
+            timeout: Tiempo máximo de espera en segundos (por defecto, el
+                timeout adaptativo de la espera o TIMEOUT)
+            message: Mensaje personalizado en caso de error
+
+        Returns:
+            bool: True si se esperó con la API de testability de Angular;
+                  False si está desactivado o la aplicación no la expone y
+                  hay que esperar por el DOM
+
+        Raises:
+            TimeoutException: Si la aplicación no se estabiliza a tiempo
+
+        Note:
+            - Con ``readiness`` ``"dom"`` (``driver.readiness`` o ``READINESS``)
+              no se consulta Angular
+            - Las compilaciones sin la API (``getAllAngularTestabilities``) se
+              detectan una vez por navegador y desde entonces se omite la consulta
+            - Pensado para la estrategia de carga ``eager``: ``get`` vuelve con
+              el documento listo y esta espera cubre el arranque de Angular
+        """
+        readiness = getattr(self.driver, "readiness", None) or self.READINESS
+        if readiness not in self.READINESS_MODES:
+            raise ValueError(
+                f"Modo de espera no soportado: {readiness}. Opciones: {', '.join(self.READINESS_MODES)}"
+            )
+        if readiness == "dom" or getattr(self.driver, "angular_testability", None) is False:
+            return False
+
+        def _stable(driver):
+            state = driver.execute_async_script(
+                WAIT_FOR_ANGULAR_SCRIPT, self.ANGULAR_APP_LOADED[1], self.TESTABILITY_GRACE_MS, self.STABILITY_SLICE_MS
+            )
+            return state != "ocupada" and state
+
+        state = self._wait_for_condition(
+            _stable,
+            timeout=timeout,
+            message=message or "La aplicación Angular no se estabilizó",
+            locator="Angular estable"
+        )
+        if state == "sin testability":
+            self.driver.angular_testability = False
+            session_stats.incr(LAZY_STATS_SECTION, 'aplicaciones sin API de testability (espera por DOM)')
+            return False
+        return True
+
+    def _verify_loaded(self):
+        """Verificar que la página cargó correctamente después de navegar
+
+        Note:
+            Los page objects lo sobrescriben para esperar sus propios componentes.
+        """
+
+    def set_auth_state(self, token, user=None):
+        """Iniciar la sesión en el navegador sin pasar por el formulario
+
+        Args:
+            token: Token de sesión obtenido de la API
+            user: Datos del usuario que guarda la aplicación (opcional)
+
+        Note:
+            - Carga ``AUTH_BOOTSTRAP_PATH`` para quedar en el origen de la
+              aplicación y escribe el token en el almacenamiento local y en
+              una cookie; la siguiente navegación ya tiene la sesión iniciada
+            - Una navegación pendiente se descarta: la sesión recién inyectada
+              debe verse desde la siguiente carga
+        """
+        if getattr(self.driver, "pending_navigation", None):
+            session_stats.incr(LAZY_STATS_SECTION, 'cargas de página evitadas')
+            self.driver.pending_navigation = None
+        self.driver.get(f"{self.BASE_URL}{self.AUTH_BOOTSTRAP_PATH}")
+        self.driver.execute_script(
+            SET_AUTH_STATE_SCRIPT,
+            self.AUTH_TOKEN_KEY,
+            token,
+            self.AUTH_USER_KEY,
+            json.dumps(user) if user is not None else None
+        )
+        self.driver.add_cookie({'name': self.AUTH_COOKIE_NAME, 'value': token, 'path': '/'})
 
     def find_element(self, by, value):
         """Encontrar un elemento en la página
@@ -84,12 +535,116 @@ class BasePage:
 
         Raises:
             TimeoutException: Si el elemento no se encuentra
+            InvalidLocatorError: Si el localizador no es válido
+
+        Note:
+            El localizador se valida y compila con el registro de localizadores
+            (los selectores con ``:contains()`` se traducen a XPath).
         """
+        by, value = compile_locator(by, value)
         return self._wait_for_condition(
             EC.presence_of_element_located((by, value)),
             message=f"No se encontró el elemento: {value}"
         )
 
+    def find_present_elements(self, by, value):
+        """Consultar los elementos presentes sin esperar
+
+        Args:
+            by: Método de localización (By.ID, By.XPATH, etc.)
+            value: Valor del localizador
+
+        Returns:
+            list: Elementos encontrados (lista vacía si no hay ninguno)
+
+        Note:
+            Es una única consulta al DOM, pensada para comprobar la ausencia
+            esperada de un elemento (por ejemplo, que no haya errores) una vez
+            que la aplicación terminó de responder. No usar para esperar a que
+            un elemento aparezca.
+        """
+        self._ensure_loaded()
+        self._ensure_explicit_waits_only()
+        return self.driver.find_elements(*compile_locator(by, value))
+
+    def get_present_texts(self, by, value):
+        """Obtener el texto de los elementos presentes sin esperar
+
+        Returns:
+            list: Textos no vacíos de los elementos encontrados
+        """
+        texts = (element.text.strip() for element in self.find_present_elements(by, value))
+        return [text for text in texts if text]
+
+    def read_state(self, fields):
+        """Leer el estado de varios elementos en una sola llamada al navegador
+
+        Args:
+            fields: Diccionario ``nombre -> (localizador, atributos)``. Los
+                    atributos pueden ser propiedades o atributos HTML (``value``,
+                    ``class``, ``type``...) o los valores especiales:
+                    - ``text``: texto visible del primer elemento
+                    - ``texts``: textos no vacíos de todos los elementos
+                    - ``displayed`` / ``enabled``: estado del primer elemento
+
+        Returns:
+            dict: ``nombre -> {present, count, <atributo>: valor}``. Si el
+                  elemento no existe los atributos valen None (``texts`` es
+                  una lista vacía)
+
+        Note:
+            Todo se resuelve con un único ``execute_script`` en lugar de una
+            petición a chromedriver por elemento y atributo. No espera: debe
+            usarse cuando la página ya está cargada.
+
+        Example:
+            estado = page.read_state({
+                'email': (LoginPage.EMAIL_INPUT, ['value', 'class']),
+                'errores': (LoginPage.ERROR_MESSAGE, ['texts']),
+            })
+        """
+        self._ensure_loaded()
+        specs = []
+        for name, (field_locator, attributes) in fields.items():
+            by, value = compile_locator(*field_locator)
+            specs.append({'name': name, 'by': by, 'value': value, 'attributes': list(attributes)})
+        return self.driver.execute_script(READ_STATE_SCRIPT, specs)
+
+    def is_element_absent(self, by, value):
+        """Comprobar que un elemento no está presente, sin esperar"""
+        return not self.find_present_elements(by, value)
+
+    def wait_for_any(self, *locators, timeout=None, message=None):
+        """Esperar a que aparezca cualquiera de los elementos indicados
+
+        Args:
+            locators: Tuplas (By, valor) de los posibles resultados
+            timeout: Tiempo máximo de espera en segundos
+            message: Mensaje personalizado en caso de error
+
+        Returns:
+            tuple: El primer localizador que se encontró en la página, tal como
+                   se indicó en la llamada
+
+        Raises:
+            TimeoutException: Si ninguno de los elementos aparece
+        """
+        label = " | ".join(getattr(candidate, 'name', None) or str(candidate[1]) for candidate in locators)
+        compiled = [(candidate, compile_locator(*candidate)) for candidate in locators]
+
+        def _first_present(driver):
+            for candidate, (by, value) in compiled:
+                if driver.find_elements(by, value):
+                    return candidate
+            return False
+
+        return self._wait_for_condition(
+            _first_present,
+            timeout=timeout,
+            message=message or "No apareció ninguno de los elementos esperados",
+            locator=label
+        )
+
     def find_clickable_element(self, by, value):
         """Encontrar un elemento clickeable en la página
 
@@ -103,17 +658,20 @@ class BasePage:
         Raises:
             TimeoutException: Si el elemento no se encuentra o no es clickeable
         """
+        by, value = compile_locator(by, value)
         return self._wait_for_condition(
             EC.element_to_be_clickable((by, value)),
             message=f"El elemento no está disponible para hacer clic: {value}"
         )
 
-    def click_element(self, by, value):
+    def click_element(self, by, value, wait_stable=False):
         """Hacer clic en un elemento de la página
 
         Args:
             by: Método de localización (By.ID, By.XPATH, etc.)
             value: Valor del localizador
+            wait_stable: Esperar a que Angular termine lo que dispara el clic
+                (peticiones HTTP, navegación, renderizado)
 
         Raises:
             TimeoutException: Si el elemento no se encuentra o no es clickeable
@@ -125,10 +683,9 @@ class BasePage:
         except ElementClickInterceptedException:
             # Intentar clic mediante JavaScript si el clic normal falla
             self.driver.execute_script("arguments[0].click();", element)
-            self._wait_for_condition(
-                lambda _: True,  # Esperar un momento para asegurar que el clic se procesó
-                message=f"No se pudo hacer clic en el elemento: {value}"
-            )
+            wait_stable = True
+        if wait_stable:
+            self.wait_for_angular(message=f"La aplicación no se estabilizó después de hacer clic en: {value}")
 
     def type_text(self, by, value, text):
         """Escribir texto en un campo de entrada
@@ -154,20 +711,129 @@ class BasePage:
             self.driver.execute_script("arguments[0].value = '';", element)
             
             # Escribir el texto usando JavaScript para campos de contraseña
+            # (el texto se pasa como argumento, sin interpolarlo en el script)
             if element.get_attribute("type") == "password":
-                self.driver.execute_script(f"arguments[0].value = '{text}';", element)
+                actual_value = self.driver.execute_script(SET_ELEMENT_VALUE_SCRIPT, element, text)
             else:
                 element.send_keys(text)
+                actual_value = element.get_attribute("value")
                 
             # Verificar que el texto se escribió correctamente
-            actual_value = element.get_attribute("value")
             if actual_value != text:
                 raise Exception(f"El texto no se escribió correctamente. Esperado: {text}, Obtenido: {actual_value}")
                 
         except Exception as e:
-            self.take_screenshot("error_type_text")
             raise Exception(f"No se pudo escribir en el campo {value}: {str(e)}")
 
+    def fill_form(self, fields, mode=None):
+        """Completar varios campos de un formulario
+
+        Args:
+            fields: Lista de tuplas ``(localizador, texto)`` en el orden de llenado
+            mode: Modo de llenado:
+                - ``"script"``: todos los campos en una sola llamada al navegador
+                - ``"keys"``: campo por campo con ``type_text`` (pulsaciones reales)
+                Por defecto se usa ``driver.fill_mode`` (marcador ``fill_mode``
+                de la prueba) o ``FILL_MODE``
+
+        Returns:
+            list: Valores leídos de cada campo después de llenarlo
+
+        Raises:
+            TimeoutException: Si el formulario no se encuentra
+            Exception: Si algún campo no existe o su valor no coincide
+
+        Note:
+            En modo ``"script"`` los textos viajan como argumentos del script,
+            por lo que comillas y caracteres especiales no requieren escape. Se
+            emiten los eventos ``input``/``change``/``blur`` para que Angular
+            actualice el estado del formulario, y los valores se verifican en
+            la misma llamada.
+        """
+        mode = mode or getattr(self.driver, "fill_mode", None) or self.FILL_MODE
+        if mode not in self.FILL_MODES:
+            raise ValueError(f"Modo de llenado no soportado: {mode}. Opciones: {', '.join(self.FILL_MODES)}")
+
+        if mode == "keys":
+            for field_locator, text in fields:
+                self.type_text(*field_locator, text)
+            return [text for _, text in fields]
+
+        # Esperar a que el formulario esté presente antes de llenarlo
+        self.find_element(*fields[0][0])
+        specs = []
+        for field_locator, text in fields:
+            by, value = compile_locator(*field_locator)
+            specs.append({'by': by, 'value': value, 'text': text})
+        result = self.driver.execute_script(FILL_FORM_SCRIPT, specs)
+
+        problems = [f"{specs[i]['value']}: no se encontró el campo" for i in result['missing']]
+        problems += [
+            f"{spec['value']}: esperado {spec['text']!r}, obtenido {actual!r}"
+            for i, (spec, actual) in enumerate(zip(specs, result['values']))
+            if i not in result['missing'] and actual != spec['text']
+        ]
+        if problems:
+            raise Exception("No se pudo completar el formulario:\n- " + "\n- ".join(problems))
+        return result['values']
+
+    def reset_form(self):
+        """Devolver el formulario de la página a su estado inicial sin recargarla
+
+        Deja los campos vacíos, sin modificar (``ng-pristine``), sin tocar
+        (``ng-untouched``) y sin mensajes ``mat-error``, y verifica el
+        resultado en la misma llamada al navegador.
+
+        Returns:
+            str: Mecanismo usado (``FormGroupDirective.resetForm``,
+                 ``FormGroup.reset``, ``form.reset`` o ``recarga``)
+
+        Raises:
+            ValueError: Si la página no define ``FORM_LOCATOR``
+            TimeoutException: Si el formulario no se encuentra
+            Exception: Si el formulario no quedó en su estado inicial
+
+        Note:
+            Usa la API de depuración de Angular (``ng.getComponent``) si existe
+            (compilaciones de desarrollo); si no, eventos del DOM y
+            ``form.reset()``, que Angular atiende también en producción. Solo
+            si el reinicio por el DOM no deja el formulario en su estado
+            inicial se vuelve a cargar la página con ``navigate``. Pensado para
+            pruebas que recorren varios casos sobre la misma página.
+        """
+        if self.FORM_LOCATOR is None:
+            raise ValueError(f"{type(self).__name__} no define FORM_LOCATOR")
+        session_stats.register_section(RESET_STATS_SECTION, "Reinicio de formularios")
+        by, value = compile_locator(*self.FORM_LOCATOR)
+        self.find_element(by, value)
+        state = self.driver.execute_script(RESET_FORM_SCRIPT, by, value, True)
+        method = state['method']
+        problems = self._reset_problems(state)
+        if problems and method == 'form.reset':
+            session_stats.incr(RESET_STATS_SECTION, 'reinicios por el DOM incompletos (recarga)')
+            self.navigate()
+            self._ensure_loaded()
+            state = self.driver.execute_script(RESET_FORM_SCRIPT, by, value, False)
+            method = "recarga"
+            problems = self._reset_problems(state)
+        if problems:
+            raise Exception("No se pudo reiniciar el formulario:\n- " + "\n- ".join(problems))
+        session_stats.incr(RESET_STATS_SECTION, f"formularios reiniciados ({method})")
+        return method
+
+    def _reset_problems(self, state):
+        """Diferencias entre el estado leído del formulario y su estado inicial"""
+        problems = []
+        for field in state['fields']:
+            classes = field['classes'].split()
+            if field['value']:
+                problems.append(f"{field['name']}: conserva el valor {field['value']!r}")
+            if 'ng-dirty' in classes or 'ng-touched' in classes:
+                problems.append(f"{field['name']}: sigue marcado como modificado o tocado ({field['classes']})")
+        if state['errors']:
+            problems.append(f"quedan {state['errors']} mensajes de error visibles")
+        return problems
+
     def get_element_text(self, by, value):
         return self.find_element(by, value).text.strip()
 
@@ -185,57 +851,50 @@ class BasePage:
             - Formatea múltiples errores de forma legible
             - Traduce mensajes comunes al español
             - Prioriza mensajes específicos sobre genéricos
+            - No espera: consulta el DOM una sola vez, por lo que debe llamarse
+              cuando la aplicación ya respondió
         """
-        try:
-            error_elements = self._wait_for_condition(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".error-message, .alert-error, .form-error, .validation-error")),
-                message="No se encontraron mensajes de error en la página"
-            )
-            
-            # Filtrar y formatear errores
-            errors = [elem.text.strip() for elem in error_elements if elem.text.strip()]
-            if not errors:
-                return None
-                
-            # Si hay múltiples errores, combinarlos de forma legible
-            if len(errors) > 1:
-                return "Se encontraron los siguientes errores:\n- " + "\n- ".join(errors)
-            
-            error_msg = errors[0].lower()
-            
-            # Mapeo de mensajes de error comunes
-            error_mapping = {
-                "required": "Por favor, completa todos los campos obligatorios",
-                "email is required": "Por favor, ingresa tu correo electrónico",
-                "password is required": "Por favor, ingresa tu contraseña",
-                "invalid email": "El formato del correo electrónico no es válido",
-                "invalid credentials": "Las credenciales ingresadas no son válidas",
-                "passwords do not match": "Las contraseñas ingresadas no coinciden",
-                "name is required": "Ingresa tu nombre y apellido",
-                "email already registered": "Este correo electrónico ya está registrado en el sistema"
-            }
-            
-            # Mensajes de validación de contraseña
-            if "password" in error_msg:
-                if "8 characters" in error_msg:
-                    return "La contraseña debe tener al menos 8 caracteres"
-                if "uppercase" in error_msg:
-                    return "La contraseña debe contener al menos una mayúscula"
-                if "lowercase" in error_msg:
-                    return "La contraseña debe contener al menos una minúscula"
-                if "number" in error_msg:
-                    return "La contraseña debe contener al menos un número"
-                if "special" in error_msg:
-                    return "La contraseña debe contener al menos un carácter especial (!@#$%^&*(),.?\":{|}|<>)"
-            
-            # Buscar coincidencias en el mapeo de errores
-            for key, value in error_mapping.items():
-                if key in error_msg:
-                    return value
-            
-            return errors[0]
-        except TimeoutException:
+        errors = self.read_state({'errores': (self.ERROR_SELECTOR, ['texts'])})['errores']['texts']
+        if not errors:
             return None
+            
+        # Si hay múltiples errores, combinarlos de forma legible
+        if len(errors) > 1:
+            return "Se encontraron los siguientes errores:\n- " + "\n- ".join(errors)
+        
+        error_msg = errors[0].lower()
+        
+        # Mapeo de mensajes de error comunes
+        error_mapping = {
+            "required": "Por favor, completa todos los campos obligatorios",
+            "email is required": "Por favor, ingresa tu correo electrónico",
+            "password is required": "Por favor, ingresa tu contraseña",
+            "invalid email": "El formato del correo electrónico no es válido",
+            "invalid credentials": "Las credenciales ingresadas no son válidas",
+            "passwords do not match": "Las contraseñas ingresadas no coinciden",
+            "name is required": "Ingresa tu nombre y apellido",
+            "email already registered": "Este correo electrónico ya está registrado en el sistema"
+        }
+        
+        # Mensajes de validación de contraseña
+        if "password" in error_msg:
+            if "8 characters" in error_msg:
+                return "La contraseña debe tener al menos 8 caracteres"
+            if "uppercase" in error_msg:
+                return "La contraseña debe contener al menos una mayúscula"
+            if "lowercase" in error_msg:
+                return "La contraseña debe contener al menos una minúscula"
+            if "number" in error_msg:
+                return "La contraseña debe contener al menos un número"
+            if "special" in error_msg:
+                return "La contraseña debe contener al menos un carácter especial (!@#$%^&*(),.?\":{|}|<>)"
+        
+        # Buscar coincidencias en el mapeo de errores
+        for key, value in error_mapping.items():
+            if key in error_msg:
+                return value
+        
+        return errors[0]
 
     def wait_for_url_contains(self, text):
         try:
@@ -247,11 +906,39 @@ class BasePage:
             return False
 
     def wait_for_element_visible(self, by, value):
+        by, value = compile_locator(by, value)
         return self._wait_for_condition(
             EC.visibility_of_element_located((by, value)),
             message=f"Elemento no visible: {value}"
         )
 
+    def capture_failure(self, nombre_base=None, reason=None):
+        """Guardar los artefactos de diagnóstico de un fallo
+
+        Args:
+            nombre_base: Nombre base para los archivos (opcional)
+            reason: Descripción del fallo que se guarda en el paquete
+
+        Returns:
+            str: Rutas de los artefactos guardados, separadas por comas, o None
+                 si la prueba aún no usó el navegador
+
+        Note:
+            Según ``--failure-artifacts`` se toma una captura de pantalla, un
+            paquete de diagnóstico (DOM, consola y red; ver ``failure_bundles``)
+            o ambos. La llama el fixture ``driver`` cuando la prueba falla; los
+            page objects no la usan, ya que sus errores pueden ser esperados
+            por el que llama y consumirían el límite de capturas por prueba.
+        """
+        if getattr(self.driver, "lazy", False) and not self.driver.materialized:
+            return None
+        paths = []
+        if failure_bundles.screenshots:
+            paths.append(self.take_screenshot(nombre_base))
+        if failure_bundles.enabled:
+            paths.append(failure_bundles.collect(self.driver, nombre_base, reason))
+        return ', '.join(paths)
+
     def take_screenshot(self, nombre_base=None):
         """Tomar una captura de pantalla
 
@@ -259,16 +946,19 @@ class BasePage:
             nombre_base: Nombre base para el archivo (opcional)
 
         Returns:
-            str: Ruta relativa donde se guardó la captura
+            str: Ruta relativa donde se guardará la captura
 
         Note:
             - Las capturas se guardan en reports/screenshots
-            - El nombre del archivo incluye timestamp para evitar duplicados
+            - El nombre del archivo incluye timestamp en milisegundos y un
+              consecutivo para evitar colisiones
             - Si no se especifica nombre_base, se usa el nombre del test actual
+            - La escritura en disco se realiza en segundo plano
+              (``screenshot_service``); las capturas repetidas o que superan
+              el límite por prueba devuelven la ruta de la primera
+            - Si la prueba aún no usó el navegador (driver diferido) no se
+              captura nada y se devuelve None
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        nombre_base = nombre_base or self.driver.test_name or 'test'
-        nombre_archivo = f"error_{nombre_base}_{timestamp}.png"
-        ruta_screenshot = os.path.join('reports', 'screenshots', nombre_archivo)
-        self.driver.save_screenshot(ruta_screenshot)
-        return ruta_screenshot
+        if getattr(self.driver, "lazy", False) and not self.driver.materialized:
+            return None
+        return screenshot_service.capture(self.driver, nombre_base)
@@ -0,0 +1,329 @@
+import re
+from functools import lru_cache
+from selenium.webdriver.common.by import By
+
+
+class InvalidLocatorError(ValueError):
+    """Localizador con sintaxis inválida o que el navegador no soporta"""
+
+
+# Pseudo-clases CSS estándar que el navegador acepta tal cual
+CSS_PSEUDO_CLASSES = {
+    'not', 'is', 'where', 'has', 'nth-child', 'nth-last-child', 'nth-of-type',
+    'nth-last-of-type', 'first-child', 'last-child', 'only-child', 'first-of-type',
+    'last-of-type', 'only-of-type', 'empty', 'root', 'checked', 'disabled',
+    'enabled', 'focus', 'hover', 'active', 'visited', 'link', 'required',
+    'optional', 'invalid', 'valid', 'read-only', 'read-write', 'placeholder-shown',
+}
+
+# Pseudo-clases de coincidencia por texto (jQuery) que se traducen a XPath
+TEXT_PSEUDO_CLASSES = {'contains'}
+
+_TOKEN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<combinator>[>+~])
+  | (?P<comma>,)
+  | (?P<universal>\*)
+  | (?P<type>-?[A-Za-z_][\w-]*)
+  | (?P<id>\#-?[A-Za-z_][\w-]*)
+  | (?P<class>\.-?[A-Za-z_][\w-]*)
+  | (?P<attribute>\[\s*(?P<attr_name>[A-Za-z_][\w-]*)\s*
+        (?:(?P<attr_op>[~|^$*]?=)\s*(?P<attr_value>'[^']*'|"[^"]*"|[\w-]+)\s*)?\])
+  | (?P<pseudo>::?(?P<pseudo_name>[A-Za-z-]+)(?P<pseudo_args>\()?)
+""", re.VERBOSE)
+
+
+class Locator(tuple):
+    """Localizador compilado ``(By, valor)``
+
+    Se comporta como la tupla que esperan Selenium y los page objects
+    (``find_element(*LOCATOR)``) y conserva el selector original para mensajes
+    de error. Al declararse como atributo de un page object se registra en
+    ``registry`` con el nombre ``Clase.ATRIBUTO``.
+    """
+
+    def __new__(cls, by, value):
+        compiled_by, compiled_value = compile_locator(by, value)
+        instance = super().__new__(cls, (compiled_by, compiled_value))
+        instance.source = (by, value)
+        instance.name = None
+        return instance
+
+    def __set_name__(self, owner, name):
+        # Un alias (``FORM_LOCATOR = LOGIN_FORM``) conserva el nombre original
+        if self.name is None:
+            self.name = f"{owner.__name__}.{name}"
+            registry.register(self)
+
+    def __repr__(self):
+        return f"Locator({self.name or '?'}: {self[0]}={self[1]!r})"
+
+
+class LocatorRegistry:
+    """Registro central de los localizadores declarados por los page objects"""
+
+    def __init__(self):
+        self._locators = {}
+
+    def register(self, locator):
+        self._locators[locator.name] = locator
+
+    def get(self, name):
+        return self._locators[name]
+
+    def __iter__(self):
+        return iter(self._locators.values())
+
+    def __len__(self):
+        return len(self._locators)
+
+
+registry = LocatorRegistry()
+
+
+def locator(by, value):
+    """Declarar un localizador validado y compilado al importar el módulo
+
+    Args:
+        by: Método de localización (By.CSS_SELECTOR, By.XPATH, etc.)
+        value: Valor del localizador
+
+    Returns:
+        Locator: Localizador compilado
+
+    Raises:
+        InvalidLocatorError: Si el selector no es válido
+    """
+    return Locator(by, value)
+
+
+@lru_cache(maxsize=512)
+def compile_locator(by, value):
+    """Validar un localizador y traducirlo a una forma que el navegador acepte
+
+    Args:
+        by: Método de localización
+        value: Valor del localizador
+
+    Returns:
+        tuple: ``(By, valor)`` listo para usar con Selenium
+
+    Raises:
+        InvalidLocatorError: Si el selector no es válido
+
+    Note:
+        - Los selectores CSS con ``:contains()`` (no estándar) se traducen a
+          un XPath equivalente
+        - Los demás selectores CSS se validan y se devuelven sin cambios
+        - Los XPath se validan de forma básica (comillas y agrupadores)
+    """
+    if not isinstance(value, str) or not value.strip():
+        raise InvalidLocatorError(f"Localizador vacío o inválido: {value!r}")
+
+    if by == By.CSS_SELECTOR:
+        groups = _parse_css(value)
+        if any(_uses_text_match(group) for group in groups):
+            return By.XPATH, ' | '.join(_group_to_xpath(group, value) for group in groups)
+        return by, value
+
+    if by == By.XPATH:
+        _check_balanced(value)
+    return by, value
+
+
+def _parse_css(selector):
+    """Dividir un selector CSS en grupos de pasos (combinador, compuesto)"""
+    groups = []
+    steps = []
+    compound = []
+    combinator = ' '
+    position = 0
+
+    def close_compound():
+        nonlocal compound, combinator
+        if compound:
+            steps.append((combinator, compound))
+            compound = []
+            combinator = None
+
+    while position < len(selector):
+        match = _TOKEN.match(selector, position)
+        if not match:
+            raise InvalidLocatorError(
+                f"Selector CSS inválido {selector!r}: carácter inesperado en la posición {position}"
+            )
+        kind = match.lastgroup
+        position = match.end()
+
+        if kind == 'ws':
+            if compound:
+                close_compound()
+                combinator = ' '
+            continue
+        if kind == 'combinator':
+            close_compound()
+            if combinator not in (' ', None) or not steps:
+                raise InvalidLocatorError(f"Selector CSS inválido {selector!r}: combinador sin selector")
+            combinator = match.group('combinator')
+            continue
+        if kind == 'comma':
+            close_compound()
+            if not steps or combinator not in (None, ' '):
+                raise InvalidLocatorError(f"Selector CSS inválido {selector!r}: grupo vacío")
+            groups.append(steps)
+            steps = []
+            combinator = ' '
+            continue
+        if kind == 'pseudo':
+            name = match.group('pseudo_name').lower()
+            argument = None
+            if match.group('pseudo_args'):
+                argument, position = _read_arguments(selector, position)
+            if name not in CSS_PSEUDO_CLASSES | TEXT_PSEUDO_CLASSES:
+                raise InvalidLocatorError(f"Selector CSS inválido {selector!r}: pseudo-clase no soportada ':{name}'")
+            if name in TEXT_PSEUDO_CLASSES and argument is None:
+                raise InvalidLocatorError(f"Selector CSS inválido {selector!r}: ':{name}' requiere un texto")
+            compound.append(('pseudo', name, argument))
+            continue
+        if kind == 'attribute':
+            compound.append(('attribute', match.group('attr_name'), match.group('attr_op'),
+                             _unquote(match.group('attr_value'))))
+            continue
+        if kind in ('type', 'universal') and compound:
+            raise InvalidLocatorError(f"Selector CSS inválido {selector!r}: el tipo debe ir al inicio")
+        compound.append((kind, match.group(kind).lstrip('#.')))
+
+    close_compound()
+    if not steps or combinator not in (None, ' '):
+        raise InvalidLocatorError(f"Selector CSS inválido {selector!r}: selector incompleto")
+    groups.append(steps)
+    return groups
+
+
+def _read_arguments(selector, position):
+    depth = 1
+    quote = None
+    start = position
+    while position < len(selector):
+        char = selector[position]
+        if quote:
+            quote = None if char == quote else quote
+        elif char in '\'"':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return selector[start:position].strip(), position + 1
+        position += 1
+    raise InvalidLocatorError(f"Selector CSS inválido {selector!r}: paréntesis sin cerrar")
+
+
+def _unquote(value):
+    if value and value[0] in '\'"' and value[-1] == value[0]:
+        return value[1:-1]
+    return value
+
+
+def _uses_text_match(steps):
+    return any(
+        part[0] == 'pseudo' and part[1] in TEXT_PSEUDO_CLASSES
+        for _, compound in steps for part in compound
+    )
+
+
+def _xpath_literal(text):
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def _group_to_xpath(steps, selector):
+    xpath = ''
+    for combinator, compound in steps:
+        tag = '*'
+        predicates = []
+        for part in compound:
+            kind = part[0]
+            if kind == 'type':
+                tag = part[1]
+            elif kind == 'id':
+                predicates.append(f"@id={_xpath_literal(part[1])}")
+            elif kind == 'class':
+                predicates.append(
+                    f"contains(concat(' ', normalize-space(@class), ' '), {_xpath_literal(' ' + part[1] + ' ')})"
+                )
+            elif kind == 'attribute':
+                predicates.append(_attribute_predicate(*part[1:]))
+            elif kind == 'pseudo':
+                predicates.append(_pseudo_predicate(part[1], part[2], tag, selector))
+
+        if combinator == ' ':
+            axis = '//'
+        elif combinator == '>':
+            axis = '/'
+        elif combinator == '+':
+            axis = '/following-sibling::*[1]/self::'
+        else:
+            axis = '/following-sibling::'
+        xpath += axis + tag + ''.join(f"[{predicate}]" for predicate in predicates)
+    return xpath
+
+
+def _attribute_predicate(name, operator, value):
+    attribute = f"@{name}"
+    if operator is None:
+        return attribute
+    literal = _xpath_literal(value)
+    if operator == '=':
+        return f"{attribute}={literal}"
+    if operator == '*=':
+        return f"contains({attribute}, {literal})"
+    if operator == '^=':
+        return f"starts-with({attribute}, {literal})"
+    if operator == '$=':
+        return f"substring({attribute}, string-length({attribute}) - string-length({literal}) + 1)={literal}"
+    if operator == '~=':
+        return f"contains(concat(' ', normalize-space({attribute}), ' '), {_xpath_literal(' ' + value + ' ')})"
+    return f"({attribute}={literal} or starts-with({attribute}, {_xpath_literal(value + '-')}))"
+
+
+def _pseudo_predicate(name, argument, tag, selector):
+    if name == 'contains':
+        return f"contains(., {_xpath_literal(_unquote(argument))})"
+    if name == 'first-child':
+        return "not(preceding-sibling::*)"
+    if name == 'last-child':
+        return "not(following-sibling::*)"
+    if name == 'empty':
+        return "not(node())"
+    if name == 'nth-child' and argument and argument.isdigit():
+        return f"count(preceding-sibling::*)={int(argument) - 1}"
+    if name in ('first-of-type', 'last-of-type') and tag != '*':
+        axis = 'preceding' if name == 'first-of-type' else 'following'
+        return f"not({axis}-sibling::{tag})"
+    raise InvalidLocatorError(
+        f"Selector CSS {selector!r}: ':{name}' no se puede combinar con ':contains()' (traducción a XPath no soportada)"
+    )
+
+
+def _check_balanced(xpath):
+    quote = None
+    stack = []
+    pairs = {')': '(', ']': '['}
+    for char in xpath:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in '\'"':
+            quote = char
+        elif char in '([':
+            stack.append(char)
+        elif char in pairs:
+            if not stack or stack.pop() != pairs[char]:
+                raise InvalidLocatorError(f"XPath inválido {xpath!r}: '{char}' sin abrir")
+    if quote or stack:
+        raise InvalidLocatorError(f"XPath inválido {xpath!r}: comillas o agrupadores sin cerrar")
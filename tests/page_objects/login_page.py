@@ -1,30 +1,43 @@
+import os
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from .base_page import BasePage
+from .locators import locator
+from ..utils.validation_rules import LOGIN_EMAIL, LOGIN_PASSWORD
 
 class LoginPage(BasePage):
-    LOGIN_FORM = (By.CSS_SELECTOR, "app-sign-in-form form")
-    EMAIL_INPUT = (By.CSS_SELECTOR, "app-sign-in-form input[type='email']")
-    PASSWORD_INPUT = (By.CSS_SELECTOR, "app-sign-in-form app-password input[type='password']")
-    LOGIN_BUTTON = (By.CSS_SELECTOR, "app-sign-in-form button[type='submit']")
-    SHOW_PASSWORD_BUTTON = (By.CSS_SELECTOR, "app-sign-in-form app-password button")
-    REGISTER_LINK = (By.CSS_SELECTOR, "a[href*='/sign-up'], a[href*='/registro']")
-    ERROR_MESSAGE = (By.CSS_SELECTOR, ".error-message, .alert-error, mat-error")
-    USER_NAME_DISPLAY = (By.CSS_SELECTOR, ".user-name")
-    LOGOUT_BUTTON = (By.CSS_SELECTOR, ".logout-btn")
-    PASSWORD_ERROR = (By.CSS_SELECTOR, ".error-message:contains('contraseña'), mat-error:contains('contraseña')")
-    EMAIL_ERROR = (By.CSS_SELECTOR, ".error-message:contains('correo'), mat-error:contains('correo')")
-    INVALID_CREDENTIALS_ERROR = (By.CSS_SELECTOR, ".error-message:contains('credenciales'), .alert-error:contains('credenciales')")
+    LOGIN_FORM = locator(By.CSS_SELECTOR, "app-sign-in-form form")
+    FORM_LOCATOR = LOGIN_FORM
+    EMAIL_INPUT = locator(By.CSS_SELECTOR, "app-sign-in-form input[type='email']")
+    PASSWORD_INPUT = locator(By.CSS_SELECTOR, "app-sign-in-form app-password input[type='password']")
+    LOGIN_BUTTON = locator(By.CSS_SELECTOR, "app-sign-in-form button[type='submit']")
+    SHOW_PASSWORD_BUTTON = locator(By.CSS_SELECTOR, "app-sign-in-form app-password button")
+    REGISTER_LINK = locator(By.CSS_SELECTOR, "a[href*='/sign-up'], a[href*='/registro']")
+    ERROR_MESSAGE = locator(By.CSS_SELECTOR, ".error-message, .alert-error, mat-error")
+    USER_NAME_DISPLAY = locator(By.CSS_SELECTOR, ".user-name")
+    LOGOUT_BUTTON = locator(By.CSS_SELECTOR, ".logout-btn")
+    PASSWORD_ERROR = locator(By.CSS_SELECTOR, ".error-message:contains('contraseña'), mat-error:contains('contraseña')")
+    EMAIL_ERROR = locator(By.CSS_SELECTOR, ".error-message:contains('correo'), mat-error:contains('correo')")
+    INVALID_CREDENTIALS_ERROR = locator(By.CSS_SELECTOR, ".error-message:contains('credenciales'), .alert-error:contains('credenciales')")
+    # Ruta del panel tras iniciar sesión (la de la simulación local por defecto)
+    DASHBOARD_PATH = os.environ.get("INLAZE_DASHBOARD_PATH", "/panel")
 
     def __init__(self, driver):
         super().__init__(driver)
 
     def navigate(self):
-        """Navegar a la página de inicio de sesión y esperar que cargue"""
+        """Navegar a la página de inicio de sesión y esperar que cargue
+
+        Note:
+            Con un driver diferido la carga y la verificación del formulario se
+            realizan en la primera interacción con la página (``_verify_loaded``)
+        """
         self.navigate_to(f"{self.AUTH_PATH}/sign-in")
-        
+
+    def _verify_loaded(self):
+        """Verificar que el formulario de inicio de sesión cargó y está habilitado"""
         try:
             self._wait_for_condition(
                 EC.presence_of_element_located(self.LOGIN_FORM),
@@ -47,7 +60,6 @@ class LoginPage(BasePage):
             assert password_input.is_enabled(), "El campo de contraseña está deshabilitado"
             
         except Exception as e:
-            self.take_screenshot("error_login_page_load")
             raise Exception(f"Error al cargar la página de inicio de sesión: {str(e)}")
 
     def login(self, email, password):
@@ -78,41 +90,51 @@ class LoginPage(BasePage):
             if password_error:
                 return False, password_error
 
-            self.type_text(*self.EMAIL_INPUT, email)
-            self.type_text(*self.PASSWORD_INPUT, password)
+            self.fill_form([
+                (self.EMAIL_INPUT, email),
+                (self.PASSWORD_INPUT, password),
+            ])
             self.click_element(*self.LOGIN_BUTTON)
-            
-            error_msg = self.get_error_message()
-            if error_msg:
-                return False, error_msg
-                
+
             try:
-                # Verificar inicio de sesión exitoso
-                self._wait_for_condition(
-                    EC.presence_of_element_located(self.USER_NAME_DISPLAY),
+                # Esperar a que la aplicación responda (Angular estable, con la
+                # petición atendida): sesión iniciada o error visible
+                self.wait_for_angular(message="La aplicación no respondió al inicio de sesión")
+                outcome = self.wait_for_any(
+                    self.USER_NAME_DISPLAY,
+                    self.INVALID_CREDENTIALS_ERROR,
+                    self.ERROR_MESSAGE,
                     message="No se pudo verificar el inicio de sesión"
                 )
-                return True, "Inicio de sesión exitoso"
             except TimeoutException:
-                # Intentar obtener el mensaje de error de credenciales inválidas
-                try:
-                    error = self._wait_for_condition(
-                        EC.presence_of_element_located(self.INVALID_CREDENTIALS_ERROR),
-                        timeout=2,
-                        message="Las credenciales ingresadas no son válidas"
-                    ).text
-                    return False, error
-                except TimeoutException:
-                    # Si no hay mensaje de credenciales inválidas, buscar otros errores
-                    error = self.get_error_message()
-                    if error:
-                        return False, error
-                    return False, "Las credenciales ingresadas no son válidas"
+                return False, "Las credenciales ingresadas no son válidas"
+
+            error_msg = self.get_error_message()
+            if error_msg:
+                return False, error_msg
+
+            if outcome == self.USER_NAME_DISPLAY:
+                return True, "Inicio de sesión exitoso"
+            return False, "Las credenciales ingresadas no son válidas"
                 
         except Exception:
-            self.take_screenshot("error_login")
             return False, "Ha ocurrido un error inesperado. Por favor, intenta nuevamente"
 
+    def open_dashboard(self):
+        """Abrir el panel del usuario con una sesión ya iniciada
+
+        Note:
+            Pensado para sesiones inyectadas con ``set_auth_state``; espera a
+            que se muestre el nombre del usuario.
+        """
+        self.navigate_to(self.DASHBOARD_PATH, verify=self._verify_dashboard_loaded)
+
+    def _verify_dashboard_loaded(self):
+        self._wait_for_condition(
+            EC.visibility_of_element_located(self.USER_NAME_DISPLAY),
+            message="No se pudo cargar el panel del usuario con la sesión inyectada"
+        )
+
     def get_user_name(self):
         return self.get_element_text(*self.USER_NAME_DISPLAY)
 
@@ -137,9 +159,11 @@ class LoginPage(BasePage):
             self.driver.get(f"{self.BASE_URL}/registro")
 
     def are_fields_empty(self):
-        email = self.get_element_attribute(*self.EMAIL_INPUT, "value")
-        password = self.get_element_attribute(*self.PASSWORD_INPUT, "value")
-        return not email and not password
+        state = self.read_state({
+            'email': (self.EMAIL_INPUT, ['value']),
+            'password': (self.PASSWORD_INPUT, ['value']),
+        })
+        return not state['email']['value'] and not state['password']['value']
 
     def get_field_validation_state(self, field_locator):
         """Obtener el estado de validación de un campo
@@ -149,12 +173,23 @@ class LoginPage(BasePage):
             
         Returns:
             dict: Estado del campo con valor, validez y mensaje de error
+
+        Raises:
+            NoSuchElementException: Si el campo no está en la página
+
+        Note:
+            El valor, las clases y los mensajes de error se leen en una sola
+            llamada al navegador.
         """
-        element = self.find_element(*field_locator)
+        fields = self._error_fields()
+        fields['campo'] = (field_locator, ['value', 'class'])
+        state = self.read_state(fields)
+        if not state['campo']['present']:
+            raise NoSuchElementException(f"No se encontró el elemento: {field_locator[1]}")
         return {
-            'valor': element.get_attribute('value'),
-            'es_valido': 'ng-invalid' not in (element.get_attribute('class') or ''),
-            'mensaje_error': self.get_error_message()
+            'valor': state['campo']['value'],
+            'es_valido': 'ng-invalid' not in (state['campo']['class'] or ''),
+            'mensaje_error': self._error_from_state(state)
         }
 
     def is_login_button_enabled(self):
@@ -168,24 +203,11 @@ class LoginPage(BasePage):
             
         Returns:
             str: Mensaje de error o None si es válido
+
+        Note:
+            Delega en las reglas compartidas de ``tests.utils.validation_rules``
         """
-        if not email:
-            return "El correo electrónico es obligatorio"
-            
-        if len(email) > 100:
-            return "El correo electrónico no puede exceder los 100 caracteres"
-            
-        import re
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-            return "El formato del correo electrónico no es válido"
-            
-        if email.count('@') > 1:
-            return "El correo electrónico no puede contener más de un @"
-            
-        if '..' in email:
-            return "El correo electrónico no puede contener puntos consecutivos"
-            
-        return None
+        return LOGIN_EMAIL.first_error(email)
 
     def validate_password_format(self, password):
         """Validar el formato de la contraseña
@@ -195,32 +217,11 @@ class LoginPage(BasePage):
             
         Returns:
             str: Mensaje de error o None si es válido
+
+        Note:
+            Delega en las reglas compartidas de ``tests.utils.validation_rules``
         """
-        if not password:
-            return "La contraseña es obligatoria"
-            
-        if len(password) < 8:
-            return "La contraseña debe tener al menos 8 caracteres"
-            
-        if len(password) > 50:
-            return "La contraseña no puede exceder los 50 caracteres"
-            
-        if ' ' in password:
-            return "La contraseña no puede contener espacios"
-            
-        if not any(c.isupper() for c in password):
-            return "La contraseña debe contener al menos una mayúscula"
-            
-        if not any(c.islower() for c in password):
-            return "La contraseña debe contener al menos una minúscula"
-            
-        if not any(c.isdigit() for c in password):
-            return "La contraseña debe contener al menos un número"
-            
-        if not any(c in "!@#$%^&*(),.?\":{|}|<>" for c in password):
-            return "La contraseña debe contener al menos un carácter especial"
-            
-        return None
+        return LOGIN_PASSWORD.first_error(password)
 
     def get_error_message(self):
         """Obtener mensaje de error si existe
@@ -230,54 +231,53 @@ class LoginPage(BasePage):
             
         Note:
             Los mensajes se traducen automáticamente al español y se
-            formatean para mayor claridad
+            formatean para mayor claridad. Todos los mensajes se leen con una
+            única consulta al DOM, sin esperas.
         """
-        try:
-            try:
-                error = self.get_element_text(*self.INVALID_CREDENTIALS_ERROR)
-                if error:
-                    return "Las credenciales ingresadas no son válidas"
-            except TimeoutException:
-                pass
+        return self._error_from_state(self.read_state(self._error_fields()))
 
-            try:
-                error = self.get_element_text(*self.PASSWORD_ERROR)
-                if error:
-                    return error
-            except TimeoutException:
-                pass
+    def _error_fields(self):
+        """Campos de ``read_state`` con los posibles mensajes de error"""
+        return {
+            'credenciales': (self.INVALID_CREDENTIALS_ERROR, ['texts']),
+            'contraseña': (self.PASSWORD_ERROR, ['texts']),
+            'correo': (self.EMAIL_ERROR, ['texts']),
+            'general': (self.ERROR_MESSAGE, ['texts']),
+        }
 
-            try:
-                error = self.get_element_text(*self.EMAIL_ERROR)
-                if error:
-                    return error
-            except TimeoutException:
-                pass
+    def _error_from_state(self, state):
+        """Obtener el mensaje de error a partir del estado leído con ``_error_fields``"""
+        if state['credenciales']['texts']:
+            return "Las credenciales ingresadas no son válidas"
 
-            error = self.get_element_text(*self.ERROR_MESSAGE)
-            if error:
-                error_lower = error.lower()
-            
-            # Mapeo de mensajes de error
-            error_mapping = {
-                "invalid email": "El formato del correo electrónico no es válido",
-                "invalid password": "La contraseña ingresada no cumple con los requisitos de seguridad",
-                "invalid credentials": "Las credenciales ingresadas no son correctas. Por favor, verifica e intenta nuevamente",
-                "email is required": "El correo electrónico es obligatorio",
-                "password is required": "La contraseña es obligatoria",
-                "all fields are required": "Por favor, completa todos los campos obligatorios",
-                "password must be at least 8 characters": "La contraseña debe tener al menos 8 caracteres",
-                "password must contain uppercase": "La contraseña debe contener al menos una letra mayúscula",
-                "password must contain lowercase": "La contraseña debe contener al menos una letra minúscula",
-                "password must contain number": "La contraseña debe contener al menos un número",
-                "password must contain special": "La contraseña debe contener al menos un carácter especial (!@#$%^&*(),.?\":{|}|<>)"
-            }
-            
-            # Buscar coincidencias en el mapeo de errores
-            for key, value in error_mapping.items():
-                if key in error_lower:
-                    return value
-                
-            return error
-        except TimeoutException:
+        for field in ('contraseña', 'correo'):
+            if state[field]['texts']:
+                return state[field]['texts'][0]
+
+        errors = state['general']['texts']
+        if not errors:
             return None
+        error = errors[0]
+        error_lower = error.lower()
+        
+        # Mapeo de mensajes de error
+        error_mapping = {
+            "invalid email": "El formato del correo electrónico no es válido",
+            "invalid password": "La contraseña ingresada no cumple con los requisitos de seguridad",
+            "invalid credentials": "Las credenciales ingresadas no son correctas. Por favor, verifica e intenta nuevamente",
+            "email is required": "El correo electrónico es obligatorio",
+            "password is required": "La contraseña es obligatoria",
+            "all fields are required": "Por favor, completa todos los campos obligatorios",
+            "password must be at least 8 characters": "La contraseña debe tener al menos 8 caracteres",
+            "password must contain uppercase": "La contraseña debe contener al menos una letra mayúscula",
+            "password must contain lowercase": "La contraseña debe contener al menos una letra minúscula",
+            "password must contain number": "La contraseña debe contener al menos un número",
+            "password must contain special": "La contraseña debe contener al menos un carácter especial (!@#$%^&*(),.?\":{|}|<>)"
+        }
+        
+        # Buscar coincidencias en el mapeo de errores
+        for key, value in error_mapping.items():
+            if key in error_lower:
+                return value
+            
+        return error
@@ -3,28 +3,34 @@ from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from .base_page import BasePage
+from .locators import locator
+from ..utils.validation_rules import NAME, REGISTER_EMAIL, REGISTER_PASSWORD
 
 class RegisterPage(BasePage):
-    REGISTER_FORM = (By.CSS_SELECTOR, "app-sign-up-form form")
-    NAME_INPUT = (By.CSS_SELECTOR, "app-sign-up-form input[formcontrolname='name']")
-    EMAIL_INPUT = (By.CSS_SELECTOR, "app-sign-up-form input[formcontrolname='email']")
-    PASSWORD_INPUT = (By.CSS_SELECTOR, "app-sign-up-form app-password input[type='password']")
-    CONFIRM_PASSWORD_INPUT = (By.CSS_SELECTOR, "app-sign-up-form app-password:nth-child(2) input[type='password']")
-    REGISTER_BUTTON = (By.CSS_SELECTOR, "app-sign-up-form button[type='submit']")
-    LOGIN_LINK = (By.CSS_SELECTOR, "a[href*='/sign-in'], a[href*='/login']")
-    ERROR_MESSAGE = (By.CSS_SELECTOR, ".error-message, .alert-error, mat-error")
-    NAME_ERROR = (By.CSS_SELECTOR, ".error-message:contains('nombre'), mat-error:contains('nombre')")
-    EMAIL_ERROR = (By.CSS_SELECTOR, ".error-message:contains('correo'), mat-error:contains('correo')")
-    PASSWORD_ERROR = (By.CSS_SELECTOR, ".error-message:contains('contraseña'), mat-error:contains('contraseña')")
-    PASSWORD_REQUIREMENTS = (By.CSS_SELECTOR, ".password-requirements")
-    SHOW_PASSWORD_BUTTON = (By.CSS_SELECTOR, "app-sign-up-form app-password:first-of-type button")
-    SHOW_CONFIRM_PASSWORD_BUTTON = (By.CSS_SELECTOR, "app-sign-up-form app-password:last-of-type button")
+    REGISTER_FORM = locator(By.CSS_SELECTOR, "app-sign-up-form form")
+    FORM_LOCATOR = REGISTER_FORM
+    NAME_INPUT = locator(By.CSS_SELECTOR, "app-sign-up-form input[formcontrolname='name']")
+    EMAIL_INPUT = locator(By.CSS_SELECTOR, "app-sign-up-form input[formcontrolname='email']")
+    PASSWORD_INPUT = locator(By.CSS_SELECTOR, "app-sign-up-form app-password input[type='password']")
+    CONFIRM_PASSWORD_INPUT = locator(By.CSS_SELECTOR, "app-sign-up-form app-password:nth-child(2) input[type='password']")
+    REGISTER_BUTTON = locator(By.CSS_SELECTOR, "app-sign-up-form button[type='submit']")
+    LOGIN_LINK = locator(By.CSS_SELECTOR, "a[href*='/sign-in'], a[href*='/login']")
+    ERROR_MESSAGE = locator(By.CSS_SELECTOR, ".error-message, .alert-error, mat-error")
+    NAME_ERROR = locator(By.CSS_SELECTOR, ".error-message:contains('nombre'), mat-error:contains('nombre')")
+    EMAIL_ERROR = locator(By.CSS_SELECTOR, ".error-message:contains('correo'), mat-error:contains('correo')")
+    PASSWORD_ERROR = locator(By.CSS_SELECTOR, ".error-message:contains('contraseña'), mat-error:contains('contraseña')")
+    PASSWORD_REQUIREMENTS = locator(By.CSS_SELECTOR, ".password-requirements")
+    SHOW_PASSWORD_BUTTON = locator(By.CSS_SELECTOR, "app-sign-up-form app-password:first-of-type button")
+    SHOW_CONFIRM_PASSWORD_BUTTON = locator(By.CSS_SELECTOR, "app-sign-up-form app-password:last-of-type button")
 
     def __init__(self, driver):
         super().__init__(driver)
 
     def navigate(self):
         self.navigate_to(f"{self.AUTH_PATH}/sign-up")
+
+    def _verify_loaded(self):
+        """Verificar que el formulario de registro cargó"""
         self._wait_for_condition(
             EC.presence_of_element_located(self.REGISTER_FORM),
             message="No se pudo cargar el formulario de registro"
@@ -57,56 +63,45 @@ class RegisterPage(BasePage):
             if not all([name, email, password, confirm_password]):
                 return False, "Todos los campos son obligatorios"
 
-            # Validación y entrada del nombre
-            try:
-                self.type_text(*self.NAME_INPUT, name)
-                name_error = self.validate_name_format()
-                if name_error:
-                    return False, name_error
-            except Exception as e:
-                self.take_screenshot("error_nombre_registro")
-                return False, f"Error al procesar el nombre: {str(e)}"
-
-            # Validación y entrada del correo
+            # Entrada de todos los campos del formulario
             try:
-                self.type_text(*self.EMAIL_INPUT, email)
-                email_error = self.validate_email_format()
-                if email_error:
-                    return False, email_error
+                name_value, email_value, password_value, _ = self.fill_form([
+                    (self.NAME_INPUT, name),
+                    (self.EMAIL_INPUT, email),
+                    (self.PASSWORD_INPUT, password),
+                    (self.CONFIRM_PASSWORD_INPUT, confirm_password),
+                ])
             except Exception as e:
-                self.take_screenshot("error_email_registro")
-                return False, f"Error al procesar el correo electrónico: {str(e)}"
+                return False, f"Error al completar el formulario de registro: {str(e)}"
 
-            # Validación y entrada de la contraseña
-            try:
-                self.type_text(*self.PASSWORD_INPUT, password)
-                password_error = self.validate_password_requirements()
-                if password_error:
-                    return False, password_error
-            except Exception as e:
-                self.take_screenshot("error_password_registro")
-                return False, f"Error al procesar la contraseña: {str(e)}"
+            # Validación de los campos en el orden del formulario
+            validations = [
+                (self.validate_name_format, name_value),
+                (self.validate_email_format, email_value),
+                (self.validate_password_requirements, password_value),
+            ]
+            for validate, value in validations:
+                error = validate(value)
+                if error:
+                    return False, error
 
-            # Validación y entrada de la confirmación de contraseña
-            try:
-                self.type_text(*self.CONFIRM_PASSWORD_INPUT, confirm_password)
-                confirm_error = self.validate_passwords_match(password, confirm_password)
-                if confirm_error:
-                    return False, confirm_error
-            except Exception as e:
-                self.take_screenshot("error_confirm_password_registro")
-                return False, f"Error al procesar la confirmación de contraseña: {str(e)}"
+            confirm_error = self.validate_passwords_match(password, confirm_password)
+            if confirm_error:
+                return False, confirm_error
 
             # Envío del formulario y validación del resultado
             try:
                 self.click_element(*self.REGISTER_BUTTON)
                 
-                # Esperar redirección exitosa
-                if self._wait_for_condition(
-                    EC.url_contains("/sign-in"),
+                # Esperar la respuesta de la aplicación (Angular estable, con la
+                # petición atendida): redirección o error visible
+                self.wait_for_angular(message="La aplicación no respondió al registro")
+                outcome = self._wait_for_condition(
+                    self._submit_outcome,
                     timeout=10,
                     message="Error al redireccionar después del registro"
-                ):
+                )
+                if outcome == "redirect":
                     return True, "Registro exitoso. Ya puedes iniciar sesión con tu correo y contraseña."
                 
                 # Verificar mensajes de error
@@ -119,28 +114,38 @@ class RegisterPage(BasePage):
                     return False, error
                 
                 # Verificar si seguimos en el formulario
-                if self._wait_for_condition(
-                    EC.presence_of_element_located(self.REGISTER_FORM),
-                    timeout=2
-                ):
+                if not self.is_element_absent(*self.REGISTER_FORM):
                     return False, "No se pudo completar el registro. Por favor, verifica todos los campos."
                     
                 return False, "Ha ocurrido un error durante el registro. Por favor, intenta nuevamente."
                 
             except TimeoutException:
-                self.take_screenshot("error_timeout_registro")
                 return False, "Error de conexión. Por favor, verifica tu internet e intenta nuevamente."
             except Exception as e:
-                self.take_screenshot("error_submit_registro")
                 return False, f"Error al enviar el formulario: {str(e)}"
             
         except Exception as e:
-            self.take_screenshot("error_registro_general")
             return False, f"Ha ocurrido un error inesperado: {str(e)}. Por favor, intenta más tarde."
 
-    def validate_name_format(self):
+    def _submit_outcome(self, driver):
+        """Condición de espera tras enviar el registro
+
+        Returns:
+            str: ``"redirect"`` si se redirigió al inicio de sesión, ``"error"``
+                 si se muestra un error, o False si aún no hay respuesta
+        """
+        if "/sign-in" in driver.current_url:
+            return "redirect"
+        if driver.find_elements(*self.ERROR_MESSAGE):
+            return "error"
+        return False
+
+    def validate_name_format(self, name=None):
         """Validar formato del nombre completo
         
+        Args:
+            name: Nombre a validar (por defecto se lee del formulario)
+
         Returns:
             str: Mensaje de error o None si es válido
             
@@ -151,64 +156,40 @@ class RegisterPage(BasePage):
             - Solo contener letras (sin números ni caracteres especiales)
         """
         try:
-            name = self.get_element_attribute(*self.NAME_INPUT, "value")
-            if not name or not name.strip():
-                return "El nombre es obligatorio"
-            
-            words = [w for w in name.split() if w.strip()]
-            if len(words) < 2:
-                return "El nombre debe contener nombre y apellido"
-                
-            if any(not w.replace(' ', '').isalpha() for w in words):
-                return "El nombre solo puede contener letras"
-                
-            return None
+            if name is None:
+                name = self.get_element_attribute(*self.NAME_INPUT, "value")
+            return NAME.first_error(name)
         except Exception:
             return "Error al validar el formato del nombre"
 
-    def validate_email_format(self):
+    def validate_email_format(self, email=None):
         """Validar formato del correo electrónico
         
+        Args:
+            email: Correo a validar (por defecto se lee del formulario)
+
         Returns:
             str: Mensaje de error o None si es válido
         """
         try:
-            email = self.get_element_attribute(*self.EMAIL_INPUT, "value")
-            if not email or not email.strip():
-                return "El correo electrónico es obligatorio"
-                
-            import re
-            email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-            if not email_pattern.match(email):
-                return "El formato del correo electrónico no es válido"
-                
-            return None
+            if email is None:
+                email = self.get_element_attribute(*self.EMAIL_INPUT, "value")
+            return REGISTER_EMAIL.first_error(email)
         except Exception:
             return "Error al validar el formato del correo electrónico"
 
-    def validate_password_requirements(self):
+    def validate_password_requirements(self, password=None):
         """Validar requisitos de seguridad de la contraseña
         
+        Args:
+            password: Contraseña a validar (por defecto se lee del formulario)
+
         Returns:
             str: Mensaje de error o None si cumple todos los requisitos
         """
-        password = self.get_element_attribute(*self.PASSWORD_INPUT, "value")
-        if not password:
-            return "Por favor, ingresa tu contraseña"
-            
-        requirements = [
-            (len(password) >= 8, "La contraseña debe tener al menos 8 caracteres"),
-            (any(c.isupper() for c in password), "La contraseña debe contener al menos una mayúscula"),
-            (any(c.islower() for c in password), "La contraseña debe contener al menos una minúscula"),
-            (any(c.isdigit() for c in password), "La contraseña debe contener al menos un número"),
-            (any(c in "!@#$%^&*(),.?\":{|}|<>" for c in password), "La contraseña debe contener al menos un carácter especial (!@#$%^&*(),.?\":{|}|<>)"),
-        ]
-        
-        for requirement_met, error_message in requirements:
-            if not requirement_met:
-                return error_message
-                
-        return None
+        if password is None:
+            password = self.get_element_attribute(*self.PASSWORD_INPUT, "value")
+        return REGISTER_PASSWORD.first_error(password)
 
     def validate_passwords_match(self, password, confirm_password):
         """Validar que las contraseñas coincidan
@@ -242,11 +223,13 @@ class RegisterPage(BasePage):
             self.driver.get(f"{self.BASE_URL}{self.AUTH_PATH}/sign-in")
 
     def are_fields_empty(self):
-        name = self.get_element_attribute(*self.NAME_INPUT, "value")
-        email = self.get_element_attribute(*self.EMAIL_INPUT, "value")
-        password = self.get_element_attribute(*self.PASSWORD_INPUT, "value")
-        confirm = self.get_element_attribute(*self.CONFIRM_PASSWORD_INPUT, "value")
-        return not any([name, email, password, confirm])
+        state = self.read_state({
+            'name': (self.NAME_INPUT, ['value']),
+            'email': (self.EMAIL_INPUT, ['value']),
+            'password': (self.PASSWORD_INPUT, ['value']),
+            'confirm': (self.CONFIRM_PASSWORD_INPUT, ['value']),
+        })
+        return not any(field['value'] for field in state.values())
 
     def get_field_errors(self):
         """Obtener todos los errores de validación de los campos
@@ -256,7 +239,8 @@ class RegisterPage(BasePage):
             
         Note:
             Los errores se formatean de manera amigable y clara
-            para el usuario final
+            para el usuario final. Los errores de todos los campos se leen
+            con una única consulta al DOM, sin esperar el tiempo máximo.
         """
         errors = {}
         field_mapping = [
@@ -264,19 +248,21 @@ class RegisterPage(BasePage):
             ('email', self.EMAIL_ERROR, 'correo electrónico'),
             ('contraseña', self.PASSWORD_ERROR, 'contraseña')
         ]
+        state = self.read_state({
+            field_id: (locator, ['texts']) for field_id, locator, _ in field_mapping
+        })
         
-        for field_id, locator, field_name in field_mapping:
-            try:
-                error = self.get_element_text(*locator)
-                if error:
-                    if "required" in error.lower():
-                        errors[field_id] = f"Por favor, ingresa tu {field_name}"
-                    elif "invalid" in error.lower():
-                        errors[field_id] = f"El {field_name} no es válido"
-                    else:
-                        errors[field_id] = error
-            except TimeoutException:
+        for field_id, _, field_name in field_mapping:
+            texts = state[field_id]['texts']
+            if not texts:
                 continue
+            error = texts[0]
+            if "required" in error.lower():
+                errors[field_id] = f"Por favor, ingresa tu {field_name}"
+            elif "invalid" in error.lower():
+                errors[field_id] = f"El {field_name} no es válido"
+            else:
+                errors[field_id] = error
                 
         return errors
 
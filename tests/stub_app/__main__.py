@@ -0,0 +1,30 @@
+import argparse
+import time
+
+from .server import StubAppServer
+
+
+def main():
+    """Ejecutar la aplicación simulada de forma independiente
+
+    Ejemplo:
+        python -m tests.stub_app --port 8080 --latency-ms 50
+    """
+    parser = argparse.ArgumentParser(description="Simulación local de la aplicación de Inlaze")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Latencia agregada a cada llamada a la API")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Probabilidad (0-1) de responder 500 en la API")
+    args = parser.parse_args()
+
+    server = StubAppServer(args.host, args.port, latency=args.latency_ms / 1000, error_rate=args.error_rate)
+    print(f"Aplicación simulada disponible en {server.start()}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
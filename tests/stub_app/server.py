@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+import random
+import secrets
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+STATIC_FILES = {
+    '/app.js': ('app.js', 'application/javascript; charset=utf-8'),
+    '/styles.css': ('styles.css', 'text/css; charset=utf-8'),
+}
+
+
+def static_fingerprint():
+    """Hash del contenido de los archivos estáticos de la aplicación simulada"""
+    digest = hashlib.sha256()
+    for filename in sorted(os.listdir(STATIC_DIR)):
+        path = os.path.join(STATIC_DIR, filename)
+        if os.path.isfile(path):
+            digest.update(filename.encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:16]
+
+
+class UserStore:
+    """Almacén en memoria de usuarios y sesiones de la aplicación simulada"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = {}
+        self._tokens = {}
+
+    def create(self, name, email, password):
+        """Registrar un usuario
+
+        Returns:
+            dict: Datos públicos del usuario o None si el correo ya existe
+        """
+        key = (email or '').strip().lower()
+        with self._lock:
+            if key in self._users:
+                return None
+            self._users[key] = {'name': name, 'email': email, 'password': password}
+            return {'name': name, 'email': email}
+
+    def authenticate(self, email, password):
+        """Validar credenciales y abrir una sesión
+
+        Returns:
+            str: Token de sesión o None si las credenciales no son válidas
+        """
+        key = (email or '').strip().lower()
+        with self._lock:
+            user = self._users.get(key)
+            if not user or user['password'] != password:
+                return None
+            token = secrets.token_urlsafe(24)
+            self._tokens[token] = key
+            return token
+
+    def user_for_token(self, token):
+        with self._lock:
+            key = self._tokens.get(token)
+            user = self._users.get(key) if key else None
+            return {'name': user['name'], 'email': user['email']} if user else None
+
+    def revoke(self, token):
+        with self._lock:
+            self._tokens.pop(token, None)
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+            self._tokens.clear()
+
+    def __len__(self):
+        return len(self._users)
+
+
+class StubAppServer:
+    """Servidor HTTP local que simula la aplicación de autenticación de Inlaze
+
+    Sirve una aplicación de una sola página con la misma estructura DOM que usan
+    los page objects (``app-sign-in-form``, ``app-sign-up-form``, ``mat-error``,
+    ``.user-name``, ``.logout-btn``), la API de testability de Angular
+    (``getAllAngularTestabilities``, estable sin peticiones pendientes) y una
+    API de autenticación respaldada por un almacén de usuarios en memoria.
+
+    Note:
+        - ``latency`` agrega un retardo fijo (en segundos) a cada llamada a la API
+        - ``error_rate`` es la probabilidad de responder 500 a una llamada a la API
+        - La configuración también puede cambiarse en caliente con
+          ``POST /__stub__/config`` y los usuarios se limpian con
+          ``POST /__stub__/reset``
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, error_rate=0.0, seed=None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.users = UserStore()
+        self._random = random.Random(seed)
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def configure(self, latency=None, error_rate=None):
+        """Cambiar la latencia o la tasa de errores simulados"""
+        if latency is not None:
+            self.latency = float(latency)
+        if error_rate is not None:
+            self.error_rate = float(error_rate)
+
+    def start(self):
+        """Iniciar el servidor en un hilo en segundo plano
+
+        Returns:
+            str: URL base del servidor
+        """
+        handler = type('StubAppHandler', (_StubAppHandler,), {'app': self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name='stub-app', daemon=True
+        )
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Detener el servidor"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def should_fail(self):
+        return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class _StubAppHandler(BaseHTTPRequestHandler):
+    app = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path.startswith('/api/'):
+            self._handle_api('GET', path)
+        elif path == '/favicon.ico':
+            self._send(HTTPStatus.NO_CONTENT, b'', 'image/x-icon')
+        elif path in STATIC_FILES:
+            filename, content_type = STATIC_FILES[path]
+            self._send_file(filename, content_type)
+        else:
+            self._send_file('index.html', 'text/html; charset=utf-8')
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        if path.startswith('/__stub__/'):
+            self._handle_admin(path)
+        elif path.startswith('/api/'):
+            self._handle_api('POST', path)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'message': 'Not found'})
+
+    def _handle_admin(self, path):
+        body = self._read_json()
+        if path == '/__stub__/config':
+            self.app.configure(body.get('latency'), body.get('error_rate'))
+            self._send_json(HTTPStatus.OK, {'latency': self.app.latency, 'error_rate': self.app.error_rate})
+        elif path == '/__stub__/reset':
+            self.app.users.clear()
+            self._send_json(HTTPStatus.OK, {'users': 0})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'message': 'Not found'})
+
+    def _handle_api(self, method, path):
+        body = self._read_json() if method == 'POST' else {}
+        if self.app.latency:
+            time.sleep(self.app.latency)
+        if self.app.should_fail():
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'message': 'Ha ocurrido un error inesperado'})
+            return
+
+        users = self.app.users
+        if (method, path) == ('POST', '/api/auth/sign-up'):
+            user = users.create(body.get('name'), body.get('email'), body.get('password'))
+            if user is None:
+                self._send_json(HTTPStatus.CONFLICT, {'message': 'Este correo electrónico ya está registrado'})
+            else:
+                self._send_json(HTTPStatus.CREATED, {'user': user})
+        elif (method, path) == ('POST', '/api/auth/sign-in'):
+            token = users.authenticate(body.get('email'), body.get('password'))
+            if token is None:
+                self._send_json(HTTPStatus.UNAUTHORIZED, {'message': 'Las credenciales ingresadas no son válidas'})
+            else:
+                self._send_json(HTTPStatus.OK, {'token': token, 'user': users.user_for_token(token)})
+        elif (method, path) == ('GET', '/api/auth/me'):
+            user = users.user_for_token(self._bearer_token())
+            if user is None:
+                self._send_json(HTTPStatus.UNAUTHORIZED, {'message': 'Sesión no válida'})
+            else:
+                self._send_json(HTTPStatus.OK, {'user': user})
+        elif (method, path) == ('POST', '/api/auth/logout'):
+            users.revoke(self._bearer_token())
+            self._send_json(HTTPStatus.OK, {})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'message': 'Not found'})
+
+    def _bearer_token(self):
+        header = self.headers.get('Authorization', '')
+        return header[len('Bearer '):] if header.startswith('Bearer ') else None
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            return {}
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json; charset=utf-8')
+
+    def _send_file(self, filename, content_type):
+        with open(os.path.join(STATIC_DIR, filename), 'rb') as f:
+            self._send(HTTPStatus.OK, f.read(), content_type)
+
+    def _send(self, status, content, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(content)
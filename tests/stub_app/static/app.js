@@ -0,0 +1,349 @@
+/*
+ * Simulación local de la aplicación de autenticación de Inlaze.
+ *
+ * Reproduce la estructura DOM y el comportamiento básico de los formularios
+ * reactivos de Angular (clases ng-*, mat-error) que usan los page objects.
+ */
+(function () {
+  'use strict';
+
+  var SPECIAL_CHARACTERS = '!@#$%^&*(),.?":{}|<>';
+  var EMAIL_PATTERN = /^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$/;
+  var TOKEN_KEY = 'token';
+  var USER_KEY = 'user';
+
+  var root = document.querySelector('app-root');
+  var components = typeof WeakMap === 'function' ? new WeakMap() : null;
+  var pendingRequests = 0;
+  var stableCallbacks = [];
+  var routes = {
+    '/auth/sign-in': renderSignIn,
+    '/auth/sign-up': renderSignUp,
+    '/panel': renderDashboard
+  };
+
+  function el(tag, attributes, children) {
+    var node = document.createElement(tag);
+    Object.keys(attributes || {}).forEach(function (name) {
+      node.setAttribute(name, attributes[name]);
+    });
+    [].concat(children || []).forEach(function (child) {
+      node.appendChild(typeof child === 'string' ? document.createTextNode(child) : child);
+    });
+    return node;
+  }
+
+  function api(method, path, body, callback) {
+    var xhr = new XMLHttpRequest();
+    xhr.open(method, path);
+    xhr.setRequestHeader('Content-Type', 'application/json');
+    var token = localStorage.getItem(TOKEN_KEY);
+    if (token) {
+      xhr.setRequestHeader('Authorization', 'Bearer ' + token);
+    }
+    xhr.onloadend = function () {
+      var data = {};
+      try { data = JSON.parse(xhr.responseText || '{}'); } catch (e) {}
+      try {
+        callback(xhr.status, data);
+      } finally {
+        pendingRequests--;
+        notifyIfStable();
+      }
+    };
+    pendingRequests++;
+    xhr.send(body ? JSON.stringify(body) : null);
+  }
+
+  /* Estabilidad como la de zone.js: sin peticiones HTTP pendientes */
+  function notifyIfStable() {
+    if (pendingRequests > 0) { return; }
+    setTimeout(function () {
+      if (pendingRequests > 0) { return; }
+      var callbacks = stableCallbacks;
+      stableCallbacks = [];
+      callbacks.forEach(function (callback) { callback(false); });
+    }, 0);
+  }
+
+  function navigate(path, replace) {
+    history[replace ? 'replaceState' : 'pushState'](null, '', path);
+    render();
+  }
+
+  function render() {
+    var path = location.pathname.replace(/\/+$/, '') || '/';
+    if (path === '/') {
+      navigate(localStorage.getItem(TOKEN_KEY) ? '/panel' : '/auth/sign-in', true);
+      return;
+    }
+    root.innerHTML = '';
+    var view = routes[path];
+    if (!view) {
+      root.appendChild(el('p', { 'class': 'not-found' }, 'Página no encontrada'));
+      return;
+    }
+    view(root);
+  }
+
+  /* Control de formulario con las clases de estado de Angular */
+  function FormControl(input, validators, errorHost) {
+    this.input = input;
+    this.validators = validators;
+    this.errorHost = errorHost;
+    this.dirty = false;
+    this.touched = false;
+    var control = this;
+    input.addEventListener('input', function () { control.dirty = true; control.update(); });
+    input.addEventListener('blur', function () { control.touched = true; control.update(); });
+    this.update();
+  }
+
+  FormControl.prototype.error = function () {
+    for (var i = 0; i < this.validators.length; i++) {
+      var message = this.validators[i](this.input.value);
+      if (message) { return message; }
+    }
+    return null;
+  };
+
+  FormControl.prototype.update = function () {
+    var error = this.error();
+    var classes = this.input.classList;
+    classes.toggle('ng-pristine', !this.dirty);
+    classes.toggle('ng-dirty', this.dirty);
+    classes.toggle('ng-untouched', !this.touched);
+    classes.toggle('ng-touched', this.touched);
+    classes.toggle('ng-valid', !error);
+    classes.toggle('ng-invalid', !!error);
+
+    var current = this.errorHost.querySelector('mat-error');
+    if (current) { current.remove(); }
+    if (error && this.touched) {
+      this.errorHost.appendChild(el('mat-error', {}, error));
+    }
+  };
+
+  FormControl.prototype.reset = function () {
+    this.input.value = '';
+    this.dirty = false;
+    this.touched = false;
+    this.update();
+  };
+
+  function Form(form, controls) {
+    this.form = form;
+    this.controls = controls;
+    /* Como FormGroupDirective: el evento reset del formulario reinicia el modelo */
+    var self = this;
+    form.addEventListener('reset', function () { self.reset(); });
+  }
+
+  Form.prototype.valid = function () {
+    var controls = this.controls;
+    Object.keys(controls).forEach(function (name) {
+      controls[name].touched = true;
+      controls[name].update();
+    });
+    return Object.keys(controls).every(function (name) { return !controls[name].error(); });
+  };
+
+  Form.prototype.reset = function () {
+    var controls = this.controls;
+    Object.keys(controls).forEach(function (name) { controls[name].reset(); });
+    this.showAlert(null);
+  };
+
+  Form.prototype.value = function () {
+    var controls = this.controls;
+    var value = {};
+    Object.keys(controls).forEach(function (name) { value[name] = controls[name].input.value; });
+    return value;
+  };
+
+  Form.prototype.showAlert = function (message) {
+    var alert = this.form.querySelector('.alert-error');
+    if (alert) { alert.remove(); }
+    if (message) {
+      this.form.insertBefore(el('div', { 'class': 'alert-error' }, message), this.form.firstChild);
+    }
+  };
+
+  function required(message) {
+    return function (value) { return value ? null : message; };
+  }
+
+  function emailFormat(value) {
+    return value && !EMAIL_PATTERN.test(value) ? 'El formato del correo electrónico no es válido' : null;
+  }
+
+  function passwordStrength(value) {
+    if (!value) { return null; }
+    if (value.length < 8) { return 'La contraseña debe tener al menos 8 caracteres'; }
+    if (!/[A-Z]/.test(value)) { return 'La contraseña debe contener al menos una mayúscula'; }
+    if (!/[a-z]/.test(value)) { return 'La contraseña debe contener al menos una minúscula'; }
+    if (!/[0-9]/.test(value)) { return 'La contraseña debe contener al menos un número'; }
+    for (var i = 0; i < value.length; i++) {
+      if (SPECIAL_CHARACTERS.indexOf(value[i]) !== -1) { return null; }
+    }
+    return 'La contraseña debe contener al menos un carácter especial';
+  }
+
+  function fullName(value) {
+    if (!value) { return null; }
+    var words = value.trim().split(/\s+/);
+    if (words.length < 2) { return 'El nombre debe contener nombre y apellido'; }
+    return words.every(function (w) { return /^[A-Za-zÀ-ÿ]+$/.test(w); }) ? null : 'El nombre solo puede contener letras';
+  }
+
+  function textField(name, type, placeholder) {
+    var input = el('input', { type: type, formcontrolname: name, placeholder: placeholder });
+    var field = el('mat-form-field', {}, [input]);
+    return { input: input, host: field, node: field };
+  }
+
+  function passwordField(name, placeholder) {
+    var input = el('input', { type: 'password', formcontrolname: name, placeholder: placeholder });
+    var toggle = el('button', { type: 'button', 'class': 'toggle-password' }, 'Mostrar');
+    toggle.addEventListener('click', function () {
+      input.type = input.type === 'password' ? 'text' : 'password';
+    });
+    var host = el('app-password', {}, [input, toggle]);
+    return { input: input, host: host, node: host };
+  }
+
+  /* Registra el componente del elemento anfitrión para la API ng de depuración */
+  function component(host, instance) {
+    if (components) { components.set(host, instance); }
+    return host;
+  }
+
+  function link(href, text) {
+    var anchor = el('a', { href: href }, text);
+    anchor.addEventListener('click', function (event) {
+      event.preventDefault();
+      navigate(href);
+    });
+    return anchor;
+  }
+
+  function renderSignIn(container) {
+    var email = textField('email', 'email', 'Correo electrónico');
+    var password = passwordField('password', 'Contraseña');
+    var submit = el('button', { type: 'submit' }, 'Iniciar sesión');
+    var formNode = el('form', { novalidate: '' }, [email.node, password.node, submit]);
+    var form = new Form(formNode, {
+      email: new FormControl(email.input, [required('El correo electrónico es obligatorio'), emailFormat], email.host),
+      password: new FormControl(password.input, [required('La contraseña es obligatoria')], password.host)
+    });
+
+    formNode.addEventListener('submit', function (event) {
+      event.preventDefault();
+      form.showAlert(null);
+      if (!form.valid()) { return; }
+      submit.disabled = true;
+      api('POST', '/api/auth/sign-in', form.value(), function (status, data) {
+        submit.disabled = false;
+        if (status === 200) {
+          localStorage.setItem(TOKEN_KEY, data.token);
+          localStorage.setItem(USER_KEY, JSON.stringify(data.user));
+          navigate('/panel');
+        } else {
+          form.showAlert(data.message || 'Ha ocurrido un error inesperado');
+        }
+      });
+    });
+
+    container.appendChild(component(el('app-sign-in-form', {}, [
+      el('h1', {}, 'Iniciar sesión'),
+      formNode,
+      link('/auth/sign-up', 'Crear una cuenta')
+    ]), { form: form }));
+  }
+
+  function renderSignUp(container) {
+    var name = textField('name', 'text', 'Nombre completo');
+    var email = textField('email', 'email', 'Correo electrónico');
+    var password = passwordField('password', 'Contraseña');
+    var confirm = passwordField('confirmPassword', 'Confirmar contraseña');
+    var submit = el('button', { type: 'submit' }, 'Registrarse');
+    var passwords = el('div', { 'class': 'password-fields' }, [password.node, confirm.node]);
+    var formNode = el('form', { novalidate: '' }, [name.node, email.node, passwords, submit]);
+    var form = new Form(formNode, {
+      name: new FormControl(name.input, [required('El nombre es obligatorio'), fullName], name.host),
+      email: new FormControl(email.input, [required('El correo electrónico es obligatorio'), emailFormat], email.host),
+      password: new FormControl(password.input, [required('La contraseña es obligatoria'), passwordStrength], password.host),
+      confirmPassword: new FormControl(confirm.input, [
+        required('Por favor, confirma tu contraseña'),
+        function (value) { return value && value !== password.input.value ? 'Las contraseñas no coinciden' : null; }
+      ], confirm.host)
+    });
+
+    formNode.addEventListener('submit', function (event) {
+      event.preventDefault();
+      form.showAlert(null);
+      if (!form.valid()) { return; }
+      submit.disabled = true;
+      var value = form.value();
+      api('POST', '/api/auth/sign-up', { name: value.name, email: value.email, password: value.password }, function (status, data) {
+        submit.disabled = false;
+        if (status === 201) {
+          navigate('/auth/sign-in');
+        } else {
+          form.showAlert(data.message || 'Ha ocurrido un error inesperado');
+        }
+      });
+    });
+
+    container.appendChild(component(el('app-sign-up-form', {}, [
+      el('h1', {}, 'Crear cuenta'),
+      formNode,
+      link('/auth/sign-in', 'Ya tengo una cuenta')
+    ]), { form: form }));
+  }
+
+  function renderDashboard(container) {
+    if (!localStorage.getItem(TOKEN_KEY)) {
+      navigate('/auth/sign-in', true);
+      return;
+    }
+    var view = el('app-dashboard', {});
+    container.appendChild(view);
+    api('GET', '/api/auth/me', null, function (status, data) {
+      if (status !== 200) {
+        localStorage.removeItem(TOKEN_KEY);
+        localStorage.removeItem(USER_KEY);
+        navigate('/auth/sign-in', true);
+        return;
+      }
+      var logout = el('button', { type: 'button', 'class': 'logout-btn' }, 'Cerrar sesión');
+      logout.addEventListener('click', function () {
+        api('POST', '/api/auth/logout', null, function () {
+          localStorage.removeItem(TOKEN_KEY);
+          localStorage.removeItem(USER_KEY);
+          navigate('/auth/sign-in');
+        });
+      });
+      view.appendChild(el('header', {}, [el('span', { 'class': 'user-name' }, data.user.name), logout]));
+    });
+  }
+
+  /* Subconjunto de la API global ng que Angular expone en modo de desarrollo */
+  window.ng = {
+    getComponent: function (element) { return (components && components.get(element)) || null; },
+    applyChanges: function () {}
+  };
+
+  /* API de testability que Angular registra para cada aplicación */
+  var testability = {
+    isStable: function () { return pendingRequests === 0; },
+    whenStable: function (callback) {
+      stableCallbacks.push(callback);
+      notifyIfStable();
+    }
+  };
+  window.getAllAngularTestabilities = function () { return [testability]; };
+
+  window.addEventListener('popstate', render);
+  render();
+})();
@@ -0,0 +1,37 @@
+import pytest
+from tests.stub_app.server import StubAppServer
+from tests.utils.auth_client import AuthClient, AuthClientError
+from tests.utils.session_stats import SessionStats
+
+
+@pytest.fixture
+def api():
+    with StubAppServer() as server:
+        with AuthClient(server.base_url, stats=SessionStats()) as client:
+            yield server, client
+
+
+class TestAuthClient:
+    """Pruebas del aprovisionamiento de usuarios por API contra la simulación local"""
+
+    def test_provision_user_returns_credentials_and_token(self, api):
+        """El usuario aprovisionado incluye sus credenciales y un token válido"""
+        server, client = api
+        user = client.provision_user()
+        assert user['email'] and user['password'] and user['name']
+        assert server.users.user_for_token(user['token']) == {'name': user['name'], 'email': user['email']}
+        assert user['user']['email'] == user['email']
+
+    def test_duplicate_user_is_rejected(self, api):
+        """Registrar dos veces el mismo correo debe fallar con el mensaje de la API"""
+        _, client = api
+        user = client.create_user()
+        with pytest.raises(AuthClientError, match="ya está registrado"):
+            client.create_user(email=user['email'])
+
+    def test_invalid_credentials_are_rejected(self, api):
+        """Iniciar sesión con una contraseña incorrecta debe fallar"""
+        _, client = api
+        user = client.create_user()
+        with pytest.raises(AuthClientError, match="credenciales"):
+            client.sign_in(user['email'], user['password'] + "x")
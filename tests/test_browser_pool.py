@@ -0,0 +1,71 @@
+from urllib3.exceptions import MaxRetryError
+
+from tests.utils.browser_pool import RESET_STORAGE_SCRIPT, STATS_SECTION, BrowserPool
+from tests.utils.fakes import FakeDriver
+from tests.utils.session_stats import SessionStats
+
+
+def make_pool(max_idle=1):
+    created = []
+    disposed = []
+
+    def factory():
+        created.append(FakeDriver())
+        created[-1].on_script(RESET_STORAGE_SCRIPT, None)
+        return created[-1]
+
+    pool = BrowserPool(factory, max_idle=max_idle, disposer=disposed.append, stats=SessionStats())
+    return pool, created, disposed
+
+
+class TestBrowserPool:
+    """Pruebas del pool de navegadores reutilizables"""
+
+    def test_miss_then_hit(self):
+        """El primer acquire crea un navegador y el siguiente reutiliza el devuelto"""
+        pool, created, _ = make_pool()
+        driver = pool.acquire()
+        pool.release(driver)
+        assert driver.visited == ['about:blank']
+        assert pool.acquire() is driver
+        assert len(created) == 1
+        assert pool._stats.get(STATS_SECTION, 'misses') == 1
+        assert pool._stats.get(STATS_SECTION, 'hits') == 1
+
+    def test_crashed_driver_is_recycled(self):
+        """Un chromedriver caído (error de urllib3) se descarta en lugar de volver al pool"""
+        pool, created, disposed = make_pool()
+        driver = pool.acquire()
+        driver.error = MaxRetryError(None, '/session', 'Connection refused')
+        pool.release(driver)
+        assert disposed == [driver]
+        assert driver.quit_calls == 1
+        assert pool._stats.get(STATS_SECTION, 'recycles') == 1
+        assert pool.acquire() is not driver
+        assert len(created) == 2
+
+    def test_explicit_recycle_skips_reset(self):
+        """Con ``recycle=True`` el navegador se cierra sin limpiarlo"""
+        pool, _, disposed = make_pool()
+        driver = pool.acquire()
+        pool.release(driver, recycle=True)
+        assert disposed == [driver]
+        assert driver.visited == []
+
+    def test_max_idle_limits_kept_drivers(self):
+        """Los navegadores que superan ``max_idle`` se cierran al devolverse"""
+        pool, _, disposed = make_pool(max_idle=1)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        assert disposed == [second]
+        assert pool._stats.get(STATS_SECTION, 'recycles') == 0
+
+    def test_close_disposes_idle_drivers(self):
+        """Al cerrar el pool se cierran los inactivos y no se aceptan más"""
+        pool, _, disposed = make_pool(max_idle=2)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.close()
+        pool.release(second)
+        assert disposed == [first, second]
@@ -0,0 +1,77 @@
+import os
+import socket
+
+import pytest
+
+from tests.utils.browser_resources import BrowserResourceAllocator, worker_index
+
+BASE_PORT = 41000
+
+
+def make_allocator(tmp_path, worker_id="gw0", ports_per_worker=5):
+    return BrowserResourceAllocator(
+        worker_id=worker_id, base_port=BASE_PORT, ports_per_worker=ports_per_worker, temp_root=str(tmp_path)
+    )
+
+
+@pytest.fixture
+def busy_port():
+    """Ocupa el primer puerto del rango del worker gw0"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', BASE_PORT))
+        sock.listen()
+        yield BASE_PORT
+
+
+class TestBrowserResourceAllocator:
+    """Pruebas de la asignación de puertos y perfiles por navegador"""
+
+    def test_worker_index(self, monkeypatch):
+        """El índice se lee del identificador del worker o de ``PYTEST_XDIST_WORKER``"""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        assert worker_index() == 0
+        assert worker_index("gw12") == 12
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        assert worker_index() == 3
+
+    def test_workers_use_disjoint_port_ranges(self, tmp_path):
+        """Cada worker asigna puertos de su propio rango"""
+        first = make_allocator(tmp_path, "gw0").allocate()
+        second = make_allocator(tmp_path, "gw2").allocate()
+        assert BASE_PORT <= first.port < BASE_PORT + 5
+        assert BASE_PORT + 10 <= second.port < BASE_PORT + 15
+        assert f"--remote-debugging-port={second.port}" in second.chrome_arguments()
+
+    def test_browsers_get_distinct_ports_and_profiles(self, tmp_path):
+        """Dos navegadores del mismo worker no comparten puerto ni perfil"""
+        allocator = make_allocator(tmp_path)
+        first, second = allocator.allocate(), allocator.allocate()
+        assert first.port != second.port
+        assert first.user_data_dir != second.user_data_dir
+        assert os.path.isdir(first.user_data_dir) and os.path.isdir(second.user_data_dir)
+
+    def test_busy_port_is_skipped(self, tmp_path, busy_port):
+        """Un puerto ocupado por otro proceso no se asigna"""
+        assert make_allocator(tmp_path).allocate().port != busy_port
+
+    def test_exhausted_range_falls_back_to_os_port(self, tmp_path, busy_port):
+        """Sin puertos libres en el rango se usa un puerto asignado por el sistema"""
+        resources = make_allocator(tmp_path, ports_per_worker=1).allocate()
+        assert resources.port != busy_port
+        assert not BASE_PORT <= resources.port < BASE_PORT + 1
+
+    def test_release_removes_profile_and_frees_port(self, tmp_path):
+        """Al liberar un navegador su perfil se elimina y el puerto vuelve a estar disponible"""
+        allocator = make_allocator(tmp_path, ports_per_worker=1)
+        resources = allocator.allocate()
+        allocator.release(resources)
+        assert not os.path.exists(resources.user_data_dir)
+        assert allocator.allocate().port == resources.port
+
+    def test_release_all(self, tmp_path):
+        """``release_all`` elimina los perfiles pendientes"""
+        allocator = make_allocator(tmp_path)
+        pending = [allocator.allocate(), allocator.allocate()]
+        allocator.release_all()
+        assert not any(os.path.exists(resources.user_data_dir) for resources in pending)
+        allocator.release(None)
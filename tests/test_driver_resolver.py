@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from tests.utils.driver_resolver import DRIVER_NAME, ChromeDriverResolver
+from tests.utils.session_stats import SessionStats
+
+CHROME_VERSION = "120.0.6099.109"
+
+
+def make_resolver(cache_dir, chrome_version=CHROME_VERSION, **kwargs):
+    resolver = ChromeDriverResolver(cache_dir=str(cache_dir), stats=SessionStats(), **kwargs)
+    # Sin Chrome instalado: la versión detectada se fija en la prueba
+    resolver._chrome_version = chrome_version
+    return resolver
+
+
+def cache_driver(cache_dir, version):
+    directory = cache_dir / version
+    directory.mkdir(parents=True)
+    path = directory / DRIVER_NAME
+    path.write_text("chromedriver")
+    return str(path)
+
+
+class FakeDownloader:
+    """Descarga simulada que crea un chromedriver en un directorio temporal"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        path = self.directory / DRIVER_NAME
+        path.write_text("chromedriver descargado")
+        return str(path)
+
+
+class TestChromeDriverResolver:
+    """Pruebas de la resolución de chromedriver con caché local"""
+
+    def test_uses_cached_driver_of_same_major_version(self, tmp_path):
+        """Se elige el driver más reciente de la misma versión mayor que Chrome"""
+        cache_driver(tmp_path, "119.0.6045.105")
+        older = cache_driver(tmp_path, "120.0.6099.71")
+        newer = cache_driver(tmp_path, "120.0.6099.109")
+        downloader = FakeDownloader(tmp_path)
+        resolver = make_resolver(tmp_path, downloader=downloader)
+        assert resolver.resolve() == newer != older
+        assert resolver.cache_hit
+        assert downloader.calls == 0
+
+    def test_downloads_when_only_other_major_is_cached(self, tmp_path):
+        """Un driver de otra versión mayor no sirve: se descarga uno y se guarda en la caché"""
+        cache = tmp_path / "cache"
+        cache_driver(cache, "119.0.6045.105")
+        downloads = tmp_path / "descargas"
+        downloads.mkdir()
+        downloader = FakeDownloader(downloads)
+        resolver = make_resolver(cache, downloader=downloader)
+        path = resolver.resolve()
+        assert downloader.calls == 1
+        assert not resolver.cache_hit
+        assert path == os.path.join(str(cache), CHROME_VERSION, DRIVER_NAME)
+        assert os.path.isfile(path)
+
+    def test_shared_resolution_is_reused(self, tmp_path):
+        """Otro worker reutiliza la resolución guardada en ``resolved.json``"""
+        cache = tmp_path / "cache"
+        downloads = tmp_path / "descargas"
+        downloads.mkdir()
+        first = make_resolver(cache, downloader=FakeDownloader(downloads))
+        path = first.resolve()
+        assert (cache / "resolved.json").exists()
+
+        downloader = FakeDownloader(downloads)
+        second = make_resolver(cache, downloader=downloader)
+        second._find_cached = lambda chrome_version: pytest.fail("No debe buscar en la caché")
+        assert second.resolve() == path
+        assert second.cache_hit
+        assert downloader.calls == 0
+
+    def test_chrome_update_invalidates_shared_resolution(self, tmp_path):
+        """Si cambia la versión de Chrome, ``resolved.json`` no se reutiliza"""
+        cache_driver(tmp_path, "119.0.6045.105")
+        make_resolver(tmp_path, chrome_version="119.0.6045.105").resolve()
+        newer = cache_driver(tmp_path, "120.0.6099.109")
+        assert make_resolver(tmp_path).resolve() == newer
+
+    def test_offline_without_cached_driver_fails_clearly(self, tmp_path):
+        """En modo offline sin driver compatible se informa el error sin descargar"""
+        cache_driver(tmp_path, "119.0.6045.105")
+        downloader = FakeDownloader(tmp_path)
+        resolver = make_resolver(tmp_path, offline=True, downloader=downloader)
+        with pytest.raises(RuntimeError, match="modo offline"):
+            resolver.resolve()
+        assert downloader.calls == 0
@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+
+from tests.utils.duration_scheduler import (
+    CACHE_KEY,
+    DurationHistory,
+    DurationScheduling,
+    affinity_group,
+    predict_makespan,
+)
+
+
+class FakeConfig:
+    def __init__(self, workers):
+        self.options = {"tx": ["popen"] * workers, "maxschedchunk": None}
+
+    def getvalue(self, name):
+        return self.options[name]
+
+    getoption = getvalue
+
+
+class FakeNode:
+    shutting_down = False
+
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+class FakeCache(dict):
+    def get(self, key, default):
+        return super().get(key, default)
+
+    def set(self, key, value):
+        self[key] = dict(value)
+
+
+def make_scheduler(durations, collection, workers=2):
+    scheduler = DurationScheduling(FakeConfig(workers), history=DurationHistory(durations))
+    nodes = [FakeNode(f"gw{i}") for i in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    return scheduler, nodes
+
+
+class TestDurationScheduler:
+    """Pruebas del reparto de pruebas de xdist por duración"""
+
+    def test_predict_makespan_longest_first(self):
+        """El makespan previsto reparte de la prueba más larga a la más corta"""
+        assert predict_makespan([5, 4, 3, 3, 3], 2) == 10
+        assert predict_makespan([1, 1, 1], 1) == 3
+
+    def test_longest_tests_are_sent_first(self):
+        """Cada worker recibe primero las pruebas más largas"""
+        collection = [f"tests/test_a.py::TestA::test_{i}" for i in range(6)]
+        durations = {nodeid: float(i) for i, nodeid in enumerate(collection)}
+        scheduler, nodes = make_scheduler(durations, collection)
+        sent = {collection[index] for node in nodes for index in node.sent}
+        assert sent == set(collection[2:])
+        assert scheduler.predicted == predict_makespan(durations.values(), 2)
+
+    def test_prefers_same_class_among_similar_durations(self):
+        """Entre pruebas de duración similar se prefiere la misma clase del worker"""
+        collection = [
+            "tests/test_login.py::TestLogin::test_largo",
+            "tests/test_register.py::TestRegister::test_a",
+            "tests/test_login.py::TestLogin::test_b",
+        ]
+        durations = {collection[0]: 10.0, collection[1]: 6.0, collection[2]: 5.5}
+        scheduler, nodes = make_scheduler(durations, collection, workers=1)
+        assert [collection[index] for index in nodes[0].sent] == collection[:1] + collection[2:3]
+
+    def test_history_moving_average(self):
+        """Las duraciones guardadas combinan la ejecución actual con las anteriores"""
+        cache = FakeCache({CACHE_KEY: {"a": 2.0}})
+        history = DurationHistory()
+        history.load(cache)
+        history.record("a", 3.0)
+        history.record("a", 1.0)
+        history.record("b", 1.5)
+        history.save(cache)
+        assert cache[CACHE_KEY] == {"a": 3.0, "b": 1.5}
+        assert history.estimate("nueva") == 2.0
+
+    def test_affinity_group_ignores_parameters(self):
+        assert affinity_group("tests/test_login.py::TestLogin::test_x[a::b]") == "tests/test_login.py::TestLogin"
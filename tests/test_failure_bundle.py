@@ -0,0 +1,74 @@
+import gzip
+import json
+import pytest
+from selenium.common.exceptions import WebDriverException
+from tests.utils.failure_bundle import DOM_SNAPSHOT_SCRIPT, FailureBundleCollector
+from tests.utils.session_stats import SessionStats
+
+
+def performance_entry(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def response_body(params):
+    if params['requestId'] == 'sin-cuerpo':
+        raise WebDriverException("No resource with given identifier found")
+    return {'body': '{"message": "Las credenciales ingresadas no son válidas"}'}
+
+
+@pytest.fixture
+def failed_page(fake_driver):
+    """Navegador simulado con una página que muestra un error de validación"""
+    fake_driver.on_script(DOM_SNAPSHOT_SCRIPT, {
+        'url': 'http://localhost/auth/sign-in', 'html': ['<form></form>'], 'errors': ['Campo obligatorio']
+    })
+    fake_driver.on_cdp('Network.getResponseBody', response_body)
+    fake_driver.logs['browser'] = [{'level': 'SEVERE', 'message': 'Error de prueba'}]
+    return fake_driver
+
+
+@pytest.fixture
+def collector(tmp_path):
+    collector = FailureBundleCollector(directory=str(tmp_path), mode='bundle', max_responses=2, stats=SessionStats())
+    collector.begin_test("test_prueba")
+    return collector
+
+
+class TestFailureBundle:
+    """Pruebas del paquete de diagnóstico de fallos"""
+
+    def test_bundle_contains_dom_console_and_last_responses(self, collector, failed_page):
+        """El paquete guarda el DOM, la consola y las últimas respuestas XHR"""
+        failed_page.logs['performance'] = [
+            performance_entry('Network.responseReceived', requestId='1', type='Document',
+                              response={'url': 'http://localhost/', 'status': 200}),
+            performance_entry('Network.responseReceived', requestId='2', type='XHR',
+                              response={'url': 'http://localhost/api/auth/me', 'status': 401}),
+            performance_entry('Network.requestWillBeSent', requestId='3'),
+            performance_entry('Network.responseReceived', requestId='sin-cuerpo', type='Fetch',
+                              response={'url': 'http://localhost/api/a', 'status': 200}),
+            performance_entry('Network.responseReceived', requestId='4', type='XHR',
+                              response={'url': 'http://localhost/api/auth/sign-in', 'status': 401}),
+        ]
+        path = collector.collect(failed_page, reason="Tiempo agotado")
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            bundle = json.load(f)
+
+        assert bundle['reason'] == "Tiempo agotado"
+        assert bundle['dom']['errors'] == ['Campo obligatorio']
+        assert bundle['console'][0]['message'] == 'Error de prueba'
+        assert [r['url'] for r in bundle['network']] == ['http://localhost/api/a', 'http://localhost/api/auth/sign-in']
+        assert 'body' not in bundle['network'][0]
+        assert 'credenciales' in bundle['network'][1]['body']
+
+    def test_one_bundle_per_test(self, collector, failed_page):
+        """Un segundo fallo en la misma prueba reutiliza el paquete anterior"""
+        first = collector.collect(failed_page)
+        assert collector.collect(failed_page) == first
+        collector.begin_test("otra_prueba")
+        assert collector.collect(failed_page) != first
+
+    def test_invalid_mode(self):
+        """Un modo desconocido se rechaza"""
+        with pytest.raises(ValueError):
+            FailureBundleCollector(mode='video', stats=SessionStats())
@@ -0,0 +1,80 @@
+import pytest
+
+from tests.page_objects.base_page import FILL_FORM_SCRIPT
+from tests.page_objects.login_page import LoginPage
+
+
+def fill_form_answer(values=None):
+    """Respuesta del navegador al script de llenado
+
+    Args:
+        values: Valor que el navegador lee de cada campo por su selector
+                (``None``: el campo no existe)
+    """
+    values = values or {}
+
+    def answer(specs):
+        result = {'values': [], 'missing': []}
+        for index, spec in enumerate(specs):
+            value = values.get(spec['value'], spec['text'])
+            if value is None:
+                result['missing'].append(index)
+            result['values'].append(value)
+        return result
+    return answer
+
+
+@pytest.fixture
+def form_driver(fake_driver):
+    """Navegador simulado que devuelve en cada campo el texto escrito"""
+    fake_driver.on_script(FILL_FORM_SCRIPT, fill_form_answer())
+    return fake_driver
+
+
+def sent_specs(driver):
+    return [args[0] for script, args in driver.executed if script == FILL_FORM_SCRIPT]
+
+
+def login_fields(email="usuario@inlaze.test", password="Clave#'1\""):
+    return [(LoginPage.EMAIL_INPUT, email), (LoginPage.PASSWORD_INPUT, password)]
+
+
+class TestFillForm:
+    """Pruebas del llenado de formularios en una sola llamada al navegador"""
+
+    def test_script_mode_fills_all_fields_in_one_call(self, form_driver):
+        """Todos los campos viajan como argumentos del script, sin escapar comillas"""
+        values = LoginPage(form_driver).fill_form(login_fields(), mode="script")
+        assert values == ["usuario@inlaze.test", "Clave#'1\""]
+        specs, = sent_specs(form_driver)
+        assert [(spec['by'], spec['value']) for spec in specs] == [
+            tuple(LoginPage.EMAIL_INPUT), tuple(LoginPage.PASSWORD_INPUT)
+        ]
+
+    def test_each_problem_is_reported_by_field(self, form_driver):
+        """Un campo inexistente y un valor distinto se informan por separado"""
+        form_driver.on_script(FILL_FORM_SCRIPT, fill_form_answer({
+            LoginPage.EMAIL_INPUT[1]: None,
+            LoginPage.PASSWORD_INPUT[1]: "recortada",
+        }))
+        login_page = LoginPage(form_driver)
+        with pytest.raises(Exception) as error:
+            login_page.fill_form(login_fields(), mode="script")
+        message = str(error.value)
+        assert f"{LoginPage.EMAIL_INPUT[1]}: no se encontró el campo" in message
+        assert f"{LoginPage.PASSWORD_INPUT[1]}: esperado 'Clave#\\'1\"', obtenido 'recortada'" in message
+        assert "esperado 'usuario@inlaze.test'" not in message
+
+    def test_keys_mode_types_each_field(self, form_driver):
+        """En modo ``keys`` cada campo se escribe con ``type_text``"""
+        login_page = LoginPage(form_driver)
+        typed = []
+        login_page.type_text = lambda by, value, text: typed.append((value, text))
+        assert login_page.fill_form(login_fields(), mode="keys") == ["usuario@inlaze.test", "Clave#'1\""]
+        assert typed == [(LoginPage.EMAIL_INPUT[1], "usuario@inlaze.test"), (LoginPage.PASSWORD_INPUT[1], "Clave#'1\"")]
+
+    def test_unknown_mode_is_rejected(self, form_driver):
+        """Un modo de llenado desconocido falla antes de tocar el navegador"""
+        with pytest.raises(ValueError, match="Modo de llenado no soportado"):
+            LoginPage(form_driver).fill_form(login_fields(), mode="pegar")
+        assert not sent_specs(form_driver)
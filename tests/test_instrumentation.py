@@ -0,0 +1,45 @@
+import json
+from selenium.webdriver.support import expected_conditions as EC
+from tests.page_objects.login_page import LoginPage
+from tests.utils.instrumentation import Instrumentation, describe_condition
+
+
+class TestInstrumentation:
+    """Pruebas de la medición de comandos y esperas"""
+
+    def test_commands_are_measured_only_during_a_test(self, tmp_path, fake_driver):
+        """Los comandos se miden mientras hay una prueba activa y se guardan en su perfil"""
+        instrumentation = Instrumentation(directory=str(tmp_path), enabled=True)
+        instrumentation.attach(fake_driver)
+        instrumentation.attach(fake_driver)
+
+        fake_driver.command_executor.execute('get', {})
+        instrumentation.begin_test("tests/test_login.py::TestLogin::test_a[x]")
+        fake_driver.command_executor.execute('findElements', {})
+        fake_driver.command_executor.execute('findElements', {})
+        instrumentation.record('esperas', 'LoginPage.LOGIN_FORM (presence_of_element_located)', 0.5, timed_out=True)
+        path = instrumentation.end_test("failed")
+
+        with open(path, encoding='utf-8') as f:
+            profile = json.load(f)
+        assert profile['outcome'] == "failed"
+        assert list(profile['comandos']) == ['findElements']
+        assert profile['comandos']['findElements']['count'] == 2
+        assert profile['esperas']['LoginPage.LOGIN_FORM (presence_of_element_located)']['timeouts'] == 1
+
+    def test_totals_merge_and_summary(self):
+        """Los totales de varios workers se combinan y se ordenan por tiempo"""
+        worker = Instrumentation(enabled=True)
+        worker._totals['esperas'] = {'lenta': [1, 2.0, 1, 2.0], 'rapida': [3, 0.3, 0, 0.0]}
+        main = Instrumentation(top_n=1)
+        main.merge(worker.as_dict())
+        main.merge(worker.as_dict())
+        (title, lines), = main.summary_lines()
+        assert "Esperas" in title
+        assert len(lines) == 1 and 'lenta' in lines[0] and 'timeouts: 2' in lines[0]
+
+    def test_describe_condition(self):
+        """Las esperas se identifican por localizador y condición"""
+        assert describe_condition(EC.presence_of_element_located(LoginPage.LOGIN_FORM)) == \
+            "LoginPage.LOGIN_FORM (presence_of_element_located)"
+        assert describe_condition(EC.url_contains("/sign-in")) == "url_contains '/sign-in'"
@@ -0,0 +1,70 @@
+import os
+
+from tests.utils.launch_profiles import HEADLESS_SHELL_ENV, PROFILES, ProfileTemplate
+from tests.utils.session_stats import SessionStats
+
+
+def make_template(tmp_path):
+    return ProfileTemplate(PROFILES["throughput"], "120.0.6099.109", "local", root=str(tmp_path), stats=SessionStats())
+
+
+def warm_profile(user_data_dir):
+    os.makedirs(os.path.join(user_data_dir, "Default", "Cache", "Cache_Data"))
+    with open(os.path.join(user_data_dir, "Default", "Cache", "Cache_Data", "data_0"), "w") as f:
+        f.write("recurso")
+    with open(os.path.join(user_data_dir, "Default", "Preferences"), "w") as f:
+        f.write("{}")
+    with open(os.path.join(user_data_dir, "SingletonLock"), "w") as f:
+        f.write("")
+
+
+class TestLaunchProfiles:
+    """Pruebas de los perfiles de arranque de Chrome"""
+
+    def test_throughput_disables_background_activity(self, monkeypatch):
+        """El perfil de rendimiento agrega los argumentos que desactivan la actividad en segundo plano"""
+        monkeypatch.delenv(HEADLESS_SHELL_ENV, raising=False)
+        monkeypatch.setenv("PATH", "")
+        default = PROFILES["default"].options().arguments
+        throughput = PROFILES["throughput"].options().arguments
+        assert set(default) < set(throughput)
+        assert "--disable-background-networking" in throughput
+        assert "--headless=new" in throughput
+
+    def test_headless_shell_replaces_chrome(self, monkeypatch, tmp_path):
+        """Con chrome-headless-shell instalado se usa ese binario sin ``--headless=new``"""
+        shell = tmp_path / "chrome-headless-shell"
+        shell.write_text("")
+        monkeypatch.setenv(HEADLESS_SHELL_ENV, str(shell))
+        options = PROFILES["throughput"].options()
+        assert options.binary_location == str(shell)
+        assert not any(argument.startswith("--headless") for argument in options.arguments)
+        assert PROFILES["default"].options().binary_location == ""
+
+    def test_template_is_built_once(self, tmp_path):
+        """La plantilla se crea una sola vez y se reutiliza"""
+        calls = []
+        template = make_template(tmp_path)
+        template.ensure(lambda directory: calls.append(warm_profile(directory)))
+        make_template(tmp_path).ensure(lambda directory: calls.append(warm_profile(directory)))
+        assert len(calls) == 1
+        assert template.ready
+
+    def test_clone_is_independent_of_template(self, tmp_path):
+        """El clon copia la caché y el resto del perfil y omite los bloqueos de Chrome"""
+        template = make_template(tmp_path / "plantillas")
+        template.ensure(warm_profile)
+        destination = tmp_path / "navegador"
+        destination.mkdir()
+        template.clone(str(destination))
+
+        cached = os.path.join("Default", "Cache", "Cache_Data", "data_0")
+        assert not os.path.samefile(destination / cached, os.path.join(template.path, cached))
+        with open(destination / cached, "r+") as f:
+            f.write("modificado")
+        with open(os.path.join(template.path, cached)) as f:
+            assert f.read() == "recurso", "Escribir en la caché del clon no debe alterar la plantilla"
+        preferences = destination / "Default" / "Preferences"
+        assert preferences.read_text() == "{}"
+        assert not (destination / "SingletonLock").exists()
+        assert not (destination / ".ready").exists()
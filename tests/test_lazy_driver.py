@@ -0,0 +1,48 @@
+from tests.utils.fakes import FakeDriver
+from tests.utils.lazy_driver import LazyDriver
+from tests.utils.session_stats import SessionStats
+
+
+class FakePool:
+    def __init__(self):
+        self.acquired = []
+
+    def acquire(self):
+        driver = FakeDriver()
+        self.acquired.append(driver)
+        return driver
+
+
+class TestLazyDriver:
+    """Pruebas del proxy que difiere la obtención del navegador"""
+
+    def test_attributes_do_not_acquire_browser(self):
+        """Asignar y leer atributos del framework no debe lanzar un navegador"""
+        pool = FakePool()
+        driver = LazyDriver(pool.acquire, stats=SessionStats())
+        driver.test_name = "prueba"
+        assert driver.test_name == "prueba"
+        assert driver.pending_navigation is None
+        assert not driver.materialized
+        assert not pool.acquired
+
+    def test_first_command_acquires_browser_once(self):
+        """El primer comando obtiene el navegador y le traslada los atributos"""
+        stats = SessionStats()
+        pool = FakePool()
+        driver = LazyDriver(pool.acquire, stats=stats)
+        driver.test_name = "prueba"
+        driver.get("http://localhost/a")
+        driver.get("http://localhost/b")
+        assert len(pool.acquired) == 1
+        assert driver.wrapped_driver is pool.acquired[0]
+        assert pool.acquired[0].test_name == "prueba"
+        assert pool.acquired[0].visited == ["http://localhost/a", "http://localhost/b"]
+        assert stats.get("lazy_driver", "navegadores usados") == 1
+
+    def test_attributes_set_after_materialize_reach_browser(self):
+        """Después de materializarse, los atributos se asignan al navegador real"""
+        driver = LazyDriver(FakeDriver, stats=SessionStats())
+        driver.materialize()
+        driver.fill_mode = "keys"
+        assert driver.wrapped_driver.fill_mode == "keys"
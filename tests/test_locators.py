@@ -0,0 +1,58 @@
+import pytest
+from selenium.webdriver.common.by import By
+from tests.page_objects.base_page import BasePage
+from tests.page_objects.locators import InvalidLocatorError, compile_locator, locator, registry
+from tests.page_objects.login_page import LoginPage
+from tests.page_objects.register_page import RegisterPage
+
+class TestLocators:
+    """Pruebas del registro de localizadores (no requieren navegador)"""
+
+    def test_page_object_locators_are_registered(self):
+        """Verificar que los localizadores de los page objects quedan registrados y compilados"""
+        assert registry.get("LoginPage.EMAIL_INPUT") is LoginPage.EMAIL_INPUT
+        assert registry.get("RegisterPage.NAME_ERROR") is RegisterPage.NAME_ERROR
+        for registered in registry:
+            assert ":contains(" not in registered[1], f"Localizador sin compilar: {registered!r}"
+
+    def test_contains_is_translated_to_xpath(self):
+        """Verificar la traducción de :contains() a XPath"""
+        by, value = compile_locator(By.CSS_SELECTOR, "mat-error:contains('correo'), .alert-error:contains('credenciales')")
+        assert by == By.XPATH
+        assert value == (
+            "//mat-error[contains(., 'correo')] | "
+            "//*[contains(concat(' ', normalize-space(@class), ' '), ' alert-error ')][contains(., 'credenciales')]"
+        )
+
+    def test_text_with_quotes_is_escaped(self):
+        """Verificar que los textos con comillas generan un literal XPath válido"""
+        _, value = compile_locator(By.CSS_SELECTOR, "p:contains(\"it's\")")
+        assert value == "//p[contains(., \"it's\")]"
+
+    def test_standard_css_is_kept(self):
+        """Verificar que los selectores CSS estándar no se modifican"""
+        selector = "app-sign-up-form app-password:nth-child(2) input[type='password']"
+        assert compile_locator(By.CSS_SELECTOR, selector) == (By.CSS_SELECTOR, selector)
+
+    @pytest.mark.parametrize("by,value", [
+        (By.CSS_SELECTOR, "div:visible"),
+        (By.CSS_SELECTOR, "div >"),
+        (By.CSS_SELECTOR, "input[type='email'"),
+        (By.CSS_SELECTOR, ""),
+        (By.XPATH, "//div[@class='x'"),
+    ])
+    def test_invalid_locators_fail_immediately(self, by, value):
+        """Verificar que los localizadores inválidos se rechazan al declararse"""
+        with pytest.raises(InvalidLocatorError):
+            locator(by, value)
+
+
+class TestWaitForAny:
+    """Pruebas de la espera del primero de varios elementos"""
+
+    def test_returns_declared_locator(self, fake_driver):
+        """Se devuelve el localizador indicado, no su forma compilada"""
+        contains = locator(By.CSS_SELECTOR, "mat-error:contains('credenciales')")
+        fake_driver.present = {compile_locator(*contains)}
+        page = BasePage(fake_driver)
+        assert page.wait_for_any(LoginPage.USER_NAME_DISPLAY, contains, timeout=1) is contains
@@ -1,9 +1,7 @@
 import pytest
-from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from tests.page_objects.login_page import LoginPage
-from tests.page_objects.register_page import RegisterPage
-from tests.utils.test_data import TestDataGenerator, get_login_test_data
+from tests.utils.test_data import get_login_test_data
 
 class TestLogin:
     """Pruebas de funcionalidad de inicio de sesión"""
@@ -21,6 +19,7 @@ class TestLogin:
             assert not success, f"El login fue exitoso con contraseña inválida: {validation['password']}"
             assert validation['expected_error'] in error, \
                 f"Error esperado: {validation['expected_error']}, Error obtenido: {error}"
+            login_page.reset_form()
         
         password = valid_user['password']
         login_page.type_text(*login_page.PASSWORD_INPUT, password)
@@ -50,8 +49,11 @@ class TestLogin:
         assert error_msg and expected_error.lower() in error_msg.lower(), \
             f"Error esperado: {expected_error}, Error obtenido: {error_msg}"
 
-    def test_invalid_credentials(self, driver):
+    def test_invalid_credentials(self, driver, response_stubs):
         """Verificar el manejo de credenciales inválidas"""
+        sign_in = response_stubs.add(
+            'POST', '/auth/sign-in', 401, {'message': 'Las credenciales ingresadas no son válidas'}
+        )
         login_page = LoginPage(driver)
         login_page.navigate()
         
@@ -61,28 +63,15 @@ class TestLogin:
         assert not success, "El inicio de sesión no debería ser exitoso con credenciales inválidas"
         assert error_msg and "Las credenciales ingresadas no son válidas" in error_msg, \
             f"Error inesperado: {error_msg}"
+        assert len(sign_in.hits) == 1, f"Se esperaba una petición de inicio de sesión: {sign_in.hits}"
 
-    def test_logout_functionality(self, driver):
+    def test_logout_functionality(self, driver, authenticated_user):
         """Verificar la funcionalidad de cierre de sesión"""
-        register_page = RegisterPage(driver)
-        register_page.navigate()
-        datos_usuario = TestDataGenerator.generar_usuario_prueba()
-        success, _ = register_page.register(
-            datos_usuario['name'],
-            datos_usuario['email'],
-            datos_usuario['password'],
-            datos_usuario['password']
-        )
-        assert success, "No se pudo registrar el usuario de prueba. Por favor, verifica los datos e intenta nuevamente."
-        
         login_page = LoginPage(driver)
-        login_page.navigate()
-        success, _ = login_page.login(datos_usuario['email'], datos_usuario['password'])
-        assert success, "No se pudo iniciar sesión con las credenciales proporcionadas. Por favor, verifica e intenta nuevamente."
         
         nombre_mostrado = login_page.get_user_name()
-        assert nombre_mostrado == datos_usuario['name'], \
-            f"El nombre mostrado no coincide. Esperado: {datos_usuario['name']}, Obtenido: {nombre_mostrado}"
+        assert nombre_mostrado == authenticated_user['name'], \
+            f"El nombre mostrado no coincide. Esperado: {authenticated_user['name']}, Obtenido: {nombre_mostrado}"
         
         login_page.logout()
         assert login_page._wait_for_condition(
@@ -90,10 +79,8 @@ class TestLogin:
             message="No se pudo redireccionar a la página de inicio de sesión"
         )
         
-        try:
-            assert not login_page.get_user_name(), "La sesión no se cerró correctamente. El nombre de usuario sigue siendo visible."
-        except TimeoutException:
-            pass
+        assert login_page.is_element_absent(*login_page.USER_NAME_DISPLAY), \
+            "La sesión no se cerró correctamente. El nombre de usuario sigue siendo visible."
 
     def test_navigation_to_register(self, driver):
         """Verificar la navegación entre páginas de registro e inicio de sesión"""
@@ -0,0 +1,79 @@
+import pytest
+
+from tests.page_objects import base_page
+from tests.page_objects.base_page import BasePage, SOFT_NAVIGATE_SCRIPT, WAIT_FOR_ANGULAR_SCRIPT
+
+
+@pytest.fixture
+def app_driver(fake_driver):
+    """Navegador simulado con la aplicación cargada: el router navega sin recargar"""
+    def route(origin, path, app_selector):
+        fake_driver.current_url = f"{origin}{path}"
+
+    fake_driver.on_script(SOFT_NAVIGATE_SCRIPT, route)
+    return fake_driver
+
+
+def angular_states(driver, *states):
+    """Responder a la espera de Angular con ``states``; el último se repite"""
+    states = list(states)
+    driver.on_script(WAIT_FOR_ANGULAR_SCRIPT, lambda *args: states.pop(0) if len(states) > 1 else states[0])
+
+
+def calls_to(driver, script):
+    return [args for executed, args in driver.executed if executed == script]
+
+
+class TestSoftNavigation:
+    """Pruebas de la navegación dentro de la aplicación ya cargada"""
+
+    def test_routes_inside_loaded_app(self, app_driver):
+        """Con la aplicación cargada se navega con el router, sin recargar"""
+        verified = []
+        BasePage(app_driver).navigate_to("/auth/sign-up", verify=lambda: verified.append(True))
+        routed = calls_to(app_driver, SOFT_NAVIGATE_SCRIPT)
+        assert routed and routed[0][1].endswith("/auth/sign-up")
+        assert not app_driver.visited
+        assert verified == [True]
+
+    def test_falls_back_to_full_load(self, app_driver):
+        """Si la aplicación no puede navegar sola se recarga la página"""
+        app_driver.on_script(SOFT_NAVIGATE_SCRIPT, "aplicación no cargada")
+        BasePage(app_driver).navigate_to("/auth/sign-in", verify=lambda: None)
+        assert app_driver.visited == [f"{BasePage.BASE_URL}/auth/sign-in"]
+
+    def test_full_mode_always_reloads(self, app_driver):
+        """En modo ``full`` no se intenta navegar con el router"""
+        app_driver.navigation_mode = "full"
+        BasePage(app_driver).navigate_to("/auth/sign-in", verify=lambda: None)
+        assert not calls_to(app_driver, SOFT_NAVIGATE_SCRIPT)
+        assert app_driver.visited == [f"{BasePage.BASE_URL}/auth/sign-in"]
+
+
+class TestAngularReadiness:
+    """Pruebas de la espera de estabilidad de Angular"""
+
+    def test_waits_until_stable(self, fake_driver):
+        """La consulta se repite mientras Angular tiene tareas pendientes"""
+        angular_states(fake_driver, "ocupada", "ocupada", "estable")
+        page = BasePage(fake_driver)
+        page.wait = base_page.WebDriverWait(fake_driver, page.TIMEOUT, poll_frequency=0.01)
+        assert page.wait_for_angular() is True
+        assert len(calls_to(fake_driver, WAIT_FOR_ANGULAR_SCRIPT)) == 3
+
+    def test_without_testability_waits_for_dom_once(self, fake_driver):
+        """Sin la API de testability se espera por el DOM y no se vuelve a consultar"""
+        fake_driver.navigation_mode = "full"
+        angular_states(fake_driver, "sin testability")
+        page = BasePage(fake_driver)
+        page.navigate_to("/auth/sign-in", verify=lambda: None)
+        assert fake_driver.angular_testability is False
+        assert page.wait_for_angular() is False
+        assert len(calls_to(fake_driver, WAIT_FOR_ANGULAR_SCRIPT)) == 1
+
+    def test_dom_readiness_skips_angular(self, fake_driver):
+        """Con ``readiness`` ``dom`` no se consulta a Angular"""
+        fake_driver.navigation_mode = "full"
+        fake_driver.readiness = "dom"
+        BasePage(fake_driver).navigate_to("/auth/sign-in", verify=lambda: None)
+        assert not calls_to(fake_driver, WAIT_FOR_ANGULAR_SCRIPT)
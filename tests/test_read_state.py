@@ -0,0 +1,81 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from tests.page_objects.base_page import READ_STATE_SCRIPT
+from tests.page_objects.locators import compile_locator, locator
+from tests.page_objects.login_page import LoginPage
+
+
+def read_state_answer(elements):
+    """Respuesta del navegador al script de lectura
+
+    Args:
+        elements: ``selector -> dict`` con los atributos de cada elemento
+                  presente; los ausentes devuelven None (o ``[]`` en ``texts``)
+    """
+    def answer(specs):
+        result = {}
+        for spec in specs:
+            element = elements.get(spec['value'])
+            entry = {'present': element is not None, 'count': 1 if element is not None else 0}
+            for attribute in spec['attributes']:
+                default = [] if attribute == 'texts' else None
+                entry[attribute] = (element or {}).get(attribute, default)
+            result[spec['name']] = entry
+        return result
+    return answer
+
+
+@pytest.fixture
+def state_driver(fake_driver):
+    """Navegador simulado sin elementos en el que ``read_state`` no debe esperar"""
+    def no_waits(by, value):
+        pytest.fail("read_state no debe esperar elementos")
+
+    fake_driver.find_element = fake_driver.find_elements = no_waits
+    fake_driver.on_script(READ_STATE_SCRIPT, read_state_answer({}))
+    return fake_driver
+
+
+def read_calls(driver):
+    return [args[0] for script, args in driver.executed if script == READ_STATE_SCRIPT]
+
+
+class TestReadState:
+    """Pruebas de la lectura del estado de varios elementos en una sola llamada"""
+
+    def test_builds_one_spec_per_field(self, state_driver):
+        """Cada campo se envía con su nombre, su localizador compilado y sus atributos"""
+        contains = locator(By.CSS_SELECTOR, "mat-error:contains('correo')")
+        LoginPage(state_driver).read_state({
+            'email': (LoginPage.EMAIL_INPUT, ['value', 'class']),
+            'errores': (contains, ('texts',)),
+        })
+        by, value = compile_locator(*contains)
+        assert by == By.XPATH
+        calls = read_calls(state_driver)
+        assert len(calls) == 1
+        assert calls[0] == [
+            {'name': 'email', 'by': LoginPage.EMAIL_INPUT[0], 'value': LoginPage.EMAIL_INPUT[1], 'attributes': ['value', 'class']},
+            {'name': 'errores', 'by': By.XPATH, 'value': value, 'attributes': ['texts']},
+        ]
+
+    def test_field_state_from_single_read(self, state_driver):
+        """El valor, la validez y el error de un campo salen de una sola lectura"""
+        state_driver.on_script(READ_STATE_SCRIPT, read_state_answer({
+            LoginPage.EMAIL_INPUT[1]: {'value': 'usuario@', 'class': 'ng-touched ng-invalid'},
+            LoginPage.EMAIL_ERROR[1]: {'texts': ['Ingresa un correo válido']},
+        }))
+        state = LoginPage(state_driver).get_field_validation_state(LoginPage.EMAIL_INPUT)
+        assert state == {'valor': 'usuario@', 'es_valido': False, 'mensaje_error': 'Ingresa un correo válido'}
+        assert len(read_calls(state_driver)) == 1
+
+    def test_missing_field_is_reported(self, state_driver):
+        """Un campo ausente se informa con ``present`` en False"""
+        with pytest.raises(NoSuchElementException, match="No se encontró el elemento"):
+            LoginPage(state_driver).get_field_validation_state(LoginPage.EMAIL_INPUT)
+
+    def test_no_errors_when_nothing_is_visible(self, state_driver):
+        """Sin mensajes visibles no hay error"""
+        assert LoginPage(state_driver).get_error_message() is None
@@ -3,6 +3,50 @@ from selenium.webdriver.support import expected_conditions as EC
 from tests.page_objects.register_page import RegisterPage
 from tests.utils.test_data import TestDataGenerator, get_registro_test_data
 
+# Casos de validación del registro: el identificador del caso es fijo y los
+# datos aleatorios se generan dentro de la prueba, para que los workers de
+# xdist recolecten los mismos nodos de prueba
+CASOS_VALIDACION = {
+    "campos_vacios": ("Todos los campos son obligatorios", lambda: ("", "", "", "")),
+    "nombre_incompleto": (
+        "El nombre debe contener nombre y apellido",
+        lambda: (TestDataGenerator.generar_nombre(1), "", "", "")
+    ),
+    "correo_vacio": (
+        "El correo electrónico es obligatorio",
+        lambda: (TestDataGenerator.generar_nombre(), "", "", "")
+    ),
+    "correo_invalido": (
+        "El formato del correo electrónico no es válido",
+        lambda: (TestDataGenerator.generar_nombre(), "correo.invalido", "", "")
+    ),
+    "password_corta": (
+        "La contraseña debe tener al menos 8 caracteres",
+        lambda: _datos_con_password(TestDataGenerator.generar_password_invalido('longitud'))
+    ),
+    "password_sin_mayuscula": (
+        "La contraseña debe contener al menos una mayúscula",
+        lambda: _datos_con_password(TestDataGenerator.generar_password_invalido('mayuscula'))
+    ),
+    "password_sin_especial": (
+        "La contraseña debe contener al menos un carácter especial",
+        lambda: _datos_con_password(TestDataGenerator.generar_password_invalido('especial'))
+    ),
+    "passwords_distintas": (
+        "Las contraseñas no coinciden",
+        lambda: _datos_con_password(TestDataGenerator.generar_password_valido(), "Password124!")
+    ),
+}
+
+
+def _datos_con_password(password, confirm_password=None):
+    return (
+        TestDataGenerator.generar_nombre(),
+        TestDataGenerator.generar_email(),
+        password,
+        password if confirm_password is None else confirm_password
+    )
+
 class TestRegister:
     """Pruebas de funcionalidad de registro de usuarios"""
 
@@ -27,18 +71,11 @@ class TestRegister:
             message="No se pudo verificar la redirección después del registro. Por favor, verifica la URL."
         )
 
-    @pytest.mark.parametrize("name,email,password,confirm_password,expected_error", [
-        ("", "", "", "", "Todos los campos son obligatorios"),
-        (TestDataGenerator.generar_nombre(1), "", "", "", "El nombre debe contener nombre y apellido"),
-        (TestDataGenerator.generar_nombre(), "", "", "", "El correo electrónico es obligatorio"),
-        (TestDataGenerator.generar_nombre(), "correo.invalido", "", "", "El formato del correo electrónico no es válido"),
-        (TestDataGenerator.generar_nombre(), TestDataGenerator.generar_email(), TestDataGenerator.generar_password_invalido('longitud'), TestDataGenerator.generar_password_invalido('longitud'), "La contraseña debe tener al menos 8 caracteres"),
-        (TestDataGenerator.generar_nombre(), TestDataGenerator.generar_email(), TestDataGenerator.generar_password_invalido('mayuscula'), TestDataGenerator.generar_password_invalido('mayuscula'), "La contraseña debe contener al menos una mayúscula"),
-        (TestDataGenerator.generar_nombre(), TestDataGenerator.generar_email(), TestDataGenerator.generar_password_invalido('especial'), TestDataGenerator.generar_password_invalido('especial'), "La contraseña debe contener al menos un carácter especial"),
-        (TestDataGenerator.generar_nombre(), TestDataGenerator.generar_email(), TestDataGenerator.generar_password_valido(), "Password124!", "Las contraseñas no coinciden")
-    ])
-    def test_registration_validation(self, driver, name, email, password, confirm_password, expected_error):
+    @pytest.mark.parametrize("caso", list(CASOS_VALIDACION))
+    def test_registration_validation(self, driver, caso):
         """Verificar las validaciones del formulario de registro con diferentes casos"""
+        expected_error, generar_datos = CASOS_VALIDACION[caso]
+        name, email, password, confirm_password = generar_datos()
         register_page = RegisterPage(driver)
         register_page.navigate()
         
@@ -48,25 +85,18 @@ class TestRegister:
         assert error_msg and expected_error.lower() in error_msg.lower(), \
             f"Validación incorrecta\nEsperado: {expected_error}\nObtenido: {error_msg}"
 
-    def test_duplicate_email_registration(self, driver):
+    def test_duplicate_email_registration(self, driver, response_stubs):
         """Verificar que no se permita registrar un correo electrónico duplicado"""
+        sign_up = response_stubs.add(
+            'POST', '/auth/sign-up', 409, {'message': 'Este correo electrónico ya está registrado'}
+        )
         register_page = RegisterPage(driver)
         register_page.navigate()
         
-        test_data = get_registro_test_data()['valid_user']
-        success, mensaje = register_page.register(
-            test_data['name'],
-            test_data['email'],
-            test_data['password'],
-            test_data['confirm_password']
-        )
-        assert success, f"No se pudo completar el registro con datos válidos\nError: {mensaje}\nPor favor, verifica los datos e intenta nuevamente."
-        
-        register_page.navigate()
         otro_usuario = TestDataGenerator.generar_usuario_prueba()
         success, error_msg = register_page.register(
             otro_usuario['name'],
-            test_data['email'],
+            otro_usuario['email'],
             otro_usuario['password'],
             otro_usuario['password']
         )
@@ -74,13 +104,14 @@ class TestRegister:
         assert not success, "El registro permitió un correo electrónico que ya está en uso"
         assert error_msg and "correo electrónico ya está registrado" in error_msg.lower(), \
             f"Validación incorrecta de correo duplicado\nEsperado: 'Este correo electrónico ya está registrado en el sistema'\nObtenido: {error_msg}"
+        assert [hit['method'] for hit in sign_up.hits] == ['POST'], f"Peticiones de registro inesperadas: {sign_up.hits}"
 
     def test_password_requirements(self, driver):
         """Verificar los requisitos de seguridad para las contraseñas"""
         register_page = RegisterPage(driver)
         register_page.navigate()
         
-        test_data = get_registro_test_data()['valid_user']
+        test_data = TestDataGenerator.generar_usuario_prueba()
         
         test_cases = [
             (TestDataGenerator.generar_password_invalido('longitud'), "La contraseña debe tener al menos 8 caracteres"),
@@ -104,11 +135,10 @@ class TestRegister:
                     f"El registro fue exitoso con una contraseña inválida: {password}"
                 assert error_msg and expected_error.lower() in error_msg.lower(), \
                     f"Validación incorrecta para '{password}'\nEsperado: {expected_error}\nObtenido: {error_msg}"
+                register_page.reset_form()
             else:
                 assert success, \
                     f"El registro falló con una contraseña que cumple todos los requisitos: {password}"
-            
-            register_page.navigate()
 
     def test_navigation_to_login(self, driver):
         """Verificar la navegación desde registro hacia inicio de sesión"""
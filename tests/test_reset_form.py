@@ -0,0 +1,66 @@
+import pytest
+
+from tests.page_objects.base_page import BasePage, RESET_FORM_SCRIPT
+from tests.page_objects.login_page import LoginPage
+
+PRISTINE = "ng-untouched ng-pristine ng-valid"
+
+
+@pytest.fixture
+def login_driver(fake_driver):
+    """Navegador simulado en la página de inicio de sesión"""
+    fake_driver.current_url = f"{BasePage.BASE_URL}/auth/sign-in"
+    return fake_driver
+
+
+def reset_states(driver, *states):
+    """Responder al script de reinicio con ``states``, en orden"""
+    states = list(states)
+    driver.on_script(RESET_FORM_SCRIPT, lambda *args: states.pop(0))
+
+
+def resets(driver):
+    return [args[2] for script, args in driver.executed if script == RESET_FORM_SCRIPT]
+
+
+def form_state(method, value="", classes=PRISTINE, errors=0):
+    return {
+        'method': method,
+        'fields': [{'name': 'email', 'value': value, 'classes': classes}],
+        'errors': errors,
+    }
+
+
+class TestResetForm:
+    """Pruebas del reinicio de formularios sin recargar la página"""
+
+    def test_resets_with_angular_api(self, login_driver):
+        """Con la API ``ng`` el formulario se reinicia en una sola llamada"""
+        reset_states(login_driver, form_state('FormGroup.reset'))
+        assert LoginPage(login_driver).reset_form() == 'FormGroup.reset'
+        assert resets(login_driver) == [True]
+        assert not login_driver.visited
+
+    def test_resets_with_dom_events_without_angular_api(self, login_driver):
+        """Sin la API ``ng`` se reinicia con eventos del DOM y ``form.reset()``, sin recargar"""
+        reset_states(login_driver, form_state('form.reset'))
+        assert LoginPage(login_driver).reset_form() == 'form.reset'
+        assert resets(login_driver) == [True]
+        assert not login_driver.visited
+
+    def test_reloads_when_dom_reset_is_incomplete(self, login_driver):
+        """Si el reinicio por el DOM no deja el formulario limpio se recarga la página"""
+        reset_states(login_driver, form_state('form.reset', classes="ng-touched ng-pristine"), form_state(None))
+        login_driver.navigation_mode = "full"
+        login_page = LoginPage(login_driver)
+        login_page._verify_loaded = lambda: None
+        assert login_page.reset_form() == 'recarga'
+        assert resets(login_driver) == [True, False]
+        assert login_driver.visited == [f"{BasePage.BASE_URL}/auth/sign-in"]
+
+    def test_dirty_form_fails_verification(self, login_driver):
+        """Un campo que conserva valor o errores hace fallar el reinicio"""
+        reset_states(login_driver, form_state('FormGroup.reset', value="x", classes="ng-touched ng-dirty", errors=1))
+        login_page = LoginPage(login_driver)
+        with pytest.raises(Exception, match="No se pudo reiniciar el formulario"):
+            login_page.reset_form()
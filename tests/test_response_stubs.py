@@ -0,0 +1,112 @@
+import base64
+import json
+
+import pytest
+import trio
+from selenium.webdriver.common.devtools import v120
+
+from tests.page_objects.base_page import BasePage
+from tests.page_objects.login_page import LoginPage
+from tests.utils.response_stubs import ResponseStub, ResponseStubs
+from tests.utils.session_stats import SessionStats
+
+SIGN_IN_URL = "http://127.0.0.1:8000/api/auth/sign-in"
+
+
+def make_stubs():
+    return ResponseStubs(driver=None, stats=SessionStats())
+
+
+def declare(response_stubs, method, path, status, body=None):
+    # Sin abrir la conexión DevTools: solo se prueba cómo se responden las peticiones
+    stub = ResponseStub(method, path, status, body)
+    response_stubs.stubs.append(stub)
+    return stub
+
+
+class FakeSession:
+    """Sesión DevTools que registra los comandos enviados"""
+
+    def __init__(self):
+        self.commands = []
+
+    async def execute(self, command):
+        self.commands.append(next(command))
+
+
+class TestResponseStubs:
+    """Pruebas de las respuestas simuladas del backend"""
+
+    def test_matching_request_is_fulfilled_and_recorded(self):
+        """Una petición que coincide recibe la respuesta declarada y queda registrada"""
+        stubs = make_stubs()
+        stub = declare(stubs, "POST", "/auth/sign-in", 401, {"message": "Credenciales no válidas"})
+        status, headers, body = stubs.response_for("POST", SIGN_IN_URL, {"Origin": "http://127.0.0.1:8000"})
+        assert status == 401
+        assert json.loads(base64.b64decode(body)) == {"message": "Credenciales no válidas"}
+        assert headers["Access-Control-Allow-Origin"] == "http://127.0.0.1:8000"
+        assert stub.hits == [{"method": "POST", "url": SIGN_IN_URL}]
+        assert stubs.unused() == []
+
+    def test_other_requests_continue(self):
+        """Las peticiones de otro método o ruta llegan al backend"""
+        stubs = make_stubs()
+        stub = declare(stubs, "POST", "/auth/sign-in", 401)
+        assert stubs.response_for("GET", SIGN_IN_URL, {}) is None
+        assert stubs.response_for("POST", "http://127.0.0.1:8000/api/auth/sign-up", {}) is None
+        assert stubs.unused() == [stub]
+
+    def test_preflight_is_answered_without_hit(self):
+        """La solicitud CORS previa se responde sin contar como uso de la respuesta"""
+        stubs = make_stubs()
+        stub = declare(stubs, "POST", "/auth/sign-up", 409)
+        status, headers, _ = stubs.response_for("OPTIONS", "https://api.example.com/auth/sign-up", {})
+        assert status == 204
+        assert headers["Access-Control-Allow-Methods"] == "POST"
+        assert stub.hits == []
+
+    def test_last_declared_stub_wins(self):
+        """Si varias respuestas coinciden se usa la última declarada"""
+        stubs = make_stubs()
+        declare(stubs, "POST", "/auth/*", 500)
+        declare(stubs, "POST", "/auth/sign-in", 401)
+        assert stubs.response_for("POST", SIGN_IN_URL, {})[0] == 401
+
+    def test_only_api_calls_are_intercepted(self):
+        """Los patrones del dominio Fetch se limitan a XHR, fetch y solicitudes CORS previas"""
+        stubs = make_stubs()
+        declare(stubs, "POST", "/auth/sign-in", 401)
+        stubs._devtools = v120
+        stubs._session = FakeSession()
+        trio.run(stubs._enable)
+        [command] = stubs._session.commands
+        assert command["method"] == "Fetch.enable"
+        patterns = command["params"]["patterns"]
+        assert {pattern["resourceType"] for pattern in patterns} == {"XHR", "Fetch", "Preflight"}
+        assert {pattern["urlPattern"] for pattern in patterns} == {"*/auth/sign-in*"}
+
+
+@pytest.mark.skipif("config.getoption('--base-url') != 'local'", reason="requiere --base-url=local")
+class TestResponseStubsInBrowser:
+    """Pruebas de las respuestas simuladas en Chrome contra la aplicación simulada local"""
+
+    def test_stubbed_response_never_reaches_backend(self, driver, response_stubs, pooled_user):
+        """Un usuario válido no inicia sesión si ``sign-in`` se simula con 401"""
+        sign_in = response_stubs.add("POST", "/auth/sign-in", 401, {"message": "Respuesta simulada"})
+        login_page = LoginPage(driver)
+        login_page.navigate()
+        success, error_msg = login_page.login(pooled_user["email"], pooled_user["password"])
+        assert not success, "La petición llegó al backend en lugar de recibir la respuesta simulada"
+        assert error_msg == "Respuesta simulada"
+        assert [hit["method"] for hit in sign_in.hits] == ["POST"]
+
+    def test_documents_and_unmatched_calls_pass_through(self, driver, response_stubs, pooled_user):
+        """La carga de una página con la ruta simulada y las demás llamadas llegan al servidor"""
+        document = response_stubs.add("GET", "/auth/sign-in", 500, "Documento simulado")
+        response_stubs.add("POST", "/auth/sign-up", 409, {"message": "Respuesta simulada"})
+        login_page = LoginPage(driver)
+        driver.get(f"{BasePage.BASE_URL}/auth/sign-in")
+        login_page.navigate()
+        success, message = login_page.login(pooled_user["email"], pooled_user["password"])
+        assert success, f"El inicio de sesión no llegó al backend: {message}"
+        assert document.hits == [], "La carga del documento no debe interceptarse"
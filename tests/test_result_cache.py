@@ -0,0 +1,114 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from tests.stub_app import server
+from tests.utils.result_cache import CACHE_KEY, ResultCache, module_closure
+from tests.utils.session_stats import SessionStats
+
+
+def sample_test():
+    assert True
+
+
+class FakeCache(dict):
+    def get(self, key, default):
+        return super().get(key, default)
+
+    def set(self, key, value):
+        self[key] = dict(value)
+
+
+def make_item(params=None):
+    return SimpleNamespace(
+        nodeid="tests/test_result_cache.py::sample_test",
+        function=sample_test,
+        module=sys.modules[__name__],
+        callspec=SimpleNamespace(params=params) if params is not None else None,
+        user_properties=[],
+        iter_markers=lambda: [],
+    )
+
+
+def make_report(item, when, outcome):
+    return SimpleNamespace(
+        nodeid=item.nodeid,
+        when=when,
+        passed=outcome == "passed",
+        failed=outcome == "failed",
+        user_properties=list(item.user_properties),
+    )
+
+
+def make_cache(cache, fingerprint="v1"):
+    result_cache = ResultCache(stats=SessionStats())
+    result_cache.configure(True, "local", fingerprint, cache)
+    return result_cache
+
+
+class TestResultCache:
+    """Pruebas de la caché de resultados por contenido"""
+
+    def test_key_depends_on_params_and_fingerprint(self):
+        """La clave cambia con los parámetros y con la huella de la aplicación"""
+        cache = make_cache(FakeCache())
+        key = cache.key_for(make_item({"email": "a@b.co"}))
+        assert key == cache.key_for(make_item({"email": "a@b.co"}))
+        assert key != cache.key_for(make_item({"email": "otro@b.co"}))
+        assert key != make_cache(FakeCache(), "v2").key_for(make_item({"email": "a@b.co"}))
+
+    def test_passed_test_is_reused_until_inputs_change(self):
+        """Una prueba que pasó se reutiliza en la siguiente ejecución con las mismas entradas"""
+        store = FakeCache()
+        first = make_cache(store)
+        item = make_item()
+        assert first.lookup(item) is None
+        for when in ("setup", "call", "teardown"):
+            first.record(make_report(item, when, "passed"))
+        first.save(store)
+
+        assert make_cache(store).lookup(make_item()) is not None
+        assert make_cache(store, "v2").lookup(make_item()) is None
+
+    def test_key_depends_on_stub_assets_and_options(self, monkeypatch, tmp_path):
+        """Con la simulación local la clave cambia con sus archivos estáticos y sus opciones"""
+        (tmp_path / "app.js").write_text("v1")
+        monkeypatch.setattr(server, "STATIC_DIR", str(tmp_path))
+
+        def stub_key(latency_ms=0):
+            cache = ResultCache(stats=SessionStats())
+            details = {"static": server.static_fingerprint(), "latency_ms": latency_ms, "error_rate": 0}
+            cache.configure(True, "local", None, FakeCache(), details)
+            return cache.key_for(make_item())
+
+        key = stub_key()
+        assert key == stub_key()
+        assert key != stub_key(latency_ms=300)
+        (tmp_path / "app.js").write_text("v2")
+        assert key != stub_key()
+
+    def test_real_app_requires_fingerprint(self):
+        """Contra la aplicación real la caché no se activa sin huella de compilación"""
+        with pytest.raises(ValueError, match="--app-fingerprint"):
+            ResultCache(stats=SessionStats()).configure(True, "https://test-qa.inlaze.com", None, FakeCache())
+        disabled = ResultCache(stats=SessionStats())
+        disabled.configure(False, "https://test-qa.inlaze.com", None, FakeCache())
+        assert not disabled.enabled
+
+    def test_failure_removes_entry(self):
+        """Un fallo elimina el resultado guardado de la prueba"""
+        item = make_item()
+        store = FakeCache({CACHE_KEY: {item.nodeid: {"key": "anterior", "passed_at": "2024-01-01"}}})
+        cache = make_cache(store)
+        cache.lookup(item)
+        cache.record(make_report(item, "call", "failed"))
+        cache.save(store)
+        assert item.nodeid not in store[CACHE_KEY]
+
+    def test_module_closure_follows_page_objects(self):
+        """Las dependencias incluyen los page objects y su clase base"""
+        from tests import test_login
+        modules = module_closure(test_login)
+        assert "tests.page_objects.login_page" in modules
+        assert "tests.page_objects.base_page" in modules
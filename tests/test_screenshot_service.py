@@ -0,0 +1,66 @@
+import os
+import pytest
+from selenium.common.exceptions import WebDriverException
+from tests.utils.screenshot_service import ScreenshotService
+from tests.utils.session_stats import SessionStats
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = ScreenshotService(directory=str(tmp_path), per_test_limit=0, stats=SessionStats())
+    service.begin_test("test_prueba[a/b]")
+    yield service
+    service.close()
+
+
+class TestScreenshotService:
+    """Pruebas del servicio de capturas en segundo plano"""
+
+    def test_capture_is_written_in_background(self, service, fake_driver):
+        """La captura se escribe con los bytes originales y un nombre seguro"""
+        fake_driver.frames = [b"imagen"]
+        path = service.capture(fake_driver)
+        service.flush()
+        assert os.path.basename(path).startswith("error_test_prueba_a_b_")
+        with open(path, 'rb') as f:
+            assert f.read() == b"imagen"
+
+    def test_identical_frames_are_deduplicated(self, service, fake_driver):
+        """Una captura idéntica dentro de la misma prueba devuelve la ruta anterior"""
+        fake_driver.frames = [b"igual", b"igual", b"distinta"]
+        first = service.capture(fake_driver)
+        assert service.capture(fake_driver) == first
+        assert service.capture(fake_driver) != first
+        service.flush()
+        assert len(os.listdir(service.directory)) == 2
+
+    def test_per_test_limit(self, service, fake_driver):
+        """Con el límite por prueba no se toman más capturas"""
+        service.configure(per_test_limit=1)
+        fake_driver.frames = [b"uno", b"dos"]
+        first = service.capture(fake_driver)
+        assert service.capture(fake_driver) == first
+        assert fake_driver.frames == [b"dos"]
+
+    def test_retention_keeps_most_recent_files(self, service, fake_driver):
+        """Solo se conservan las ``max_files`` capturas más recientes"""
+        service.configure(max_files=2)
+        fake_driver.frames = [b"1", b"2", b"3"]
+        paths = [service.capture(fake_driver) for _ in range(3)]
+        service.flush()
+        assert sorted(os.listdir(service.directory)) == sorted(os.path.basename(p) for p in paths[1:])
+
+    def test_jpeg_quality_is_reduced_to_fit_size(self, service, fake_driver):
+        """Una captura jpeg demasiado grande se repite con menor calidad"""
+        service.configure(image_format='jpeg', quality=80, max_bytes=10)
+        fake_driver.frames = [b"x" * 100, b"x" * 50, b"x" * 5]
+        path = service.capture(fake_driver)
+        assert path.endswith(".jpg")
+        assert [params['quality'] for _, params in fake_driver.cdp_calls] == [80, 40, 20]
+
+    def test_jpeg_falls_back_to_png_without_devtools(self, service, fake_driver):
+        """Sin DevTools se usa la captura PNG estándar"""
+        service.configure(image_format='jpeg')
+        fake_driver.frames = [b"png"]
+        fake_driver.on_cdp('Page.captureScreenshot', WebDriverException("DevTools no disponible"))
+        assert service.capture(fake_driver).endswith(".png")
@@ -0,0 +1,96 @@
+import time
+
+import pytest
+import requests
+
+from tests.stub_app.server import StubAppServer
+
+USER = {'name': 'Usuario Simulado', 'email': 'usuario@inlaze.test', 'password': 'Clave#Segura1'}
+
+
+@pytest.fixture
+def app():
+    with StubAppServer(seed=1) as server:
+        with requests.Session() as session:
+            yield server, session
+
+
+def post(app, path, body=None, token=None):
+    server, session = app
+    headers = {'Authorization': f"Bearer {token}"} if token else {}
+    return session.post(f"{server.base_url}{path}", json=body or {}, headers=headers, timeout=5)
+
+
+def get(app, path, token=None):
+    server, session = app
+    headers = {'Authorization': f"Bearer {token}"} if token else {}
+    return session.get(f"{server.base_url}{path}", headers=headers, timeout=5)
+
+
+class TestStubApp:
+    """Pruebas por HTTP de la aplicación simulada local"""
+
+    def test_session_lifecycle(self, app):
+        """Registro, inicio de sesión, usuario actual y cierre de sesión"""
+        created = post(app, '/api/auth/sign-up', USER)
+        assert created.status_code == 201
+        assert created.json() == {'user': {'name': USER['name'], 'email': USER['email']}}
+
+        signed_in = post(app, '/api/auth/sign-in', {'email': USER['email'], 'password': USER['password']})
+        assert signed_in.status_code == 200
+        token = signed_in.json()['token']
+        assert get(app, '/api/auth/me', token).json() == {'user': {'name': USER['name'], 'email': USER['email']}}
+
+        assert post(app, '/api/auth/logout', token=token).status_code == 200
+        assert get(app, '/api/auth/me', token).status_code == 401
+
+    def test_invalid_credentials_are_rejected(self, app):
+        """Una contraseña incorrecta o un token desconocido responden 401"""
+        post(app, '/api/auth/sign-up', USER)
+        response = post(app, '/api/auth/sign-in', {'email': USER['email'], 'password': 'otra'})
+        assert response.status_code == 401
+        assert response.json()['message'] == 'Las credenciales ingresadas no son válidas'
+        assert get(app, '/api/auth/me', 'desconocido').status_code == 401
+
+    def test_duplicate_email_conflicts(self, app):
+        """Un correo ya registrado (sin distinguir mayúsculas) responde 409"""
+        post(app, '/api/auth/sign-up', USER)
+        response = post(app, '/api/auth/sign-up', dict(USER, email=USER['email'].upper()))
+        assert response.status_code == 409
+        assert 'ya está registrado' in response.json()['message']
+
+    def test_config_sets_latency(self, app):
+        """``/__stub__/config`` agrega latencia a las llamadas a la API"""
+        assert post(app, '/__stub__/config', {'latency': 0.3}).json() == {'latency': 0.3, 'error_rate': 0.0}
+        start = time.perf_counter()
+        get(app, '/api/auth/me')
+        assert time.perf_counter() - start >= 0.3
+
+    def test_config_sets_error_rate(self, app):
+        """Con ``error_rate`` 1 toda llamada a la API responde 500 y las páginas no se ven afectadas"""
+        post(app, '/__stub__/config', {'error_rate': 1})
+        response = post(app, '/api/auth/sign-up', USER)
+        assert response.status_code == 500
+        assert response.json() == {'message': 'Ha ocurrido un error inesperado'}
+        assert get(app, '/auth/sign-in').status_code == 200
+
+        post(app, '/__stub__/config', {'error_rate': 0})
+        assert post(app, '/api/auth/sign-up', USER).status_code == 201
+
+    def test_reset_clears_users_and_sessions(self, app):
+        """``/__stub__/reset`` elimina los usuarios y sus sesiones"""
+        server, _ = app
+        post(app, '/api/auth/sign-up', USER)
+        token = post(app, '/api/auth/sign-in', {'email': USER['email'], 'password': USER['password']}).json()['token']
+        assert post(app, '/__stub__/reset').json() == {'users': 0}
+        assert len(server.users) == 0
+        assert get(app, '/api/auth/me', token).status_code == 401
+        assert post(app, '/api/auth/sign-up', USER).status_code == 201
+
+    def test_spa_routes_serve_index(self, app):
+        """Las rutas de la aplicación devuelven el index y los archivos estáticos su tipo"""
+        page = get(app, '/auth/sign-up')
+        assert page.status_code == 200
+        assert page.headers['Content-Type'].startswith('text/html')
+        assert get(app, '/app.js').headers['Content-Type'].startswith('application/javascript')
+        assert get(app, '/api/desconocida').status_code == 404
@@ -0,0 +1,27 @@
+from tests.utils.test_data import TestDataGenerator
+from tests.utils.unique_ids import UniqueIdGenerator
+from tests.utils.validation_rules import REGISTER_EMAIL
+
+
+class TestUniqueIds:
+    """Pruebas del generador de identificadores únicos"""
+
+    def test_ids_are_unique_across_workers(self):
+        """Workers con la misma semilla nunca generan el mismo identificador"""
+        workers = [UniqueIdGenerator(worker_id=f"gw{i}", seed="semilla") for i in (1, 11, 2)]
+        ids = [generator.next() for generator in workers for _ in range(20000)]
+        assert len(set(ids)) == len(ids)
+
+    def test_seed_makes_ids_reproducible(self):
+        """La misma semilla reproduce la secuencia; otra semilla la cambia"""
+        first = UniqueIdGenerator("gw0", seed=7)
+        again = UniqueIdGenerator("gw0", seed=7)
+        assert [first.next() for _ in range(3)] == [again.next() for _ in range(3)]
+        assert UniqueIdGenerator("gw0", seed=8).next() != UniqueIdGenerator("gw0", seed=7).next()
+
+    def test_generated_emails_are_unique_and_valid(self):
+        """Los correos generados en ráfaga son válidos y no se repiten"""
+        usuarios = TestDataGenerator.generar_usuarios_prueba(500)
+        emails = [usuario['email'] for usuario in usuarios]
+        assert len(set(emails)) == len(emails)
+        assert all(REGISTER_EMAIL.validate(email).valid for email in emails)
@@ -0,0 +1,79 @@
+import pytest
+from tests.stub_app.server import StubAppServer
+from tests.utils.auth_client import AuthClient
+from tests.utils.session_stats import SessionStats
+from tests.utils.user_pool import UserPool, ledger_path_for
+
+
+@pytest.fixture
+def api():
+    with StubAppServer() as server:
+        with AuthClient(server.base_url, stats=SessionStats()) as client:
+            yield server, client
+
+
+class TestUserPool:
+    """Pruebas del pool de usuarios compartido"""
+
+    def test_fill_creates_missing_users_only(self, api, tmp_path):
+        """Llenar el pool dos veces no debe crear usuarios de más"""
+        server, client = api
+        pool = UserPool(client, ledger_path_for(client.base_url, str(tmp_path)), size=4, stats=SessionStats())
+        assert pool.fill() == 4
+        assert pool.fill() == 0
+        assert len(server.users) == 4
+
+    def test_leases_are_exclusive(self, api, tmp_path):
+        """Dos préstamos simultáneos nunca entregan el mismo correo"""
+        server, client = api
+        ledger = ledger_path_for(client.base_url, str(tmp_path))
+        pool = UserPool(client, ledger, size=2, stats=SessionStats())
+        other_worker = UserPool(client, ledger, size=2, stats=SessionStats())
+        pool.fill()
+        first = pool.lease()
+        second = other_worker.lease()
+        assert first['email'] != second['email']
+
+        third = pool.lease()
+        assert len(server.users) == 3, "Con el pool agotado debe crearse un usuario bajo demanda"
+
+        pool.release(first)
+        assert other_worker.lease()['email'] == first['email']
+        assert third['email'] not in (first['email'], second['email'])
+
+    def test_retired_users_are_not_leased_again(self, api, tmp_path):
+        """Un usuario retirado no vuelve a prestarse"""
+        _, client = api
+        pool = UserPool(client, ledger_path_for(client.base_url, str(tmp_path)), size=1, stats=SessionStats())
+        pool.fill()
+        user = pool.lease()
+        pool.retire(user)
+        assert pool.lease()['email'] != user['email']
+
+    def test_expired_lease_is_reclaimed(self, api, tmp_path):
+        """El préstamo de un worker interrumpido vence y el usuario vuelve al pool"""
+        _, client = api
+        ledger = ledger_path_for(client.base_url, str(tmp_path))
+        interrupted = UserPool(client, ledger, size=1, lease_ttl=-1, stats=SessionStats())
+        interrupted.fill()
+        user = interrupted.lease()
+
+        stats = SessionStats()
+        assert UserPool(client, ledger, size=1, stats=stats).lease()['email'] == user['email']
+        assert stats.get('user_pool', 'préstamos recuperados') == 1
+
+    def test_active_leases_are_renewed(self, api, tmp_path):
+        """Cada operación del dueño renueva sus préstamos, aunque otro proceso tenga su mismo PID"""
+        _, client = api
+        ledger = ledger_path_for(client.base_url, str(tmp_path))
+        owner = UserPool(client, ledger, size=2, lease_ttl=60, stats=SessionStats())
+        owner.fill()
+        first = owner.lease()
+        second = owner.lease()
+        owner.release(second)
+
+        same_pid = UserPool(client, ledger, size=2, lease_ttl=60, stats=SessionStats())
+        assert same_pid.owner != owner.owner
+        assert same_pid.lease()['email'] != first['email']
+        same_pid.release(first)
+        assert owner.lease()['email'] != first['email'], "Otro pool no puede liberar un préstamo ajeno"
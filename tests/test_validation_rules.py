@@ -0,0 +1,55 @@
+import pytest
+from tests.utils.test_data import TestDataGenerator, get_login_test_data
+from tests.utils.validation_rules import (
+    DIGIT, LOGIN_EMAIL, LOGIN_PASSWORD, LOWER, NAME, REGISTER_PASSWORD, SPACE, SPECIAL, UPPER,
+    classify, validate_many
+)
+
+class TestValidationRules:
+    """Pruebas del motor de reglas de validación (no requieren navegador)"""
+
+    def test_classify_single_pass(self):
+        """Verificar la clasificación de caracteres"""
+        assert classify("") == 0
+        assert classify("aB3*") == UPPER | LOWER | DIGIT | SPECIAL
+        assert classify("Ñandú 1") == UPPER | LOWER | SPACE | DIGIT
+
+    def test_login_password_messages(self):
+        """Verificar que los mensajes coinciden con los datos de prueba de inicio de sesión"""
+        for validation in get_login_test_data()['password_validations']:
+            assert LOGIN_PASSWORD.first_error(validation['password']) == validation['expected_error']
+
+    @pytest.mark.parametrize("email,expected_code", [
+        ("", "required"),
+        ("correo.invalido", "format"),
+        ("usuario..x@inlaze.test", "consecutive_dots"),
+        ("a" * 95 + "@x.com", "too_long"),
+    ])
+    def test_login_email_codes(self, email, expected_code):
+        """Verificar los códigos de validación del correo"""
+        assert LOGIN_EMAIL.validate(email).violations[0] == expected_code
+
+    def test_name_rules(self):
+        """Verificar las reglas del nombre completo"""
+        assert NAME.first_error("Nicolas Gaitan") is None
+        assert NAME.validate("Nicolas").violations == ("min_words",)
+        assert NAME.validate("   ").violations == ("required",)
+        assert NAME.validate("Nicolas G4itan").violations == ("letters_only",)
+
+    def test_validate_many_reports_all_violations(self):
+        """Verificar la validación masiva con códigos estructurados"""
+        results = validate_many(["Password1*", "password", "", "PASSWORD1*"], REGISTER_PASSWORD)
+        assert [r.valid for r in results] == [True, False, False, False]
+        assert results[1].violations == ("missing_upper", "missing_digit", "missing_special")
+        assert results[2].violations == ("required",)
+        assert results[3].message == "La contraseña debe contener al menos una minúscula"
+
+    def test_generated_passwords_follow_rules(self):
+        """Verificar que las contraseñas generadas cumplen o incumplen la regla esperada"""
+        valid = [TestDataGenerator.generar_password_valido() for _ in range(200)]
+        assert all(result.valid for result in validate_many(valid, REGISTER_PASSWORD))
+        assert all(result.valid for result in validate_many(valid, LOGIN_PASSWORD))
+
+        for tipo, code in [('longitud', 'too_short'), ('numero', 'missing_digit'), ('especial', 'missing_special')]:
+            password = TestDataGenerator.generar_password_invalido(tipo)
+            assert code in REGISTER_PASSWORD.validate(password).violations
@@ -0,0 +1,113 @@
+import json
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from tests.page_objects import base_page
+from tests.page_objects.base_page import BasePage
+from tests.utils.instrumentation import describe_condition
+from tests.utils.session_stats import SessionStats
+from tests.utils.wait_history import WaitHistory, history_path_for, percentile
+
+
+class TestWaitHistory:
+    """Pruebas de los timeouts adaptativos por espera"""
+
+    def test_default_until_enough_samples(self):
+        """Sin historial suficiente se usa el timeout fijo"""
+        history = WaitHistory(min_samples=5, stats=SessionStats())
+        for _ in range(4):
+            history.record("LOGIN_FORM (presence)", 0.1)
+        history._history = history._new
+        assert history.timeout_for("LOGIN_FORM (presence)", 10) == 10
+
+    def test_multiple_of_p99_within_bounds(self):
+        """El timeout es un múltiplo del p99, limitado por el piso y el techo"""
+        history = WaitHistory(multiplier=3, floor=1, ceiling=10, min_samples=3, stats=SessionStats())
+        history._history = {
+            'rápida': [0.01, 0.02, 0.03],
+            'media': [0.5, 0.6, 1.0],
+            'lenta': [4.0, 5.0, 6.0],
+        }
+        assert history.timeout_for('rápida', 10) == 1
+        assert history.timeout_for('media', 10) == pytest.approx(3.0)
+        assert history.timeout_for('lenta', 10) == 10
+
+    def test_disabled_keeps_fixed_timeout(self):
+        """Con ``enabled`` en False se usa siempre el timeout fijo"""
+        history = WaitHistory(enabled=False, min_samples=1, stats=SessionStats())
+        history._history = {'espera': [0.1]}
+        assert history.timeout_for('espera', 10) == 10
+
+    def test_save_merges_and_trims_history(self, tmp_path):
+        """Las muestras nuevas se agregan al historial compartido, conservando las más recientes"""
+        path = history_path_for("local", str(tmp_path))
+        first = WaitHistory(path, max_samples=3, stats=SessionStats())
+        first.record('espera', 0.1)
+        first.record('espera', 0.2)
+        first.save()
+        second = WaitHistory(path, max_samples=3, stats=SessionStats())
+        second.record('espera', 0.3)
+        second.record('espera', 0.4)
+        second.save()
+        with open(path, encoding='utf-8') as f:
+            assert json.load(f) == {'espera': [0.2, 0.3, 0.4]}
+
+    def test_percentile_nearest_rank(self):
+        assert percentile(list(range(1, 101)), 99) == 99
+        assert percentile([0.5], 99) == 0.5
+
+
+class TestWaitTimeouts:
+    """Pruebas del timeout usado por ``_wait_for_condition``"""
+
+    def test_explicit_timeout_is_honored(self, monkeypatch, fake_driver):
+        """El timeout indicado en la llamada reemplaza al de la página"""
+        monkeypatch.setattr(base_page, "wait_history", WaitHistory(enabled=False, stats=SessionStats()))
+        page = BasePage(fake_driver)
+        page.capture_failure = lambda *args, **kwargs: pytest.fail("Un timeout que el llamador puede esperar no debe consumir la captura de la prueba")
+        start = time.perf_counter()
+        with pytest.raises(TimeoutException, match="Timeout de 0.3s"):
+            page._wait_for_condition(lambda driver: False, timeout=0.3)
+        assert time.perf_counter() - start < 2
+
+    def test_slightly_slow_wait_succeeds_within_grace(self, monkeypatch, fake_driver):
+        """Una espera algo más lenta que su timeout adaptativo se cumple en la prórroga"""
+        calls = []
+
+        def slow(driver):
+            calls.append(time.perf_counter())
+            return calls[-1] - calls[0] >= 0.45
+
+        key = describe_condition(slow, 'lenta')
+        history = WaitHistory(multiplier=2, floor=0.4, min_samples=1, grace=2, stats=SessionStats())
+        history._history = {key: [0.1]}
+        monkeypatch.setattr(base_page, "wait_history", history)
+        page = BasePage(fake_driver)
+        assert page._wait_for_condition(slow, locator='lenta') is True
+        assert history._new[key][0] >= 0.45
+        assert history.stats.get('wait_history', 'timeouts adaptativos superados') == 1
+        assert history.timeout_for(key, 10) == pytest.approx(0.4), "La espera debe seguir siendo adaptativa"
+
+    def test_failing_wait_stops_at_grace_and_is_censored(self, monkeypatch, fake_driver):
+        """Una espera que no se cumple falla al terminar la prórroga y queda como muestra censurada"""
+        def never(driver):
+            return False
+
+        key = describe_condition(never, 'nunca')
+        history = WaitHistory(multiplier=2, floor=0.2, min_samples=1, grace=1, stats=SessionStats())
+        history._history = {key: [0.1]}
+        monkeypatch.setattr(base_page, "wait_history", history)
+        page = BasePage(fake_driver)
+        start = time.perf_counter()
+        with pytest.raises(TimeoutException, match=r"Timeout de 0.3s \(adaptativo de 0.2s más prórroga\)"):
+            page._wait_for_condition(never, locator='nunca')
+        assert time.perf_counter() - start < 2, "No debe esperarse el timeout fijo"
+        [censored] = history._new[key]
+        assert censored >= 0.3
+        assert history.stats.get('wait_history', 'muestras censuradas (esperas fallidas)') == 1
+
+        history._history = {key: [0.1] + history._new[key]}
+        history.configure()
+        assert history.timeout_for(key, 10) > 0.2, "La muestra censurada debe subir el timeout siguiente"
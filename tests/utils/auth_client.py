@@ -0,0 +1,141 @@
+import os
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .session_stats import session_stats
+from .test_data import TestDataGenerator
+
+STATS_SECTION = 'auth_client'
+
+
+class AuthClientError(Exception):
+    """Error al aprovisionar usuarios o sesiones mediante la API"""
+
+
+class AuthClient:
+    """Cliente HTTP de la API de autenticación para preparar datos de prueba
+
+    Crea usuarios e inicia sesiones directamente contra el backend (o la
+    simulación local) para que las pruebas que necesitan un usuario
+    autenticado no tengan que recorrer los formularios de registro e inicio
+    de sesión.
+
+    Note:
+        - Usa una única ``requests.Session`` con un pool de conexiones
+          persistentes (keep-alive), compartida por toda la sesión de pytest
+        - Solo se reintentan los errores de conexión: repetir un registro tras
+          una respuesta del servidor podría crear el usuario dos veces
+    """
+
+    # Rutas de la simulación local (tests/stub_app); la API real puede usar
+    # otras, configurables con ``INLAZE_SIGN_UP_PATH`` e ``INLAZE_SIGN_IN_PATH``
+    SIGN_UP_PATH = os.environ.get('INLAZE_SIGN_UP_PATH', '/api/auth/sign-up')
+    SIGN_IN_PATH = os.environ.get('INLAZE_SIGN_IN_PATH', '/api/auth/sign-in')
+
+    def __init__(self, base_url, pool_size=10, timeout=10, sign_up_path=None, sign_in_path=None, stats=session_stats):
+        """
+        Args:
+            base_url: URL base de la API
+            pool_size: Conexiones persistentes que conserva la sesión HTTP
+            timeout: Tiempo máximo de cada petición, en segundos
+            sign_up_path: Ruta de registro (por defecto ``SIGN_UP_PATH``)
+            sign_in_path: Ruta de inicio de sesión (por defecto ``SIGN_IN_PATH``)
+            stats: Acumulador de métricas de la sesión
+        """
+        self.base_url = base_url.rstrip('/')
+        self.sign_up_path = sign_up_path or self.SIGN_UP_PATH
+        self.sign_in_path = sign_in_path or self.SIGN_IN_PATH
+        self.timeout = timeout
+        self.stats = stats
+        stats.register_section(STATS_SECTION, "Aprovisionamiento por API")
+
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json'})
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def create_user(self, name=None, email=None, password=None):
+        """Registrar un usuario mediante la API
+
+        Args:
+            name: Nombre completo (por defecto se genera uno)
+            email: Correo electrónico (por defecto se genera uno único)
+            password: Contraseña (por defecto se genera una válida)
+
+        Returns:
+            dict: Credenciales del usuario (name, email, password)
+
+        Raises:
+            AuthClientError: Si la API rechaza el registro
+        """
+        user = TestDataGenerator.generar_usuario_prueba()
+        user.update({key: value for key, value in
+                     (('name', name), ('email', email), ('password', password)) if value})
+        self._post(self.sign_up_path, user, 'alta de usuario', expected=(200, 201))
+        self.stats.incr(STATS_SECTION, 'usuarios creados')
+        return user
+
+    def sign_in(self, email, password):
+        """Iniciar sesión mediante la API
+
+        Returns:
+            dict: ``token`` de sesión y datos del usuario (``user``)
+
+        Raises:
+            AuthClientError: Si las credenciales son rechazadas o la respuesta
+                no incluye un token
+        """
+        data = self._post(self.sign_in_path, {'email': email, 'password': password},
+                          'inicio de sesión', expected=(200,))
+        token = data.get('token') or data.get('access_token')
+        if not token:
+            raise AuthClientError("La respuesta de inicio de sesión no incluye un token")
+        return {'token': token, 'user': data.get('user')}
+
+    def provision_user(self, **datos):
+        """Crear un usuario e iniciar su sesión
+
+        Args:
+            **datos: name, email o password a usar en lugar de los generados
+
+        Returns:
+            dict: Credenciales del usuario más ``token`` y ``user``
+        """
+        user = self.create_user(**datos)
+        user.update(self.sign_in(user['email'], user['password']))
+        return user
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _post(self, path, payload, operation, expected):
+        start = time.perf_counter()
+        try:
+            response = self.session.post(f"{self.base_url}{path}", json=payload, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise AuthClientError(f"Error de conexión en {operation}: {str(e)}") from e
+        finally:
+            self.stats.add_timing(STATS_SECTION, f"{operation} (API)", time.perf_counter() - start)
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        if response.status_code not in expected:
+            raise AuthClientError(
+                f"Error en {operation} ({response.status_code}): {data.get('message') or response.reason}"
+            )
+        return data
@@ -0,0 +1,164 @@
+import json
+import os
+import statistics
+import time
+from contextlib import contextmanager
+
+DEFAULT_BASELINE = os.path.join('.benchmarks', 'baseline.json')
+
+
+class BenchmarkResult:
+    """Resultado de un benchmark: tiempos por iteración y comandos de WebDriver"""
+
+    def __init__(self, name, samples, commands=None):
+        ordered = sorted(samples)
+        self.name = name
+        self.iterations = len(ordered)
+        self.median = statistics.median(ordered)
+        self.p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+        self.commands = commands
+
+    def as_dict(self):
+        return {
+            'iterations': self.iterations,
+            'median_ms': round(self.median * 1000, 6),
+            'p95_ms': round(self.p95 * 1000, 6),
+            'commands': self.commands,
+        }
+
+
+class BenchmarkRecorder:
+    """Ejecución de benchmarks y comparación con una línea base
+
+    Cada benchmark ejecuta una función varias veces (después de unas
+    iteraciones de calentamiento) y registra la mediana, el p95 y, si se indica
+    un navegador, los comandos de WebDriver por iteración.
+
+    Note:
+        - Se considera regresión una mediana que supera a la de la línea base
+          en más de ``threshold`` (proporción, 0.2 = 20%) o un aumento en la
+          cantidad de comandos, que no depende del ruido de la máquina
+        - Diferencias de tiempo menores a ``min_delta_ms`` no se consideran
+          regresión: en funciones de pocos microsegundos el ruido supera
+          fácilmente el umbral relativo
+        - La línea base se guarda con ``save`` y se combina con la existente,
+          de modo que puede actualizarse ejecutando solo algunos benchmarks
+    """
+
+    def __init__(self, baseline_path=DEFAULT_BASELINE, threshold=0.2, iterations=20, warmup=2, min_delta_ms=0.01):
+        self.baseline_path = baseline_path
+        self.threshold = threshold
+        self.min_delta_ms = min_delta_ms
+        self.iterations = iterations
+        self.warmup = warmup
+        self.results = {}
+        self.baseline = self._load()
+
+    def measure(self, name, func, iterations=None, number=1, setup=None, driver=None):
+        """Medir una función
+
+        Args:
+            name: Nombre del benchmark
+            func: Función sin argumentos a medir
+            iterations: Iteraciones medidas (por defecto ``self.iterations``)
+            number: Llamadas por iteración, para funciones muy rápidas; el
+                    tiempo se informa por llamada
+            setup: Función que prepara cada iteración, fuera de la medición
+            driver: Navegador cuyos comandos se cuentan
+
+        Returns:
+            BenchmarkResult: Resultado del benchmark
+        """
+        iterations = iterations or self.iterations
+        samples = []
+        commands = 0
+        for index in range(self.warmup + iterations):
+            if setup:
+                setup()
+            with count_commands(driver) as counter:
+                start = time.perf_counter()
+                for _ in range(number):
+                    func()
+                elapsed = (time.perf_counter() - start) / number
+            if index >= self.warmup:
+                samples.append(elapsed)
+                commands += counter.count
+        result = BenchmarkResult(name, samples, round(commands / iterations, 1) if driver else None)
+        self.results[name] = result.as_dict()
+        return result
+
+    def regressions(self, name):
+        """Comparar un resultado con la línea base
+
+        Returns:
+            list: Descripciones de las regresiones encontradas (vacía si no hay
+                  línea base o no hay regresión)
+        """
+        current, base = self.results.get(name), self.baseline.get(name)
+        if not current or not base:
+            return []
+        found = []
+        if current['median_ms'] > base['median_ms'] * (1 + self.threshold) \
+                and current['median_ms'] - base['median_ms'] > self.min_delta_ms:
+            found.append(
+                f"{name}: mediana {current['median_ms']:.3f}ms vs {base['median_ms']:.3f}ms "
+                f"(+{(current['median_ms'] / base['median_ms'] - 1) * 100:.0f}%, umbral {self.threshold * 100:.0f}%)"
+            )
+        if current['commands'] is not None and base.get('commands') is not None \
+                and current['commands'] > base['commands']:
+            found.append(f"{name}: {current['commands']} comandos por iteración vs {base['commands']}")
+        return found
+
+    def save(self):
+        """Guardar los resultados como nueva línea base"""
+        baseline = dict(self._load())
+        baseline.update(self.results)
+        os.makedirs(os.path.dirname(os.path.abspath(self.baseline_path)), exist_ok=True)
+        with open(self.baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        return self.baseline_path
+
+    def summary_lines(self):
+        """Líneas del resumen: resultado actual y variación contra la línea base"""
+        lines = []
+        for name, result in sorted(self.results.items()):
+            line = f"{name:<45} mediana={result['median_ms']:9.3f}ms p95={result['p95_ms']:9.3f}ms"
+            if result['commands'] is not None:
+                line += f" comandos={result['commands']}"
+            base = self.baseline.get(name)
+            if base and base['median_ms']:
+                line += f"  ({(result['median_ms'] / base['median_ms'] - 1) * 100:+.0f}% vs línea base)"
+            lines.append(line)
+        return lines
+
+    def _load(self):
+        try:
+            with open(self.baseline_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+
+class _CommandCounter:
+    count = 0
+
+
+@contextmanager
+def count_commands(driver):
+    """Contar los comandos de WebDriver enviados dentro del bloque"""
+    counter = _CommandCounter()
+    if driver is None:
+        yield counter
+        return
+    executor = driver.command_executor
+    execute = executor.execute
+
+    def counting_execute(command, params):
+        counter.count += 1
+        return execute(command, params)
+
+    executor.execute = counting_execute
+    try:
+        yield counter
+    finally:
+        executor.execute = execute
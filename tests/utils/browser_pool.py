@@ -0,0 +1,130 @@
+import threading
+from collections import deque
+
+from .session_stats import session_stats
+
+STATS_SECTION = 'browser_pool'
+
+RESET_STORAGE_SCRIPT = """
+try { window.localStorage && window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage && window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class BrowserPool:
+    """Pool de navegadores reutilizables por worker
+
+    Mantiene instancias de Chrome ya iniciadas para que cada prueba tome una
+    del pool en lugar de lanzar un navegador nuevo. Entre pruebas el estado se
+    limpia de forma económica (cookies, localStorage, sessionStorage y
+    navegación a about:blank).
+
+    Note:
+        - Con pytest-xdist cada worker es un proceso independiente, por lo que
+          el pool (de alcance de sesión) queda asociado a un único worker
+        - Si la limpieza falla (navegador caído o en un estado no recuperable)
+          la instancia se descarta y se reemplaza en el siguiente ``acquire``
+        - Los aciertos, fallos y reciclajes se registran en ``session_stats``
+    """
+
+    def __init__(self, factory, max_idle=1, disposer=None, stats=session_stats):
+        """
+        Args:
+            factory: Función sin argumentos que crea un nuevo WebDriver
+            max_idle: Número máximo de navegadores inactivos que se conservan
+            disposer: Función opcional llamada con cada driver descartado
+                      (después de ``quit``) para liberar recursos asociados
+            stats: Acumulador de métricas de la sesión
+        """
+        self._factory = factory
+        self._disposer = disposer
+        self._max_idle = max(0, max_idle)
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = stats
+        self._stats.register_section(STATS_SECTION, "Pool de navegadores")
+
+    def acquire(self):
+        """Obtener un navegador del pool o crear uno nuevo si no hay disponibles
+
+        Returns:
+            WebDriver: Navegador listo para usarse
+        """
+        with self._lock:
+            driver = self._idle.popleft() if self._idle else None
+
+        if driver is not None:
+            self._stats.incr(STATS_SECTION, 'hits')
+            return driver
+
+        self._stats.incr(STATS_SECTION, 'misses')
+        return self._factory()
+
+    def release(self, driver, recycle=False):
+        """Devolver un navegador al pool
+
+        Args:
+            driver: Navegador obtenido con ``acquire``
+            recycle: Si es True el navegador se descarta sin intentar limpiarlo
+
+        Note:
+            Un navegador que no se puede limpiar se recicla (se cierra y se
+            descarta); el costo de una prueba que lo deja inservible es un
+            único reciclaje.
+        """
+        if not recycle:
+            try:
+                self.reset(driver)
+            except Exception:
+                # Un chromedriver caído no responde con WebDriverException
+                # sino con errores de conexión de urllib3 (MaxRetryError,
+                # ProtocolError); cualquier fallo de la limpieza recicla
+                recycle = True
+
+        if recycle:
+            self._stats.incr(STATS_SECTION, 'recycles')
+            self._dispose(driver)
+            return
+
+        with self._lock:
+            if not self._closed and len(self._idle) < self._max_idle:
+                self._idle.append(driver)
+                return
+        self._dispose(driver)
+
+    def reset(self, driver):
+        """Limpiar el estado del navegador entre pruebas
+
+        Raises:
+            WebDriverException: Si el navegador no responde
+            urllib3.exceptions.HTTPError: Si chromedriver ya no está en ejecución
+        """
+        handles = driver.window_handles
+        if len(handles) > 1:
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+        driver.execute_script(RESET_STORAGE_SCRIPT)
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.get('about:blank')
+
+    def close(self):
+        """Cerrar todos los navegadores inactivos del pool"""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for driver in idle:
+            self._dispose(driver)
+
+    def _dispose(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        finally:
+            if self._disposer:
+                self._disposer(driver)
@@ -0,0 +1,114 @@
+import atexit
+import os
+import shutil
+import socket
+import tempfile
+import threading
+
+
+def worker_index(worker_id=None):
+    """Obtener el índice numérico del worker de pytest-xdist
+
+    Args:
+        worker_id: Identificador del worker (``gw0``, ``gw1``...). Por defecto se
+                   lee de la variable de entorno ``PYTEST_XDIST_WORKER``
+
+    Returns:
+        int: Índice del worker o 0 si las pruebas no se ejecutan en paralelo
+    """
+    worker_id = worker_id or os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+    digits = ''.join(c for c in worker_id if c.isdigit())
+    return int(digits) if digits else 0
+
+
+class BrowserResources:
+    """Recursos exclusivos de una instancia de Chrome"""
+
+    def __init__(self, port, user_data_dir):
+        self.port = port
+        self.user_data_dir = user_data_dir
+
+    def chrome_arguments(self):
+        return [
+            f'--remote-debugging-port={self.port}',
+            f'--user-data-dir={self.user_data_dir}',
+        ]
+
+
+class BrowserResourceAllocator:
+    """Asignación de puertos DevTools y perfiles temporales por navegador
+
+    Cada worker de xdist usa un rango de puertos propio y cada navegador recibe
+    un puerto libre de ese rango y un directorio de perfil temporal, de modo
+    que varios Chrome pueden ejecutarse en paralelo sin interferir entre sí.
+
+    Note:
+        - Rango del worker N: ``base_port + N * ports_per_worker``
+        - Antes de asignar un puerto se verifica que esté libre; si el rango se
+          agota se usa un puerto asignado por el sistema operativo
+        - Los perfiles se eliminan al liberar el navegador y, como respaldo,
+          al terminar el proceso
+    """
+
+    def __init__(self, worker_id=None, base_port=9300, ports_per_worker=50, temp_root=None):
+        self.worker = worker_index(worker_id)
+        self.first_port = base_port + self.worker * ports_per_worker
+        self.ports_per_worker = ports_per_worker
+        self.temp_root = temp_root
+        self._next_offset = 0
+        self._in_use = {}
+        self._lock = threading.Lock()
+        atexit.register(self.release_all)
+
+    def allocate(self):
+        """Reservar un puerto y un perfil temporal para un nuevo navegador
+
+        Returns:
+            BrowserResources: Recursos asignados
+        """
+        with self._lock:
+            port = self._find_free_port()
+            user_data_dir = tempfile.mkdtemp(
+                prefix=f'chrome-gw{self.worker}-{port}-', dir=self.temp_root
+            )
+            resources = BrowserResources(port, user_data_dir)
+            self._in_use[port] = resources
+            return resources
+
+    def release(self, resources):
+        """Liberar el puerto y eliminar el perfil temporal del navegador"""
+        if resources is None:
+            return
+        with self._lock:
+            self._in_use.pop(resources.port, None)
+        shutil.rmtree(resources.user_data_dir, ignore_errors=True)
+
+    def release_all(self):
+        """Liberar todos los recursos pendientes"""
+        with self._lock:
+            pending = list(self._in_use.values())
+        for resources in pending:
+            self.release(resources)
+
+    def _find_free_port(self):
+        for _ in range(self.ports_per_worker):
+            port = self.first_port + self._next_offset
+            self._next_offset = (self._next_offset + 1) % self.ports_per_worker
+            if port not in self._in_use and _is_port_free(port):
+                return port
+        return _ephemeral_port()
+
+
+def _is_port_free(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind(('127.0.0.1', port))
+        except OSError:
+            return False
+    return True
+
+
+def _ephemeral_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,207 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from selenium.webdriver.chrome.service import Service
+
+from .file_lock import FileLock
+from .session_stats import session_stats
+
+STATS_SECTION = 'chromedriver'
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'inlaze-qa', 'chromedriver')
+
+CHROME_BINARIES = (
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+)
+
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+DRIVER_NAME = 'chromedriver.exe' if sys.platform.startswith('win') else 'chromedriver'
+
+
+class ChromeDriverResolver:
+    """Resolución de chromedriver con caché local y sin acceso a red
+
+    Detecta la versión de Chrome instalada una sola vez por sesión y busca un
+    chromedriver compatible (misma versión mayor) en el directorio de caché.
+    Solo si no existe se descarga con webdriver-manager.
+
+    Note:
+        - Estructura de la caché: ``<cache_dir>/<version>/chromedriver``
+        - La resolución se comparte entre workers de xdist mediante el archivo
+          ``resolved.json`` protegido por un archivo de bloqueo
+        - En modo ``offline`` nunca se accede a la red; si no hay un driver
+          compatible en caché se informa con un error claro
+    """
+
+    def __init__(self, cache_dir=None, offline=False, chrome_binary=None, downloader=None, stats=session_stats):
+        """
+        Args:
+            cache_dir: Directorio de la caché (por defecto ``~/.cache/inlaze-qa/chromedriver``)
+            offline: Si está activo nunca se descarga el driver
+            chrome_binary: Binario de Chrome cuya versión se detecta
+            downloader: Función sin argumentos que descarga chromedriver y
+                        devuelve su ruta (por defecto, webdriver-manager)
+            stats: Acumulador de métricas de la sesión
+        """
+        self.cache_dir = os.path.abspath(cache_dir or DEFAULT_CACHE_DIR)
+        self.offline = offline
+        self.chrome_binary = chrome_binary or os.environ.get('CHROME_BINARY')
+        self.cache_hit = None
+        self._downloader = downloader or self._download_with_webdriver_manager
+        self._driver_path = None
+        self._chrome_version = None
+        self._stats = stats
+        self._stats.register_section(STATS_SECTION, "Resolución de chromedriver")
+
+    def detect_chrome_version(self):
+        """Obtener la versión de Chrome instalada
+
+        Returns:
+            str: Versión completa (por ejemplo ``120.0.6099.109``) o None si
+                 no se encuentra Chrome
+        """
+        if self._chrome_version is not None:
+            return self._chrome_version or None
+
+        candidates = [self.chrome_binary] if self.chrome_binary else list(CHROME_BINARIES)
+        for binary in candidates:
+            version = _read_version([binary, '--version'])
+            if version:
+                self._chrome_version = version
+                return version
+
+        if sys.platform.startswith('win'):
+            version = _read_version([
+                'reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version'
+            ])
+            if version:
+                self._chrome_version = version
+                return version
+
+        self._chrome_version = ''
+        return None
+
+    def resolve(self):
+        """Obtener la ruta del chromedriver compatible
+
+        Returns:
+            str: Ruta absoluta del ejecutable de chromedriver
+
+        Raises:
+            RuntimeError: Si no hay un driver en caché y el modo offline está activo
+        """
+        if self._driver_path:
+            return self._driver_path
+
+        start = time.perf_counter()
+        with FileLock(os.path.join(self.cache_dir, 'resolve.lock')):
+            chrome_version = self.detect_chrome_version()
+            path = self._read_shared_resolution(chrome_version) or self._find_cached(chrome_version)
+            self.cache_hit = path is not None
+            if path is None:
+                path = self._download(chrome_version)
+            self._write_shared_resolution(chrome_version, path)
+
+        self._stats.add_timing(
+            STATS_SECTION,
+            'resolución (caché)' if self.cache_hit else 'resolución (descarga)',
+            time.perf_counter() - start
+        )
+        self._driver_path = path
+        return path
+
+    def service(self):
+        """Crear un ``Service`` de Selenium con el driver resuelto
+
+        Note:
+            Selenium inicia un proceso de chromedriver por cada ``Service``, por
+            lo que se crea uno por navegador; la ruta se resuelve una sola vez.
+        """
+        return Service(self.resolve())
+
+    def _shared_resolution_path(self):
+        return os.path.join(self.cache_dir, 'resolved.json')
+
+    def _read_shared_resolution(self, chrome_version):
+        try:
+            with open(self._shared_resolution_path(), encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        path = data.get('driver_path')
+        if data.get('chrome_version') == chrome_version and path and os.path.isfile(path):
+            return path
+        return None
+
+    def _write_shared_resolution(self, chrome_version, path):
+        tmp_path = self._shared_resolution_path() + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'chrome_version': chrome_version, 'driver_path': path}, f)
+        os.replace(tmp_path, self._shared_resolution_path())
+
+    def _find_cached(self, chrome_version):
+        """Buscar en caché un driver de la misma versión mayor que Chrome"""
+        if not os.path.isdir(self.cache_dir):
+            return None
+
+        cached = []
+        for entry in os.listdir(self.cache_dir):
+            match = VERSION_PATTERN.fullmatch(entry)
+            path = os.path.join(self.cache_dir, entry, DRIVER_NAME)
+            if match and os.path.isfile(path):
+                cached.append((tuple(int(p) for p in match.groups()), path))
+        if not cached:
+            return None
+
+        if chrome_version:
+            major = int(chrome_version.split('.')[0])
+            cached = [item for item in cached if item[0][0] == major]
+        if not cached:
+            return None
+        return max(cached)[1]
+
+    def _download(self, chrome_version):
+        """Descargar chromedriver y copiarlo a la caché"""
+        if self.offline:
+            raise RuntimeError(
+                f"No hay un chromedriver compatible con Chrome {chrome_version or 'desconocido'} "
+                f"en {self.cache_dir} y el modo offline está activo. "
+                f"Copia el driver en {os.path.join(self.cache_dir, '<version>', DRIVER_NAME)}"
+            )
+
+        downloaded = self._downloader()
+        driver_version = _read_version([downloaded, '--version']) or chrome_version or '0.0.0.0'
+
+        target_dir = os.path.join(self.cache_dir, driver_version)
+        os.makedirs(target_dir, exist_ok=True)
+        target = os.path.join(target_dir, DRIVER_NAME)
+        shutil.copy2(downloaded, target)
+        return target
+
+    def _download_with_webdriver_manager(self):
+        from webdriver_manager.chrome import ChromeDriverManager
+        from webdriver_manager.core.driver_cache import DriverCacheManager
+
+        return ChromeDriverManager(
+            cache_manager=DriverCacheManager(root_dir=os.path.join(self.cache_dir, 'wdm'))
+        ).install()
+
+
+def _read_version(command):
+    try:
+        output = subprocess.run(
+            command, capture_output=True, text=True, timeout=10, check=False
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output or '')
+    return match.group(0) if match else None
@@ -0,0 +1,185 @@
+import heapq
+import statistics
+import time
+from collections import defaultdict
+
+from xdist.scheduler import LoadScheduling
+
+CACHE_KEY = 'inlaze/durations'
+
+# Duración supuesta de una prueba sin historial (segundos)
+DEFAULT_DURATION = 1.0
+
+
+def affinity_group(nodeid):
+    """Grupo de afinidad de una prueba: su módulo y clase (que usan el mismo page object)"""
+    return nodeid.split('[', 1)[0].rsplit('::', 1)[0]
+
+
+def predict_makespan(durations, workers):
+    """Duración total esperada al repartir las pruebas de mayor a menor duración
+
+    Cada prueba se asigna al worker que queda libre primero (LPT), igual que
+    en ``DurationScheduling``.
+
+    Args:
+        durations: Duraciones estimadas de las pruebas en segundos
+        workers: Cantidad de workers
+
+    Returns:
+        float: Tiempo del worker más cargado
+    """
+    loads = [0.0] * max(1, workers)
+    for duration in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+
+class DurationHistory:
+    """Duraciones de las pruebas en ejecuciones anteriores y en la actual
+
+    Las duraciones se guardan en la caché de pytest (``config.cache``) como un
+    promedio móvil de las ejecuciones, sumando preparación, ejecución y
+    limpieza de cada prueba.
+    """
+
+    def __init__(self, durations=None, smoothing=0.5):
+        """
+        Args:
+            durations: Duraciones conocidas ``nodeid -> segundos``
+            smoothing: Peso de la ejecución actual en el promedio móvil
+        """
+        self.smoothing = smoothing
+        self.observed = defaultdict(float)
+        self.busy = defaultdict(float)
+        self._set_durations(durations or {})
+
+    def load(self, cache):
+        """Cargar las duraciones guardadas en la caché de pytest (None: sin caché)"""
+        self._set_durations(cache.get(CACHE_KEY, {}) if cache is not None else {})
+
+    def _set_durations(self, durations):
+        self.durations = dict(durations)
+        known = list(self.durations.values())
+        self.default = statistics.median(known) if known else DEFAULT_DURATION
+
+    def estimate(self, nodeid):
+        """Duración esperada de una prueba (la mediana conocida si es nueva)"""
+        return self.durations.get(nodeid, self.default)
+
+    def record(self, nodeid, seconds, worker='main'):
+        """Registrar una fase (setup/call/teardown) de una prueba"""
+        self.observed[nodeid] += seconds
+        self.busy[worker] += seconds
+
+    def save(self, cache):
+        """Combinar las duraciones observadas con las anteriores y guardarlas"""
+        if cache is None or not self.observed:
+            return
+        for nodeid, seconds in self.observed.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = round(
+                seconds if previous is None else previous + self.smoothing * (seconds - previous), 4
+            )
+        cache.set(CACHE_KEY, self.durations)
+
+
+class DurationScheduling(LoadScheduling):
+    """Distribución de pruebas de xdist por duración, de la más larga a la más corta
+
+    Las pruebas se ordenan por su duración en ejecuciones anteriores y cada
+    worker recibe la siguiente más larga cuando queda libre, de modo que las
+    pruebas largas no coinciden al final de la ejecución en un mismo worker.
+
+    Note:
+        - Cada worker tiene como máximo ``queue_depth`` pruebas asignadas, para
+          que el reparto se decida a medida que terminan
+        - Entre las pruebas de duración similar a la más larga pendiente
+          (``affinity_tolerance``) se prefiere una de la misma clase que la
+          última enviada al worker, que ya tiene el navegador en esa página
+        - Las pruebas sin historial se estiman con la mediana de las conocidas
+    """
+
+    def __init__(self, config, log=None, history=None, queue_depth=2, affinity_tolerance=0.5, affinity_window=20):
+        super().__init__(config, log)
+        self.history = history or duration_history
+        self.queue_depth = queue_depth
+        self.affinity_tolerance = affinity_tolerance
+        self.affinity_window = affinity_window
+        self.predicted = None
+        self.started = None
+        self.finished = None
+        self._node_group = {}
+
+    def schedule(self):
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = [self.history.estimate(nodeid) for nodeid in self.collection]
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: -estimates[index])
+        self.predicted = predict_makespan(estimates, len(self.nodes))
+        self.started = time.monotonic()
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+        if not self.pending:
+            node.shutdown()
+            return
+        node_pending = self.node2pending[node]
+        selected = []
+        while self.pending and len(node_pending) + len(selected) < self.queue_depth:
+            selected.append(self._next_for(node))
+        if selected:
+            node_pending.extend(selected)
+            node.send_runtest_some(selected)
+
+    def _next_for(self, node):
+        """Tomar la prueba pendiente más larga, o una similar de la misma clase"""
+        group = self._node_group.get(node)
+        position = 0
+        if group is not None:
+            minimum = self.history.estimate(self.collection[self.pending[0]]) * self.affinity_tolerance
+            for candidate, index in enumerate(self.pending[:self.affinity_window]):
+                nodeid = self.collection[index]
+                if self.history.estimate(nodeid) < minimum:
+                    break
+                if affinity_group(nodeid) == group:
+                    position = candidate
+                    break
+        index = self.pending.pop(position)
+        self._node_group[node] = affinity_group(self.collection[index])
+        return index
+
+    def finish(self):
+        """Marcar el final de la ejecución, para medir el makespan real"""
+        if self.started is not None and self.finished is None:
+            self.finished = time.monotonic()
+
+    def summary_lines(self):
+        """Resumen del reparto: makespan previsto frente al real"""
+        if self.predicted is None:
+            return []
+        busy = self.history.busy
+        total = sum(busy.values())
+        workers = max(1, len(busy) or len(self.node2collection))
+        lines = [f"Makespan previsto (LPT, {len(self.node2collection)} workers): {self.predicted:.1f}s"]
+        if self.started is not None:
+            self.finish()
+            lines.append(f"Makespan real: {self.finished - self.started:.1f}s")
+        if busy:
+            lines.append(f"Worker más cargado: {max(busy.values()):.1f}s de pruebas")
+            lines.append(f"Tiempo total de pruebas: {total:.1f}s (ideal con {workers} workers: {total / workers:.1f}s)")
+        return lines
+
+
+duration_history = DurationHistory()
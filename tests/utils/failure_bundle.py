@@ -0,0 +1,169 @@
+import gzip
+import json
+import os
+import re
+import time
+from datetime import datetime
+from selenium.common.exceptions import WebDriverException
+
+from .session_stats import session_stats
+
+STATS_SECTION = 'failure_bundles'
+
+MODES = ('screenshot', 'bundle', 'both')
+
+# Registros de Chrome necesarios: consola del navegador y eventos de red
+LOGGING_PREFS = {'browser': 'ALL', 'performance': 'ALL'}
+PERF_LOGGING_PREFS = {'enableNetwork': True, 'enablePage': False}
+
+NETWORK_TYPES = ('XHR', 'Fetch')
+
+DOM_SNAPSHOT_SCRIPT = """
+var maxLength = arguments[0];
+function text(node) { return (node.innerText || node.textContent || '').trim(); }
+var roots = document.querySelectorAll('form');
+if (!roots.length) { roots = document.querySelectorAll('app-root'); }
+return {
+    url: location.href,
+    title: document.title,
+    html: Array.prototype.map.call(roots, function (node) { return node.outerHTML.slice(0, maxLength); }),
+    fields: Array.prototype.map.call(document.querySelectorAll('input, textarea, select'), function (node) {
+        return {
+            name: node.getAttribute('formcontrolname') || node.name || node.id,
+            type: node.type,
+            value: node.type === 'password' ? (node.value ? '*'.repeat(node.value.length) : '') : node.value,
+            classes: node.getAttribute('class'),
+            disabled: node.disabled
+        };
+    }),
+    errors: Array.prototype.map.call(document.querySelectorAll('mat-error, .alert-error, .error-message'), text)
+};
+"""
+
+
+class FailureBundleCollector:
+    """Diagnóstico liviano de fallos: DOM, consola y últimas respuestas de red
+
+    En lugar de (o además de) una captura de pantalla, guarda en un único JSON
+    comprimido el HTML de los formularios con el estado de sus campos, los
+    mensajes de error visibles, el registro de la consola del navegador y las
+    últimas respuestas XHR/fetch con su contenido.
+
+    Note:
+        - Requiere que Chrome se inicie con ``LOGGING_PREFS`` y
+          ``PERF_LOGGING_PREFS`` (el fixture ``chrome_options`` los agrega
+          cuando los diagnósticos están activos)
+        - Los valores de los campos de contraseña se enmascaran
+        - Como las capturas, se guarda como máximo un diagnóstico por prueba
+    """
+
+    def __init__(self, directory=os.path.join('reports', 'bundles'), mode='screenshot',
+                 max_responses=5, max_body=4096, max_html=20000, stats=session_stats):
+        self.directory = directory
+        self.max_responses = max_responses
+        self.max_body = max_body
+        self.max_html = max_html
+        self.stats = stats
+        self.configure(mode)
+        self._test = None
+        self._path = None
+        stats.register_section(STATS_SECTION, "Diagnósticos de fallos")
+
+    def configure(self, mode):
+        """Elegir los artefactos de fallo: 'screenshot', 'bundle' o 'both'
+
+        Raises:
+            ValueError: Si el modo no es válido
+        """
+        if mode not in MODES:
+            raise ValueError(f"Modo de diagnóstico no válido: {mode}. Use uno de {MODES}")
+        self.mode = mode
+
+    @property
+    def enabled(self):
+        """Indica si se recolectan diagnósticos"""
+        return self.mode in ('bundle', 'both')
+
+    @property
+    def screenshots(self):
+        """Indica si se siguen tomando capturas de pantalla"""
+        return self.mode in ('screenshot', 'both')
+
+    def begin_test(self, test_name):
+        self._test = test_name
+        self._path = None
+
+    def collect(self, driver, nombre_base=None, reason=None):
+        """Recolectar y guardar el diagnóstico del estado actual del navegador
+
+        Args:
+            driver: Navegador a diagnosticar
+            nombre_base: Nombre base del archivo (por defecto, la prueba actual)
+            reason: Descripción del fallo (por ejemplo, el mensaje del timeout)
+
+        Returns:
+            str: Ruta del archivo ``.json.gz`` (la del diagnóstico anterior si la
+                 prueba ya guardó uno)
+        """
+        if self._path:
+            self.stats.incr(STATS_SECTION, 'diagnósticos omitidos por límite')
+            return self._path
+
+        start = time.perf_counter()
+        bundle = {
+            'test': self._test,
+            'reason': reason,
+            'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+            'dom': self._safe(lambda: driver.execute_script(DOM_SNAPSHOT_SCRIPT, self.max_html)),
+            'console': self._safe(lambda: driver.get_log('browser'), []),
+            'network': self._safe(lambda: self._network_responses(driver), []),
+        }
+
+        nombre_base = re.sub(r'[^\w.-]+', '_', nombre_base or self._test or 'test')
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
+        os.makedirs(self.directory, exist_ok=True)
+        self._path = os.path.join(self.directory, f"error_{nombre_base}_{timestamp}.json.gz")
+        with gzip.open(self._path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            json.dump(bundle, f, ensure_ascii=False, default=str)
+
+        self.stats.incr(STATS_SECTION, 'diagnósticos guardados')
+        self.stats.add_timing(STATS_SECTION, 'recolección', time.perf_counter() - start)
+        return self._path
+
+    def discard_logs(self, driver):
+        """Vaciar los registros del navegador para que no pasen a la siguiente prueba"""
+        for log_type in LOGGING_PREFS:
+            self._safe(lambda: driver.get_log(log_type))
+
+    def _network_responses(self, driver):
+        responses = []
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            params = message.get('params', {})
+            if message.get('method') == 'Network.responseReceived' and params.get('type') in NETWORK_TYPES:
+                response = params['response']
+                responses.append({
+                    'requestId': params['requestId'],
+                    'url': response.get('url'),
+                    'status': response.get('status'),
+                    'mimeType': response.get('mimeType'),
+                })
+
+        responses = responses[-self.max_responses:]
+        for response in responses:
+            body = self._safe(
+                lambda: driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': response['requestId']})
+            )
+            if body:
+                response['body'] = body.get('body', '')[:self.max_body]
+        return responses
+
+    def _safe(self, read, default=None):
+        try:
+            return read()
+        except (WebDriverException, ValueError, KeyError):
+            self.stats.incr(STATS_SECTION, 'lecturas no disponibles')
+            return default
+
+
+failure_bundles = FailureBundleCollector()
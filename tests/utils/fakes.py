@@ -0,0 +1,114 @@
+import base64
+from types import SimpleNamespace
+
+from selenium.common.exceptions import NoSuchElementException
+
+from tests.page_objects.base_page import WAIT_FOR_ANGULAR_SCRIPT
+
+
+class FakeDriver:
+    """Navegador simulado para las pruebas unitarias que no necesitan Chrome
+
+    Implementa la parte de WebDriver que usan los page objects y las
+    utilidades del framework. Cada prueba configura solo lo que necesita:
+    las respuestas a los scripts (``on_script``) y a los comandos de DevTools
+    (``on_cdp``), los elementos presentes, los registros y las capturas.
+
+    Note:
+        - Un script sin respuesta registrada hace fallar la prueba, para que un
+          cambio en los scripts del framework no pase inadvertido
+        - Una respuesta puede ser un valor, una función que recibe los
+          argumentos del comando o una excepción que se lanza
+        - ``error`` simula un navegador caído: todos los comandos lo lanzan
+        - Los atributos del framework (``navigation_mode``, ``readiness``...)
+          se pasan como argumentos con nombre; sin ellos los page objects usan
+          sus valores por defecto
+    """
+
+    def __init__(self, present=None, frames=(), logs=None, error=None, **attributes):
+        """
+        Args:
+            present: Localizadores ``(by, value)`` que existen en la página
+                     (None: existen todos)
+            frames: Bytes de las capturas que devuelve el navegador, en orden
+                    (por WebDriver o por DevTools)
+            logs: ``tipo -> entradas`` que devuelve ``get_log``
+            error: Excepción que lanzan todos los comandos
+            **attributes: Atributos adicionales del navegador
+        """
+        self.present = None if present is None else set(present)
+        self.frames = list(frames)
+        self.logs = logs or {}
+        self.error = error
+        self.timeouts = SimpleNamespace(implicit_wait=0)
+        self.current_url = "about:blank"
+        self.window_handles = ['principal']
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+        self.command_executor = SimpleNamespace(execute=lambda command, params: {'value': command})
+        self.scripts = {WAIT_FOR_ANGULAR_SCRIPT: "estable"}
+        self.cdp_commands = {
+            'Page.captureScreenshot': lambda params: {'data': self.get_screenshot_as_base64()},
+        }
+        self.visited = []
+        self.executed = []
+        self.cdp_calls = []
+        self.quit_calls = 0
+        vars(self).update(attributes)
+
+    def on_script(self, script, response):
+        """Registrar la respuesta a un script (síncrono o asíncrono)"""
+        self.scripts[script] = response
+
+    def on_cdp(self, command, response):
+        """Registrar la respuesta a un comando de DevTools (recibe sus parámetros)"""
+        self.cdp_commands[command] = response
+
+    def get(self, url):
+        self._check()
+        self.visited.append(url)
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        self._check()
+        assert script in self.scripts, f"Script sin respuesta registrada: {script[:60]!r}"
+        self.executed.append((script, args))
+        return self._answer(self.scripts[script], *args)
+
+    execute_async_script = execute_script
+
+    def execute_cdp_cmd(self, command, params):
+        self._check()
+        self.cdp_calls.append((command, params))
+        return self._answer(self.cdp_commands.get(command, {}), params)
+
+    def find_elements(self, by, value):
+        self._check()
+        return [object()] if self.present is None or (by, value) in self.present else []
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No existe el elemento {value}")
+        return elements[0]
+
+    def get_log(self, log_type):
+        self._check()
+        return self.logs.get(log_type, [])
+
+    def get_screenshot_as_base64(self):
+        self._check()
+        return base64.b64encode(self.frames.pop(0)).decode('ascii')
+
+    def quit(self):
+        self.quit_calls += 1
+        self._check()
+
+    def _check(self):
+        if self.error is not None:
+            raise self.error
+
+    @staticmethod
+    def _answer(response, *args):
+        if isinstance(response, BaseException):
+            raise response
+        return response(*args) if callable(response) else response
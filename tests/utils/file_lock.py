@@ -0,0 +1,66 @@
+import os
+import time
+
+
+class FileLock:
+    """Bloqueo entre procesos basado en un archivo de bloqueo
+
+    Permite que varios workers de pytest-xdist coordinen el acceso a recursos
+    compartidos en disco (caché del driver, archivos de estado, etc.).
+
+    Note:
+        - El bloqueo se obtiene creando el archivo de forma exclusiva, lo que
+          funciona igual en Linux, macOS y Windows
+        - Un archivo de bloqueo más antiguo que ``stale_after`` se considera
+          abandonado (proceso interrumpido) y se elimina
+    """
+
+    def __init__(self, path, timeout=60, stale_after=300, poll_interval=0.05):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    def acquire(self):
+        """Obtener el bloqueo esperando como máximo ``timeout`` segundos
+
+        Raises:
+            TimeoutError: Si el bloqueo no se obtiene a tiempo
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return self
+            except FileExistsError:
+                self._remove_if_stale()
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"No se pudo obtener el bloqueo {self.path} en {self.timeout}s")
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        """Liberar el bloqueo"""
+        if self._fd is None:
+            return
+        os.close(self._fd)
+        self._fd = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _remove_if_stale(self):
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
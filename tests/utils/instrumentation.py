@@ -0,0 +1,203 @@
+import json
+import os
+import re
+import time
+
+SPAN_KINDS = ('comandos', 'esperas', 'navegaciones')
+
+SUMMARY_TITLES = {
+    'comandos': "Comandos de WebDriver más lentos",
+    'esperas': "Esperas más lentas por localizador",
+    'navegaciones': "Navegaciones más lentas",
+}
+
+
+class Instrumentation:
+    """Medición por prueba de comandos de WebDriver, esperas y navegaciones
+
+    Registra cuántas veces se ejecuta cada comando de WebDriver, cada espera
+    (por localizador y condición) y cada navegación, y cuánto tiempo toman.
+    Las esperas que terminan en timeout se contabilizan aparte. Al terminar
+    cada prueba se escribe un JSON en ``reports/profiles`` y al final de la
+    sesión se muestran las esperas y comandos más lentos.
+
+    Note:
+        - Solo está activa con ``--instrument``; desactivada, cada medición
+          se reduce a comprobar un atributo
+        - Los comandos se miden envolviendo ``command_executor.execute`` del
+          navegador (``attach``), una sola vez por navegador
+        - Con pytest-xdist cada worker envía sus totales al proceso principal
+          (``as_dict``/``merge``)
+    """
+
+    def __init__(self, directory=os.path.join('reports', 'profiles'), enabled=False, top_n=10):
+        self.directory = directory
+        self.enabled = enabled
+        self.top_n = top_n
+        self._test = None
+        self._current = None
+        self._started = 0.0
+        self._totals = {kind: {} for kind in SPAN_KINDS}
+
+    def configure(self, enabled=None, top_n=None):
+        if enabled is not None:
+            self.enabled = enabled
+        if top_n is not None:
+            self.top_n = top_n
+
+    @property
+    def active(self):
+        """Indica si hay una prueba en medición"""
+        return self._current is not None
+
+    def attach(self, driver):
+        """Medir los comandos que el navegador envía a chromedriver"""
+        executor = driver.command_executor
+        if getattr(executor, '_instrumented', False):
+            return
+        execute = executor.execute
+
+        def instrumented_execute(command, params):
+            if self._current is None:
+                return execute(command, params)
+            start = time.perf_counter()
+            try:
+                return execute(command, params)
+            finally:
+                self.record('comandos', command, time.perf_counter() - start)
+
+        executor.execute = instrumented_execute
+        executor._instrumented = True
+
+    def begin_test(self, test_name):
+        """Iniciar la medición de una prueba"""
+        if not self.enabled:
+            return
+        self._test = test_name
+        self._current = {kind: {} for kind in SPAN_KINDS}
+        self._started = time.perf_counter()
+
+    def end_test(self, outcome=None):
+        """Cerrar la medición de la prueba y escribir su JSON
+
+        Returns:
+            str: Ruta del archivo escrito o None si la medición no está activa
+        """
+        if self._current is None:
+            return None
+        profile = {
+            'test': self._test,
+            'outcome': outcome,
+            'duration_ms': round((time.perf_counter() - self._started) * 1000, 1),
+        }
+        for kind, spans in self._current.items():
+            profile[kind] = {key: _rounded(span) for key, span in
+                             sorted(spans.items(), key=lambda item: item[1][1], reverse=True)}
+            totals = self._totals[kind]
+            for key, span in spans.items():
+                totals[key] = _added(totals.get(key), span)
+        self._current = None
+
+        os.makedirs(self.directory, exist_ok=True)
+        nombre = re.sub(r'[^\w.-]+', '_', self._test)
+        path = os.path.join(self.directory, f"{nombre}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(profile, f, indent=2, ensure_ascii=False)
+        return path
+
+    def record(self, kind, key, seconds, timed_out=False):
+        """Registrar una duración en la prueba actual
+
+        Args:
+            kind: 'comandos', 'esperas' o 'navegaciones'
+            key: Comando, localizador o ruta medida
+            seconds: Duración en segundos
+            timed_out: Si la espera terminó por timeout
+        """
+        if self._current is None:
+            return
+        spans = self._current[kind]
+        span = spans.get(key)
+        if span is None:
+            span = spans[key] = [0, 0.0, 0, 0.0]
+        span[0] += 1
+        span[1] += seconds
+        if timed_out:
+            span[2] += 1
+            span[3] += seconds
+
+    def as_dict(self):
+        return {kind: dict(spans) for kind, spans in self._totals.items()}
+
+    def merge(self, data):
+        """Combinar los totales enviados por otro proceso (worker de xdist)"""
+        for kind, spans in data.items():
+            totals = self._totals.setdefault(kind, {})
+            for key, span in spans.items():
+                totals[key] = _added(totals.get(key), span)
+
+    def summary_lines(self):
+        """Generar el resumen de las esperas, comandos y navegaciones más lentos
+
+        Returns:
+            list: Tuplas (titulo, [lineas])
+        """
+        result = []
+        for kind in SPAN_KINDS:
+            spans = sorted(self._totals.get(kind, {}).items(), key=lambda item: item[1][1], reverse=True)
+            lines = []
+            for key, (count, total, timeouts, timeout_total) in spans[:self.top_n]:
+                line = f"{total * 1000:10.1f}ms  n={count:<5} {key}"
+                if timeouts:
+                    line += f"  (timeouts: {timeouts}, {timeout_total * 1000:.1f}ms)"
+                lines.append(line)
+            if lines:
+                result.append((f"{SUMMARY_TITLES[kind]} (top {self.top_n}, tiempo total)", lines))
+        return result
+
+
+def describe_condition(condition, locator=None):
+    """Nombre legible de una espera: condición y localizador
+
+    Args:
+        condition: Condición de ``expected_conditions``
+        locator: Localizador esperado (o una descripción); si no se indica
+                 se obtiene del cierre de la condición
+
+    Returns:
+        str: Por ejemplo ``LoginPage.LOGIN_FORM (presence_of_element_located)``
+    """
+    name = getattr(condition, '__qualname__', type(condition).__name__).split('.<locals>')[0]
+    argument = None
+    for cell in getattr(condition, '__closure__', None) or ():
+        value = cell.cell_contents
+        if locator is None and isinstance(value, tuple) and len(value) == 2:
+            locator = value
+        elif isinstance(value, str):
+            argument = value
+    if locator is None:
+        return f"{name} {argument!r}" if argument is not None else name
+    if isinstance(locator, str):
+        label = locator
+    else:
+        label = getattr(locator, 'name', None) or f"{locator[0]}={locator[1]}"
+    return f"{label} ({name})"
+
+
+def _added(span, other):
+    if span is None:
+        return list(other)
+    return [a + b for a, b in zip(span, other)]
+
+
+def _rounded(span):
+    count, total, timeouts, timeout_total = span
+    return {
+        'count': count,
+        'total_ms': round(total * 1000, 1),
+        'timeouts': timeouts,
+        'timeout_ms': round(timeout_total * 1000, 1),
+    }
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,281 @@
+import argparse
+import hashlib
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .file_lock import FileLock
+from .session_stats import session_stats
+
+STATS_SECTION = 'launch_profiles'
+
+DEFAULT_TEMPLATE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'inlaze-qa', 'chrome-templates')
+
+BASE_ARGUMENTS = (
+    '--headless=new',
+    '--start-maximized',
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-software-rasterizer',
+)
+
+# Actividad en segundo plano que no aporta a las pruebas: red, actualizaciones
+# de componentes, extensiones, sincronización, primer inicio y throttling de
+# pestañas en segundo plano
+THROUGHPUT_ARGUMENTS = (
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-search-engine-choice-screen',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-client-side-phishing-detection',
+    '--disable-domain-reliability',
+    '--disable-breakpad',
+    '--disable-hang-monitor',
+    '--disable-popup-blocking',
+    '--disable-prompt-on-repost',
+    '--metrics-recording-only',
+    '--password-store=basic',
+    '--use-mock-keychain',
+    '--mute-audio',
+    '--disable-features=Translate,OptimizationHints,MediaRouter,DialMediaRouteProvider,'
+    'CertificateTransparencyComponentUpdater,AutofillServerCommunication,InterestFeedContentSuggestions',
+)
+
+HEADLESS_SHELL_ENV = 'CHROME_HEADLESS_SHELL'
+
+# ioctl de Linux que clona un archivo con copia en escritura (reflink) en
+# Btrfs, XFS y otros sistemas de archivos que lo admiten
+FICLONE = 0x40049409
+
+# Archivos de bloqueo de una instancia de Chrome que no deben clonarse
+IGNORED_FILES = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile')
+
+
+def find_headless_shell():
+    """Ruta de ``chrome-headless-shell`` (variable ``CHROME_HEADLESS_SHELL`` o PATH), o None"""
+    path = os.environ.get(HEADLESS_SHELL_ENV) or shutil.which('chrome-headless-shell')
+    return path if path and os.path.exists(path) else None
+
+
+class LaunchProfile:
+    """Configuración de arranque de Chrome con nombre
+
+    Args:
+        name: Nombre del perfil (``--launch-profile``)
+        arguments: Argumentos de línea de comandos de Chrome
+        template: Si cada navegador parte de un perfil precalentado
+        headless_shell: Si se usa ``chrome-headless-shell`` cuando está instalado
+    """
+
+    def __init__(self, name, arguments, template=False, headless_shell=False):
+        self.name = name
+        self.arguments = tuple(arguments)
+        self.template = template
+        self.headless_shell = headless_shell
+
+    @property
+    def binary(self):
+        """Binario de Chrome a usar (None: el Chrome instalado)"""
+        return find_headless_shell() if self.headless_shell else None
+
+    def options(self):
+        """Crear las opciones de Chrome del perfil
+
+        Note:
+            ``chrome-headless-shell`` siempre es headless y no admite
+            ``--headless=new``, por lo que en ese caso se omite.
+        """
+        options = Options()
+        binary = self.binary
+        for argument in self.arguments:
+            if binary and argument.startswith('--headless'):
+                continue
+            options.add_argument(argument)
+        if binary:
+            options.binary_location = binary
+        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        return options
+
+
+PROFILES = {
+    'default': LaunchProfile('default', BASE_ARGUMENTS),
+    'throughput': LaunchProfile('throughput', BASE_ARGUMENTS + THROUGHPUT_ARGUMENTS, template=True, headless_shell=True),
+}
+
+
+class ProfileTemplate:
+    """Perfil de Chrome precalentado que se clona para cada navegador
+
+    El perfil se crea una vez (primer inicio completado y caché de disco con
+    los recursos de la aplicación) y se comparte entre ejecuciones y workers
+    de xdist. Cada navegador recibe un clon independiente, por lo que un
+    navegador no puede modificar la plantilla.
+
+    Note:
+        - La plantilla depende del perfil de arranque, de la versión de Chrome
+          y de la URL de la aplicación
+        - Los archivos se clonan con copia en escritura (reflink) si el
+          sistema de archivos lo admite y si no se copian. No se usan enlaces
+          duros: Chrome modifica en el lugar los índices y bloques de la caché
+          de disco (``Cache``, ``Code Cache``), lo que alteraría la plantilla
+    """
+
+    def __init__(self, profile, chrome_version, base_url, root=None, stats=session_stats):
+        """
+        Args:
+            profile: Perfil de arranque de la plantilla
+            chrome_version: Versión de Chrome que crea el perfil
+            base_url: URL de la aplicación (``local`` para la simulación, cuyo
+                      puerto cambia en cada ejecución)
+            root: Directorio de las plantillas (por defecto ``~/.cache/inlaze-qa/chrome-templates``)
+        """
+        digest = hashlib.sha1(f"{chrome_version}|{base_url}".encode('utf-8')).hexdigest()[:12]
+        self.path = os.path.join(root or DEFAULT_TEMPLATE_DIR, f"{profile.name}-{digest}")
+        self.stats = stats
+        stats.register_section(STATS_SECTION, "Perfiles de arranque de Chrome")
+
+    @property
+    def ready(self):
+        return os.path.exists(os.path.join(self.path, '.ready'))
+
+    def ensure(self, warm):
+        """Crear la plantilla si todavía no existe
+
+        Args:
+            warm: Función que recibe un directorio de perfil vacío, inicia
+                  Chrome con él, visita la aplicación y cierra el navegador
+        """
+        if self.ready:
+            return
+        with FileLock(f"{self.path}.lock", timeout=300):
+            if self.ready:
+                return
+            start = time.perf_counter()
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            staging = tempfile.mkdtemp(prefix='template-', dir=os.path.dirname(self.path))
+            try:
+                warm(staging)
+                shutil.rmtree(self.path, ignore_errors=True)
+                os.replace(staging, self.path)
+            except Exception:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+            open(os.path.join(self.path, '.ready'), 'w').close()
+            self.stats.add_timing(STATS_SECTION, 'creación de la plantilla de perfil', time.perf_counter() - start)
+
+    def clone(self, destination):
+        """Clonar la plantilla en el directorio de perfil de un navegador"""
+        start = time.perf_counter()
+        for directory, subdirectories, files in os.walk(self.path):
+            relative = os.path.relpath(directory, self.path)
+            target = os.path.normpath(os.path.join(destination, relative))
+            os.makedirs(target, exist_ok=True)
+            for name in files:
+                if name in IGNORED_FILES or name == '.ready':
+                    continue
+                source = os.path.join(directory, name)
+                if not self._reflink(source, os.path.join(target, name)):
+                    shutil.copy2(source, os.path.join(target, name))
+        self.stats.add_timing(STATS_SECTION, 'clonado del perfil', time.perf_counter() - start)
+
+    def _reflink(self, source, target):
+        if fcntl is None:
+            return False
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            return False
+        shutil.copystat(source, target)
+        return True
+
+
+def launch(profile, options, service, stats=session_stats):
+    """Iniciar Chrome y medir el tiempo hasta que responde al primer comando
+
+    Args:
+        profile: Perfil de arranque (para etiquetar la medición)
+        options: Opciones de Chrome (``profile.options()`` más las del navegador)
+        service: ``Service`` de chromedriver
+
+    Returns:
+        tuple: (WebDriver, segundos hasta el primer comando)
+    """
+    start = time.perf_counter()
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.set_window_size(1920, 1080)
+    elapsed = time.perf_counter() - start
+    stats.register_section(STATS_SECTION, "Perfiles de arranque de Chrome")
+    stats.add_timing(STATS_SECTION, f"tiempo hasta el primer comando ({profile.name})", elapsed)
+    return driver, elapsed
+
+
+def warm(options, service, user_data_dir, url):
+    """Precalentar un perfil: iniciar Chrome con él, visitar la aplicación y cerrarlo"""
+    options.add_argument(f'--user-data-dir={user_data_dir}')
+    driver = webdriver.Chrome(service=service, options=options)
+    try:
+        driver.get(url)
+    finally:
+        driver.quit()
+
+
+def main():
+    """Comparar el tiempo hasta el primer comando de los perfiles de arranque
+
+    Ejemplo:
+        python -m tests.utils.launch_profiles --runs 5 --url http://localhost:8080
+    """
+    from .driver_resolver import ChromeDriverResolver
+
+    parser = argparse.ArgumentParser(description="Medición del arranque de Chrome por perfil")
+    parser.add_argument('--runs', type=int, default=5, help="Navegadores iniciados por perfil")
+    parser.add_argument('--profiles', nargs='+', default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument('--url', default='about:blank', help="URL con la que se precalienta la plantilla")
+    args = parser.parse_args()
+
+    for name in args.profiles:
+        profile = PROFILES[name]
+        resolver = ChromeDriverResolver(chrome_binary=profile.binary)
+        template = None
+        if profile.template:
+            template = ProfileTemplate(profile, resolver.detect_chrome_version(), args.url)
+            template.ensure(lambda directory: warm(profile.options(), resolver.service(), directory, args.url))
+        samples = []
+        for _ in range(args.runs):
+            user_data_dir = tempfile.mkdtemp(prefix=f'chrome-{name}-')
+            try:
+                if template:
+                    template.clone(user_data_dir)
+                options = profile.options()
+                options.add_argument(f'--user-data-dir={user_data_dir}')
+                driver, elapsed = launch(profile, options, resolver.service())
+                driver.quit()
+                samples.append(elapsed)
+            finally:
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+        print(f"{name:<12} mediana={statistics.median(samples) * 1000:8.1f}ms "
+              f"máx={max(samples) * 1000:8.1f}ms  ({profile.binary or 'Chrome instalado'})")
+
+
+if __name__ == '__main__':
+    main()
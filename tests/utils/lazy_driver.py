@@ -0,0 +1,65 @@
+from .session_stats import session_stats
+
+STATS_SECTION = 'lazy_driver'
+
+
+class LazyDriver:
+    """Proxy de WebDriver que obtiene el navegador solo cuando se usa
+
+    Las pruebas reciben este proxy en lugar del navegador. Mientras solo se
+    asignen o lean atributos propios del framework (``test_name``,
+    ``fill_mode``, ``pending_navigation``...) no se solicita ningún navegador;
+    el primer comando real de WebDriver (``get``, ``find_element``,
+    ``execute_script``...) lo toma del pool y le traslada esos atributos.
+
+    Note:
+        - Las pruebas que se resuelven sin tocar el DOM (por ejemplo,
+          validaciones del lado del cliente) no lanzan ni ocupan un navegador
+        - ``lazy`` permite a los page objects diferir también la navegación
+    """
+
+    lazy = True
+
+    def __init__(self, acquire, stats=session_stats):
+        """
+        Args:
+            acquire: Función sin argumentos que devuelve un WebDriver
+            stats: Acumulador de métricas de la sesión
+        """
+        object.__setattr__(self, '_acquire', acquire)
+        object.__setattr__(self, '_driver', None)
+        object.__setattr__(self, '_attributes', {'pending_navigation': None})
+        object.__setattr__(self, '_stats', stats)
+        stats.register_section(STATS_SECTION, "Navegador y navegación diferidos")
+
+    @property
+    def materialized(self):
+        """Indica si ya se obtuvo un navegador real"""
+        return self._driver is not None
+
+    @property
+    def wrapped_driver(self):
+        """Navegador real, o None si todavía no se solicitó"""
+        return self._driver
+
+    def materialize(self):
+        """Obtener el navegador real (solo la primera vez)"""
+        if self._driver is None:
+            driver = self._acquire()
+            for name, value in self._attributes.items():
+                setattr(driver, name, value)
+            object.__setattr__(self, '_driver', driver)
+            self._stats.incr(STATS_SECTION, 'navegadores usados')
+        return self._driver
+
+    def __getattr__(self, name):
+        attributes = self._attributes
+        if self._driver is None and name in attributes:
+            return attributes[name]
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name, value):
+        if self._driver is None:
+            self._attributes[name] = value
+        else:
+            setattr(self._driver, name, value)
@@ -0,0 +1,231 @@
+import base64
+import fnmatch
+import json
+import threading
+from urllib.parse import urlsplit
+
+import trio
+
+from .session_stats import session_stats
+
+STATS_SECTION = 'response_stubs'
+
+DEFAULT_HEADERS = {'Content-Type': 'application/json; charset=utf-8'}
+
+# Tipos de recurso interceptados: las llamadas a la API de la aplicación y sus
+# solicitudes CORS previas. La carga de documentos, scripts o estilos con una
+# ruta que coincida nunca se pausa.
+RESOURCE_TYPES = ('XHR', 'FETCH', 'PREFLIGHT')
+
+
+class ResponseStub:
+    """Respuesta simulada para las peticiones de un método y una ruta
+
+    Args:
+        method: Método HTTP (``POST``...)
+        path: Ruta o patrón ``fnmatch`` que debe cumplir el final de la ruta
+              de la URL (``/auth/sign-in`` coincide con ``/api/auth/sign-in``)
+        status: Código de estado de la respuesta
+        body: Cuerpo de la respuesta; los diccionarios y listas se envían como JSON
+        headers: Cabeceras adicionales de la respuesta
+    """
+
+    def __init__(self, method, path, status, body=None, headers=None):
+        self.method = method.upper()
+        self.path = path
+        self.status = status
+        self.body = body
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self.hits = []
+
+    @property
+    def url_pattern(self):
+        """Patrón de URL del dominio Fetch que captura las peticiones de la ruta"""
+        return f"*{self.path}*"
+
+    def matches(self, method, url):
+        return method.upper() in (self.method, 'OPTIONS') and fnmatch.fnmatchcase(urlsplit(url).path, f"*{self.path}")
+
+    def encoded_body(self):
+        """Cuerpo de la respuesta en base64, como lo espera ``Fetch.fulfillRequest``"""
+        body = self.body
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        return base64.b64encode(body or b'').decode('ascii')
+
+    def __repr__(self):
+        return f"{self.method} {self.path} -> {self.status}"
+
+
+class ResponseStubs:
+    """Respuestas del backend simuladas mediante el dominio Fetch de Chrome
+
+    Las pruebas declaran qué responde el backend (por ejemplo, ``sign-in``
+    responde 401) y las peticiones XHR o fetch de la aplicación que coinciden
+    se resuelven en el navegador, sin llegar al servidor. Las demás
+    peticiones, incluida la carga de páginas y recursos estáticos, continúan
+    sin cambios.
+
+    Note:
+        - La conexión DevTools (``bidi_connection`` de Selenium) se atiende en
+          un hilo con su propio bucle de trio, ya que las peticiones pausadas
+          llegan como eventos
+        - Cada petición atendida queda registrada en ``ResponseStub.hits``
+        - Las solicitudes CORS previas (``OPTIONS``) de una ruta simulada se
+          responden también, para que funcione con una API en otro dominio
+        - Al cerrar la conexión Chrome deja de interceptar, por lo que el
+          navegador vuelve al pool sin respuestas simuladas
+    """
+
+    def __init__(self, driver, stats=session_stats):
+        self.driver = driver
+        self.stats = stats
+        self.stubs = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+        self._token = None
+        self._cancel_scope = None
+        self._session = None
+        self._devtools = None
+        stats.register_section(STATS_SECTION, "Respuestas simuladas del backend")
+
+    def add(self, method, path, status, body=None, headers=None):
+        """Declarar una respuesta simulada
+
+        Returns:
+            ResponseStub: Respuesta declarada, con el registro de sus peticiones
+
+        Example:
+            response_stubs.add('POST', '/auth/sign-in', 401, {'message': '...'})
+        """
+        stub = ResponseStub(method, path, status, body, headers)
+        with self._lock:
+            self.stubs.append(stub)
+        if self._thread is None:
+            self.start()
+        else:
+            self._call(self._enable)
+        return stub
+
+    def match(self, method, url):
+        """Respuesta simulada para una petición, la última declarada primero, o None"""
+        with self._lock:
+            return next((stub for stub in reversed(self.stubs) if stub.matches(method, url)), None)
+
+    def response_for(self, method, url, headers):
+        """Parámetros de ``Fetch.fulfillRequest`` para una petición, o None si se deja pasar
+
+        Args:
+            method: Método HTTP de la petición
+            url: URL de la petición
+            headers: Cabeceras de la petición
+
+        Returns:
+            tuple: (código de estado, cabeceras, cuerpo en base64) o None
+        """
+        stub = self.match(method, url)
+        if stub is None:
+            return None
+        origin = next((value for name, value in headers.items() if name.lower() == 'origin'), '*')
+        cors = {
+            'Access-Control-Allow-Origin': origin,
+            'Access-Control-Allow-Credentials': 'true',
+        }
+        if method.upper() == 'OPTIONS' and stub.method != 'OPTIONS':
+            cors.update({
+                'Access-Control-Allow-Methods': stub.method,
+                'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+            })
+            return 204, cors, ''
+        with self._lock:
+            stub.hits.append({'method': method.upper(), 'url': url})
+        self.stats.incr(STATS_SECTION, f"respuestas simuladas ({stub.status})")
+        return stub.status, dict(stub.headers, **cors), stub.encoded_body()
+
+    def unused(self):
+        """Respuestas declaradas que ninguna petición usó"""
+        with self._lock:
+            return [stub for stub in self.stubs if not stub.hits]
+
+    def start(self, timeout=10):
+        """Abrir la conexión DevTools y empezar a interceptar
+
+        Raises:
+            Exception: Si la conexión no se establece a tiempo
+        """
+        self._thread = threading.Thread(target=self._run_loop, name='response-stubs', daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout) or self._error is not None:
+            raise Exception(f"No se pudo activar la interceptación de respuestas: {self._error or 'tiempo agotado'}")
+
+    def stop(self, timeout=5):
+        """Dejar de interceptar y cerrar la conexión DevTools"""
+        if self._thread is None:
+            return
+        if self._token is not None and self._cancel_scope is not None:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._token)
+            except trio.RunFinishedError:
+                pass
+        self._thread.join(timeout)
+        self._thread = None
+        unused = len(self.unused())
+        if unused:
+            self.stats.incr(STATS_SECTION, 'respuestas declaradas sin usar', unused)
+
+    def _run_loop(self):
+        try:
+            trio.run(self._listen)
+        except Exception as e:
+            self._error = e
+        finally:
+            self._ready.set()
+
+    async def _listen(self):
+        async with self.driver.bidi_connection() as connection:
+            self._session = connection.session
+            self._devtools = connection.devtools
+            self._token = trio.lowlevel.current_trio_token()
+            await self._enable()
+            paused = self._session.listen(self._devtools.fetch.RequestPaused, buffer_size=50)
+            async with trio.open_nursery() as nursery:
+                self._cancel_scope = nursery.cancel_scope
+                self._ready.set()
+                async for event in paused:
+                    nursery.start_soon(self._handle, event)
+
+    async def _enable(self):
+        fetch = self._devtools.fetch
+        with self._lock:
+            patterns = [
+                fetch.RequestPattern(
+                    url_pattern=stub.url_pattern,
+                    resource_type=getattr(self._devtools.network.ResourceType, resource_type),
+                    request_stage=fetch.RequestStage.REQUEST,
+                )
+                for stub in self.stubs
+                for resource_type in RESOURCE_TYPES
+            ]
+        await self._session.execute(fetch.enable(patterns=patterns))
+
+    async def _handle(self, event):
+        fetch = self._devtools.fetch
+        request = event.request
+        response = self.response_for(request.method, request.url, dict(request.headers or {}))
+        if response is None:
+            await self._session.execute(fetch.continue_request(request_id=event.request_id))
+            return
+        status, headers, body = response
+        await self._session.execute(fetch.fulfill_request(
+            request_id=event.request_id,
+            response_code=status,
+            response_headers=[fetch.HeaderEntry(name=name, value=value) for name, value in headers.items()],
+            body=body,
+        ))
+
+    def _call(self, async_fn):
+        trio.from_thread.run(async_fn, trio_token=self._token)
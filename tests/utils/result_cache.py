@@ -0,0 +1,199 @@
+import hashlib
+import inspect
+import json
+import sys
+import types
+from datetime import datetime
+
+from .session_stats import session_stats
+
+STATS_SECTION = 'result_cache'
+
+CACHE_KEY = 'inlaze/results'
+
+# Propiedades de usuario con las que el resultado viaja desde los workers de
+# xdist hasta el proceso principal, que es el que guarda la caché
+KEY_PROPERTY = 'result_cache_key'
+HIT_PROPERTY = 'result_cache_hit'
+
+
+def module_closure(module):
+    """Módulos del proyecto de los que depende un módulo, incluido él mismo
+
+    Recorre los objetos globales del módulo (módulos importados, clases y
+    funciones) y, de forma transitiva, los de los módulos del mismo paquete
+    raíz. Así una prueba depende de ``login_page``, de ``base_page`` (su clase
+    base) y de las utilidades que estos usan.
+
+    Returns:
+        dict: ``nombre -> módulo``
+    """
+    package = module.__name__.split('.')[0]
+    seen = {}
+    stack = [module]
+    while stack:
+        current = stack.pop()
+        if current.__name__ in seen:
+            continue
+        seen[current.__name__] = current
+        for value in list(vars(current).values()):
+            if isinstance(value, types.ModuleType):
+                dependency = value
+            else:
+                dependency = sys.modules.get(getattr(value, '__module__', None) or '')
+            if dependency is None or dependency.__name__ in seen:
+                continue
+            if dependency.__name__ == package or dependency.__name__.startswith(f"{package}."):
+                stack.append(dependency)
+    return seen
+
+
+class ResultCache:
+    """Caché de resultados: omite las pruebas que ya pasaron con las mismas entradas
+
+    La clave de cada prueba es un hash de:
+        - el código de la función de prueba
+        - el código de los módulos del proyecto que usa: los que importa su
+          módulo (page objects, datos de prueba...) y los de sus fixtures
+          (``conftest.py``), de forma transitiva
+        - sus parámetros (``parametrize``) y marcadores
+        - la URL de la aplicación y la huella de su compilación
+          (``--app-fingerprint``); con la simulación local, además, el
+          contenido de sus archivos estáticos y sus opciones (latencia,
+          tasa de errores)
+
+    Note:
+        - Solo se guardan las pruebas que pasaron en todas sus fases; un fallo
+          elimina la entrada
+        - Cualquier cambio en las entradas cambia la clave, por lo que la
+          entrada anterior deja de usarse
+        - La caché se guarda en la caché de pytest (``config.cache``); con
+          xdist la clave viaja en ``user_properties`` hasta el proceso principal
+    """
+
+    def __init__(self, enabled=False, environment='', stats=session_stats):
+        self.enabled = enabled
+        self.environment = environment
+        self.stats = stats
+        self.entries = {}
+        self._file_hashes = {}
+        self._dirty = False
+        stats.register_section(STATS_SECTION, "Caché de resultados")
+
+    def configure(self, enabled, base_url, fingerprint=None, cache=None, details=None):
+        """Activar la caché para una aplicación y cargar los resultados guardados
+
+        Args:
+            enabled: Si se omiten las pruebas con resultado en caché
+            base_url: URL de la aplicación bajo prueba
+            fingerprint: Huella de la compilación de la aplicación
+            cache: Caché de pytest (``config.cache``)
+            details: Otras entradas del entorno que forman parte de la clave
+                     (diccionario serializable a JSON)
+
+        Raises:
+            ValueError: Si se activa sin huella ni ``details``: sin la versión
+                        de la aplicación, una prueba seguiría omitiéndose
+                        después de un nuevo despliegue
+        """
+        if enabled and not fingerprint and not details:
+            raise ValueError(
+                f"La caché de resultados necesita la huella de la compilación de {base_url} "
+                f"(--app-fingerprint o APP_FINGERPRINT); sin ella un nuevo despliegue no invalidaría los resultados"
+            )
+        self.enabled = enabled and cache is not None
+        self.environment = f"{base_url}|{fingerprint or ''}|{json.dumps(details or {}, sort_keys=True)}"
+        self.entries = dict(cache.get(CACHE_KEY, {})) if self.enabled else {}
+
+    def key_for(self, item):
+        """Clave de la prueba: hash de su código, dependencias, parámetros y entorno"""
+        digest = hashlib.sha256(self.environment.encode('utf-8'))
+        function = getattr(item, 'function', None)
+        digest.update(inspect.getsource(function).encode('utf-8') if function else item.nodeid.encode('utf-8'))
+
+        test_module = getattr(item, 'module', None)
+        modules = {}
+        for module in self._fixture_modules(item, test_module) + [test_module]:
+            if module is not None:
+                modules.update(module_closure(module))
+        # Del módulo de la prueba solo cuenta la función (ya incluida)
+        modules.pop(getattr(test_module, '__name__', None), None)
+        for name in sorted(modules):
+            digest.update(name.encode('utf-8'))
+            digest.update(self._hash_file(getattr(modules[name], '__file__', None)))
+
+        callspec = getattr(item, 'callspec', None)
+        if callspec is not None:
+            digest.update(repr(sorted(callspec.params.items())).encode('utf-8'))
+        for marker in item.iter_markers():
+            if marker.name != 'parametrize':
+                digest.update(repr((marker.name, marker.args, sorted(marker.kwargs.items()))).encode('utf-8'))
+        return digest.hexdigest()
+
+    def lookup(self, item):
+        """Buscar un resultado guardado para la prueba
+
+        Returns:
+            str: Fecha en que la prueba pasó con las mismas entradas, o None
+        """
+        key = self.key_for(item)
+        item.user_properties.append((KEY_PROPERTY, key))
+        entry = self.entries.get(item.nodeid)
+        if entry and entry['key'] == key:
+            item.user_properties.append((HIT_PROPERTY, True))
+            return entry['passed_at']
+        return None
+
+    def record(self, report):
+        """Registrar el resultado de una fase de la prueba (en el proceso principal)"""
+        properties = dict(report.user_properties)
+        key = properties.get(KEY_PROPERTY)
+        if not self.enabled or key is None:
+            return
+        if properties.get(HIT_PROPERTY):
+            if report.when == 'setup':
+                self.stats.incr(STATS_SECTION, 'pruebas omitidas (resultado en caché)')
+            return
+        if report.failed:
+            if self.entries.pop(report.nodeid, None) is not None:
+                self.stats.incr(STATS_SECTION, 'entradas eliminadas por fallo')
+            self._dirty = True
+        elif report.when == 'call' and report.passed:
+            self.entries[report.nodeid] = {'key': key, 'passed_at': datetime.now().isoformat(timespec='seconds')}
+            self.stats.incr(STATS_SECTION, 'resultados guardados')
+            self._dirty = True
+
+    def save(self, cache):
+        if self.enabled and self._dirty and cache is not None:
+            cache.set(CACHE_KEY, self.entries)
+            self._dirty = False
+
+    def _fixture_modules(self, item, test_module):
+        """Módulos del proyecto que definen los fixtures de la prueba (``conftest.py``)"""
+        if test_module is None:
+            return []
+        package = test_module.__name__.split('.')[0]
+        info = getattr(item, '_fixtureinfo', None)
+        modules = []
+        for definitions in (info.name2fixturedefs.values() if info else ()):
+            for definition in definitions:
+                name = getattr(definition.func, '__module__', None) or ''
+                if name.split('.')[0] == package and name in sys.modules:
+                    modules.append(sys.modules[name])
+        return modules
+
+    def _hash_file(self, path):
+        if path is None:
+            return b''
+        digest = self._file_hashes.get(path)
+        if digest is None:
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).digest()
+            except OSError:
+                digest = b''
+            self._file_hashes[path] = digest
+        return digest
+
+
+result_cache = ResultCache()
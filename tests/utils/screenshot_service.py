@@ -0,0 +1,168 @@
+import base64
+import hashlib
+import itertools
+import os
+import queue
+import re
+import threading
+import time
+from datetime import datetime
+from selenium.common.exceptions import WebDriverException
+
+from .session_stats import session_stats
+
+STATS_SECTION = 'screenshots'
+
+FORMATS = ('png', 'jpeg')
+
+
+class ScreenshotService:
+    """Servicio de capturas de pantalla de errores
+
+    El hilo de la prueba solo obtiene los bytes de la captura (en base64, tal
+    como los entrega el navegador); la decodificación y la escritura en disco
+    se realizan en un hilo en segundo plano.
+
+    Note:
+        - Dentro de una prueba, una captura idéntica a una anterior no se
+          vuelve a guardar (se compara el hash de los bytes)
+        - ``per_test_limit`` limita las capturas por prueba (por defecto una
+          por fallo); las siguientes devuelven la ruta de la primera
+        - ``jpeg`` usa ``Page.captureScreenshot`` de DevTools con la calidad
+          indicada; si la imagen supera ``max_bytes`` se repite con menor
+          calidad
+        - ``max_files`` conserva solo las capturas más recientes del proceso
+    """
+
+    def __init__(self, directory=os.path.join('reports', 'screenshots'), image_format='png',
+                 quality=70, max_bytes=0, max_files=200, per_test_limit=1, stats=session_stats):
+        self.directory = directory
+        self.configure(image_format, quality, max_bytes, max_files, per_test_limit)
+        self.stats = stats
+        self._queue = queue.Queue()
+        self._thread = None
+        self._sequence = itertools.count(1)
+        self._written = []
+        self._test = None
+        self._hashes = {}
+        self._captures = []
+        stats.register_section(STATS_SECTION, "Capturas de pantalla")
+
+    def configure(self, image_format=None, quality=None, max_bytes=None, max_files=None, per_test_limit=None):
+        """Cambiar el formato, la calidad o los límites de las capturas
+
+        Raises:
+            ValueError: Si el formato no es 'png' ni 'jpeg'
+        """
+        if image_format is not None:
+            if image_format not in FORMATS:
+                raise ValueError(f"Formato de captura no válido: {image_format}. Use uno de {FORMATS}")
+            self.image_format = image_format
+        if quality is not None:
+            self.quality = int(quality)
+        if max_bytes is not None:
+            self.max_bytes = int(max_bytes)
+        if max_files is not None:
+            self.max_files = int(max_files)
+        if per_test_limit is not None:
+            self.per_test_limit = int(per_test_limit)
+
+    def begin_test(self, test_name):
+        """Reiniciar el estado de deduplicación y el límite para una nueva prueba"""
+        self._test = test_name
+        self._hashes = {}
+        self._captures = []
+
+    def capture(self, driver, nombre_base=None):
+        """Capturar la pantalla y encolar su escritura
+
+        Args:
+            driver: Navegador a capturar
+            nombre_base: Nombre base del archivo (por defecto, la prueba actual)
+
+        Returns:
+            str: Ruta relativa donde se guardará la captura (o la de una captura
+                 anterior idéntica o que agotó el límite de la prueba)
+        """
+        if self.per_test_limit and len(self._captures) >= self.per_test_limit:
+            self.stats.incr(STATS_SECTION, 'capturas omitidas por límite')
+            return self._captures[0]
+
+        start = time.perf_counter()
+        data, extension = self._grab(driver)
+        digest = hashlib.blake2b(data.encode('ascii'), digest_size=16).digest()
+        if digest in self._hashes:
+            self.stats.incr(STATS_SECTION, 'capturas duplicadas omitidas')
+            return self._hashes[digest]
+
+        nombre_base = re.sub(r'[^\w.-]+', '_', nombre_base or self._test or 'test')
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
+        path = os.path.join(self.directory, f"error_{nombre_base}_{timestamp}_{next(self._sequence)}.{extension}")
+        self._hashes[digest] = path
+        self._captures.append(path)
+        self._ensure_thread()
+        self._queue.put((path, data))
+        self.stats.add_timing(STATS_SECTION, 'captura (hilo de la prueba)', time.perf_counter() - start)
+        return path
+
+    def flush(self):
+        """Esperar a que se escriban todas las capturas encoladas"""
+        if self._thread:
+            self._queue.join()
+
+    def close(self):
+        """Escribir las capturas pendientes y detener el hilo de escritura"""
+        if self._thread:
+            self._queue.join()
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _grab(self, driver):
+        if self.image_format == 'jpeg':
+            try:
+                quality = self.quality
+                while True:
+                    data = driver.execute_cdp_cmd(
+                        'Page.captureScreenshot', {'format': 'jpeg', 'quality': quality}
+                    )['data']
+                    if not self.max_bytes or len(data) * 3 // 4 <= self.max_bytes or quality <= 10:
+                        return data, 'jpg'
+                    quality = max(10, quality // 2)
+            except (AttributeError, KeyError, WebDriverException):
+                # Navegadores sin DevTools: se usa la captura PNG estándar
+                self.stats.incr(STATS_SECTION, 'capturas jpeg no disponibles')
+        return driver.get_screenshot_as_base64(), 'png'
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._thread = threading.Thread(target=self._write_loop, name='screenshot-writer', daemon=True)
+            self._thread.start()
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, data = item
+                with open(path, 'wb') as f:
+                    f.write(base64.b64decode(data))
+                self._written.append(path)
+                self.stats.incr(STATS_SECTION, 'capturas guardadas')
+                self._apply_retention()
+            except OSError:
+                self.stats.incr(STATS_SECTION, 'capturas con error de escritura')
+            finally:
+                self._queue.task_done()
+
+    def _apply_retention(self):
+        while self.max_files and len(self._written) > self.max_files:
+            try:
+                os.remove(self._written.pop(0))
+            except FileNotFoundError:
+                pass
+
+
+screenshot_service = ScreenshotService()
@@ -0,0 +1,94 @@
+import threading
+
+
+class SessionStats:
+    """Acumulador de métricas de la sesión de pruebas
+
+    Cada componente del framework (pool de navegadores, resolución del driver,
+    etc.) registra contadores y tiempos bajo una sección propia. Al final de la
+    sesión las métricas se muestran en el resumen de pytest.
+
+    Note:
+        - Con pytest-xdist cada worker acumula sus propias métricas y las envía
+          al proceso principal mediante ``workeroutput``; allí se combinan con
+          ``merge`` antes de imprimir el resumen
+        - Solo se almacenan tipos simples (int, float, list) para que los datos
+          puedan serializarse entre procesos
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._titles = {}
+        self._counters = {}
+        self._timings = {}
+
+    def register_section(self, section, title):
+        """Registrar el título con el que se muestra una sección en el resumen"""
+        self._titles.setdefault(section, title)
+
+    def incr(self, section, key, amount=1):
+        """Incrementar un contador de la sección indicada"""
+        with self._lock:
+            counters = self._counters.setdefault(section, {})
+            counters[key] = counters.get(key, 0) + amount
+
+    def add_timing(self, section, key, seconds):
+        """Registrar una duración (en segundos) bajo la sección indicada"""
+        with self._lock:
+            self._timings.setdefault(section, {}).setdefault(key, []).append(seconds)
+
+    def get(self, section, key, default=0):
+        return self._counters.get(section, {}).get(key, default)
+
+    def as_dict(self):
+        """Exportar las métricas en un formato serializable entre procesos"""
+        with self._lock:
+            return {
+                'titles': dict(self._titles),
+                'counters': {s: dict(c) for s, c in self._counters.items()},
+                'timings': {s: {k: list(v) for k, v in t.items()} for s, t in self._timings.items()},
+            }
+
+    def merge(self, data):
+        """Combinar las métricas exportadas por otro proceso (worker de xdist)"""
+        for section, title in data.get('titles', {}).items():
+            self.register_section(section, title)
+        for section, counters in data.get('counters', {}).items():
+            for key, value in counters.items():
+                self.incr(section, key, value)
+        with self._lock:
+            for section, timings in data.get('timings', {}).items():
+                for key, values in timings.items():
+                    self._timings.setdefault(section, {}).setdefault(key, []).extend(values)
+
+    def summary_lines(self):
+        """Generar las líneas del resumen agrupadas por sección
+
+        Returns:
+            list: Tuplas (titulo, [lineas]) en orden de registro
+        """
+        sections = list(self._titles)
+        for section in list(self._counters) + list(self._timings):
+            if section not in sections:
+                sections.append(section)
+
+        result = []
+        for section in sections:
+            lines = []
+            for key, value in self._counters.get(section, {}).items():
+                lines.append(f"{key}: {value}")
+            for key, values in self._timings.get(section, {}).items():
+                if not values:
+                    continue
+                ordered = sorted(values)
+                mean = sum(ordered) / len(ordered)
+                p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+                lines.append(
+                    f"{key}: n={len(ordered)} media={mean * 1000:.1f}ms p95={p95 * 1000:.1f}ms"
+                )
+            if lines:
+                result.append((self._titles.get(section, section), lines))
+        return result
+
+
+session_stats = SessionStats()
@@ -1,6 +1,7 @@
 import random
 import string
-from datetime import datetime
+from .unique_ids import unique_ids
+from .validation_rules import PASSWORD_MIN_LENGTH, SPECIAL_CHARACTERS
 
 class TestDataGenerator:
     """Generador de datos de prueba para validaciones de registro e inicio de sesión
@@ -10,8 +11,8 @@ class TestDataGenerator:
     los requisitos del sistema.
     """
 
-    CARACTERES_ESPECIALES = '!@#$%^&*(),.?":{}|<>'
-    MIN_LONGITUD_PASSWORD = 8
+    CARACTERES_ESPECIALES = SPECIAL_CHARACTERS
+    MIN_LONGITUD_PASSWORD = PASSWORD_MIN_LENGTH
     MAX_LONGITUD_PASSWORD = 20
     MIN_LONGITUD_NOMBRE = 3
     MAX_LONGITUD_NOMBRE = 50
@@ -58,14 +59,14 @@ class TestDataGenerator:
             El correo generado:
             - Usa el nombre proporcionado o genera uno nuevo
             - Reemplaza espacios por puntos
-            - Agrega timestamp para garantizar unicidad
+            - Agrega un identificador único (worker, proceso y contador) que
+              no se repite entre workers de xdist ni dentro del mismo segundo
             - Usa el dominio @inlaze.test
         """
         if not nombre:
             nombre = TestDataGenerator.generar_nombre()
         email_base = nombre.lower().replace(' ', '.')
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        return f"{email_base}_{timestamp}@inlaze.test"
+        return f"{email_base}_{unique_ids.next()}@inlaze.test"
     
     @staticmethod
     def generar_password_valido():
@@ -188,20 +189,21 @@ def get_registro_test_data():
     
     Returns:
         dict: Conjunto de datos de prueba para diferentes escenarios de registro:
-            - valid_user: Usuario con datos válidos
+            - valid_user: Usuario con datos válidos (generados, con correo único)
             - mismatched_passwords: Usuario con contraseñas que no coinciden
     """
+    usuario = TestDataGenerator.generar_usuario_prueba()
     return {
         'valid_user': {
-            'name': 'Nicolas Gaitan',
-            'email': 'jnicogaitan@gmail.com',
-            'password': 'Password1*',
-            'confirm_password': 'Password1*'
+            'name': usuario['name'],
+            'email': usuario['email'],
+            'password': usuario['password'],
+            'confirm_password': usuario['password']
         },
         'mismatched_passwords': {
-            'name': 'Nicolas Gaitan',
-            'email': 'jnicogaitan@gmail.com',
-            'password': 'Password1*',
+            'name': usuario['name'],
+            'email': usuario['email'],
+            'password': usuario['password'],
             'confirm_password': 'DifferentPass1*'
         }
     }
@@ -211,14 +213,14 @@ def get_login_test_data():
     
     Returns:
         dict: Conjunto de datos de prueba para diferentes escenarios de login:
-            - valid_user: Usuario con credenciales válidas
+            - valid_user: Credenciales con formato válido (generadas, sin cuenta registrada)
             - invalid_credentials: Usuario con credenciales incorrectas
             - password_validations: Casos de prueba para validaciones de contraseña
     """
     return {
         'valid_user': {
-            'email': 'jnicogaitan@gmail.com',
-            'password': 'Password1*'
+            'email': TestDataGenerator.generar_email(),
+            'password': TestDataGenerator.generar_password_valido()
         },
         'invalid_credentials': {
             'email': 'usuario.invalido@test.com',
@@ -0,0 +1,57 @@
+import hashlib
+import itertools
+import os
+import secrets
+
+from .browser_resources import worker_index
+
+SEED_ENV = 'TEST_DATA_SEED'
+
+
+class UniqueIdGenerator:
+    """Generador de identificadores únicos para datos de prueba
+
+    Cada identificador combina el índice del worker de xdist, un nonce del
+    proceso y un contador monotónico: dos workers nunca comparten prefijo y
+    dentro de un proceso el contador nunca se repite, sin depender del reloj.
+
+    Note:
+        - Con una semilla (``TEST_DATA_SEED`` o ``configure(seed=...)``) el
+          nonce es determinista y una ejecución puede reproducirse; contra un
+          backend real conviene cambiar la semilla entre ejecuciones, porque los
+          correos ya registrados se repetirían
+        - ``next(itertools.count())`` es atómico, por lo que el generador puede
+          usarse desde varios hilos a la vez
+    """
+
+    def __init__(self, worker_id=None, seed=None):
+        self.configure(worker_id, seed)
+
+    def configure(self, worker_id=None, seed=None):
+        """Reiniciar el prefijo y el contador
+
+        Args:
+            worker_id: Identificador del worker (por defecto ``PYTEST_XDIST_WORKER``)
+            seed: Semilla para un nonce reproducible (por defecto ``TEST_DATA_SEED``)
+        """
+        seed = seed if seed is not None else os.environ.get(SEED_ENV)
+        if seed is None:
+            nonce = secrets.token_hex(3)
+        else:
+            nonce = hashlib.sha1(str(seed).encode('utf-8')).hexdigest()[:6]
+        self.seed = seed
+        self.prefix = f"w{worker_index(worker_id)}-{nonce}"
+        self._counter = itertools.count()
+
+    def next(self):
+        """Obtener el siguiente identificador (por ejemplo ``w3-a1b2c3f``)"""
+        return f"{self.prefix}{next(self._counter):x}"
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+
+unique_ids = UniqueIdGenerator()
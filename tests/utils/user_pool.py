@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .file_lock import FileLock
+from .session_stats import session_stats
+from .test_data import TestDataGenerator
+
+STATS_SECTION = 'user_pool'
+
+DEFAULT_LEDGER_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'inlaze-qa', 'users')
+
+AVAILABLE = 'libre'
+LEASED = 'en uso'
+RETIRED = 'retirado'
+
+# Duración de un préstamo sin renovar; un préstamo vencido se considera
+# abandonado (worker interrumpido) y el usuario vuelve a estar libre
+DEFAULT_LEASE_TTL = 15 * 60
+
+
+def ledger_path_for(api_url, ledger_dir=None):
+    """Ruta del registro de usuarios de una API
+
+    Los usuarios solo existen en el backend donde se crearon, por lo que cada
+    URL de API tiene su propio registro.
+    """
+    digest = hashlib.sha1(api_url.rstrip('/').encode('utf-8')).hexdigest()[:12]
+    return os.path.join(ledger_dir or DEFAULT_LEDGER_DIR, f"{digest}.json")
+
+
+class UserPool:
+    """Pool de usuarios de prueba ya registrados, compartido entre workers
+
+    Los usuarios se crean por API en bloque y en paralelo al iniciar la sesión
+    y se guardan en un registro JSON protegido por un archivo de bloqueo. Cada
+    prueba obtiene un usuario en préstamo exclusivo (``lease``) y lo devuelve
+    (``release``) o lo retira (``retire``) al terminar.
+
+    Note:
+        - Todos los workers de xdist comparten el mismo registro, por lo que
+          nunca se entrega el mismo correo a dos pruebas a la vez
+        - Cada préstamo vence ``lease_ttl`` segundos después de la última
+          operación de su proceso sobre el registro (cada ``lease``,
+          ``release``, ``retire`` o ``fill`` renueva sus préstamos). Los
+          vencidos, de un worker interrumpido, se recuperan automáticamente;
+          no se consultan PIDs, que el sistema reutiliza
+        - Si el pool se agota se crea un usuario adicional bajo demanda
+    """
+
+    def __init__(self, client, ledger_path, size=5, max_workers=8, lease_ttl=DEFAULT_LEASE_TTL,
+                 stats=session_stats):
+        """
+        Args:
+            client: ``AuthClient`` usado para registrar los usuarios
+            ledger_path: Ruta del registro JSON de usuarios
+            size: Usuarios libres que se garantizan al llenar el pool
+            max_workers: Registros simultáneos durante el llenado
+            lease_ttl: Segundos que dura un préstamo sin renovar
+            stats: Acumulador de métricas de la sesión
+        """
+        self.client = client
+        self.ledger_path = ledger_path
+        self.size = size
+        self.max_workers = max_workers
+        self.lease_ttl = lease_ttl
+        self.stats = stats
+        self._lock = FileLock(f"{ledger_path}.lock")
+        # El nonce distingue a este pool de otro proceso que reciba el mismo PID
+        self.owner = f"{os.environ.get('PYTEST_XDIST_WORKER', 'main')}:{os.getpid()}:{secrets.token_hex(4)}"
+        stats.register_section(STATS_SECTION, "Pool de usuarios de prueba")
+
+    def fill(self):
+        """Registrar en paralelo los usuarios que falten hasta tener ``size`` libres
+
+        Returns:
+            int: Número de usuarios creados
+        """
+        with self._lock:
+            users = self._read()
+            self._reclaim(users)
+            missing = self.size - sum(1 for user in users if user['state'] == AVAILABLE)
+            created = self._create(missing) if missing > 0 else []
+            users.extend(dict(user, state=AVAILABLE, owner=None) for user in created)
+            self._write(users)
+        self.stats.incr(STATS_SECTION, 'usuarios creados al inicio', len(created))
+        return len(created)
+
+    def lease(self):
+        """Obtener un usuario en préstamo exclusivo
+
+        Returns:
+            dict: Credenciales del usuario (name, email, password)
+        """
+        with self._lock:
+            users = self._read()
+            self._reclaim(users)
+            user = next((user for user in users if user['state'] == AVAILABLE), None)
+            if user is None:
+                user = dict(self._create(1)[0], state=AVAILABLE)
+                users.append(user)
+                self.stats.incr(STATS_SECTION, 'usuarios creados bajo demanda')
+            user.update(state=LEASED, owner=self.owner, leased_at=time.time(), expires_at=time.time() + self.lease_ttl)
+            self._write(users)
+        self.stats.incr(STATS_SECTION, 'préstamos')
+        return {key: user[key] for key in ('name', 'email', 'password')}
+
+    def release(self, user):
+        """Devolver un usuario al pool para que otra prueba lo use"""
+        self._set_state(user, AVAILABLE)
+
+    def retire(self, user):
+        """Retirar un usuario cuyo estado la prueba modificó (contraseña, datos...)"""
+        self._set_state(user, RETIRED)
+        self.stats.incr(STATS_SECTION, 'usuarios retirados')
+
+    def _set_state(self, user, state):
+        with self._lock:
+            users = self._read()
+            self._reclaim(users)
+            for entry in users:
+                if entry['email'] == user['email'] and entry['state'] == LEASED and entry['owner'] == self.owner:
+                    entry.update(state=state, owner=None, leased_at=None, expires_at=None)
+            self._write(users)
+
+    def _create(self, count):
+        datos = TestDataGenerator.generar_usuarios_prueba(count)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, count))) as executor:
+            futures = [executor.submit(self.client.create_user, **usuario) for usuario in datos]
+            return [future.result() for future in futures]
+
+    def _reclaim(self, users):
+        """Renovar los préstamos propios y liberar los vencidos de otros procesos"""
+        now = time.time()
+        for user in users:
+            if user['state'] != LEASED:
+                continue
+            if user['owner'] == self.owner:
+                user['expires_at'] = now + self.lease_ttl
+            elif (user.get('expires_at') or 0) < now:
+                user.update(state=AVAILABLE, owner=None, leased_at=None, expires_at=None)
+                self.stats.incr(STATS_SECTION, 'préstamos recuperados')
+
+    def _read(self):
+        try:
+            with open(self.ledger_path, encoding='utf-8') as f:
+                return json.load(f)['users']
+        except (FileNotFoundError, ValueError, KeyError):
+            return []
+
+    def _write(self, users):
+        temporary = f"{self.ledger_path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump({'users': users}, f, indent=2, ensure_ascii=False)
+        os.replace(temporary, self.ledger_path)
+
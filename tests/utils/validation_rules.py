@@ -0,0 +1,200 @@
+import re
+from collections import namedtuple
+
+SPECIAL_CHARACTERS = '!@#$%^&*(),.?":{}|<>'
+PASSWORD_MIN_LENGTH = 8
+PASSWORD_MAX_LENGTH = 50
+EMAIL_MAX_LENGTH = 100
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Clases de caracteres (máscara de bits)
+UPPER = 1
+LOWER = 2
+DIGIT = 4
+SPECIAL = 8
+SPACE = 16
+ALL_CLASSES = UPPER | LOWER | DIGIT | SPECIAL | SPACE
+
+
+def _ascii_classes():
+    table = [0] * 128
+    for code in range(128):
+        char = chr(code)
+        if char.isupper():
+            table[code] = UPPER
+        elif char.islower():
+            table[code] = LOWER
+        elif char.isdigit():
+            table[code] = DIGIT
+        elif char.isspace():
+            table[code] = SPACE
+        if char in SPECIAL_CHARACTERS:
+            table[code] |= SPECIAL
+    return tuple(table)
+
+
+_ASCII_CLASSES = _ascii_classes()
+
+
+def classify(text):
+    """Clasificar los caracteres de un texto en una sola pasada
+
+    Args:
+        text: Texto a clasificar
+
+    Returns:
+        int: Máscara con las clases presentes (UPPER, LOWER, DIGIT, SPECIAL, SPACE)
+
+    Note:
+        Los caracteres ASCII se resuelven con una tabla precalculada; el resto
+        usa las reglas Unicode de Python (``isupper``, ``islower``...), igual
+        que las validaciones originales.
+    """
+    flags = 0
+    for char in text:
+        code = ord(char)
+        if code < 128:
+            flags |= _ASCII_CLASSES[code]
+        elif char.isupper():
+            flags |= UPPER
+        elif char.islower():
+            flags |= LOWER
+        elif char.isdigit():
+            flags |= DIGIT
+        elif char.isspace():
+            flags |= SPACE
+        if flags == ALL_CLASSES:
+            break
+    return flags
+
+
+class ValidationResult(namedtuple('ValidationResult', ['value', 'violations', 'message'])):
+    """Resultado de validar un valor: códigos incumplidos y mensaje principal"""
+
+    __slots__ = ()
+
+    @property
+    def valid(self):
+        return not self.violations
+
+
+class RuleSet:
+    """Conjunto ordenado de reglas de validación para un tipo de dato
+
+    Cada regla es una tupla ``(codigo, predicado, mensaje)``; el predicado recibe
+    el valor y la máscara de ``classify`` y devuelve True si la regla se incumple.
+    Las reglas se evalúan en orden y el mensaje que se muestra al usuario es el
+    de la primera regla incumplida.
+    """
+
+    def __init__(self, name, rules, stop_codes=('required',)):
+        """
+        Args:
+            name: Nombre del conjunto de reglas
+            rules: Lista de reglas ``(codigo, predicado, mensaje)``
+            stop_codes: Códigos que detienen la evaluación si se incumplen
+        """
+        self.name = name
+        self.rules = tuple(rules)
+        self.stop_codes = frozenset(stop_codes)
+        self.messages = {code: message for code, _, message in self.rules}
+
+    def violations(self, value):
+        """Obtener todos los códigos de reglas incumplidas
+
+        Returns:
+            tuple: Códigos en el orden de evaluación (vacía si el valor es válido)
+        """
+        value = value or ''
+        flags = classify(value)
+        found = []
+        for code, violated, _ in self.rules:
+            if violated(value, flags):
+                found.append(code)
+                if code in self.stop_codes:
+                    break
+        return tuple(found)
+
+    def first_error(self, value):
+        """Obtener el mensaje de la primera regla incumplida o None si es válido"""
+        value = value or ''
+        flags = classify(value)
+        for code, violated, message in self.rules:
+            if violated(value, flags):
+                return message
+        return None
+
+    def validate(self, value):
+        """Validar un valor
+
+        Returns:
+            ValidationResult: Valor, códigos incumplidos y mensaje principal
+        """
+        codes = self.violations(value)
+        return ValidationResult(value, codes, self.messages[codes[0]] if codes else None)
+
+
+def validate_many(values, rules):
+    """Validar muchos valores con el mismo conjunto de reglas, sin navegador
+
+    Args:
+        values: Iterable de valores a validar
+        rules: Conjunto de reglas (por ejemplo ``REGISTER_PASSWORD``)
+
+    Returns:
+        list: ``ValidationResult`` por cada valor, en el mismo orden
+    """
+    validate = rules.validate
+    return [validate(value) for value in values]
+
+
+def _missing(char_class):
+    return lambda value, flags: not flags & char_class
+
+
+NAME = RuleSet('nombre', [
+    ('required', lambda value, flags: not value.strip(), "El nombre es obligatorio"),
+    ('min_words', lambda value, flags: len(value.split()) < 2, "El nombre debe contener nombre y apellido"),
+    ('letters_only', lambda value, flags: not all(w.isalpha() for w in value.split()),
+     "El nombre solo puede contener letras"),
+])
+
+LOGIN_EMAIL = RuleSet('correo (inicio de sesión)', [
+    ('required', lambda value, flags: not value, "El correo electrónico es obligatorio"),
+    ('too_long', lambda value, flags: len(value) > EMAIL_MAX_LENGTH,
+     f"El correo electrónico no puede exceder los {EMAIL_MAX_LENGTH} caracteres"),
+    ('format', lambda value, flags: not EMAIL_PATTERN.match(value), "El formato del correo electrónico no es válido"),
+    ('multiple_at', lambda value, flags: value.count('@') > 1, "El correo electrónico no puede contener más de un @"),
+    ('consecutive_dots', lambda value, flags: '..' in value,
+     "El correo electrónico no puede contener puntos consecutivos"),
+])
+
+REGISTER_EMAIL = RuleSet('correo (registro)', [
+    ('required', lambda value, flags: not value.strip(), "El correo electrónico es obligatorio"),
+    ('format', lambda value, flags: not EMAIL_PATTERN.match(value), "El formato del correo electrónico no es válido"),
+])
+
+LOGIN_PASSWORD = RuleSet('contraseña (inicio de sesión)', [
+    ('required', lambda value, flags: not value, "La contraseña es obligatoria"),
+    ('too_short', lambda value, flags: len(value) < PASSWORD_MIN_LENGTH,
+     f"La contraseña debe tener al menos {PASSWORD_MIN_LENGTH} caracteres"),
+    ('too_long', lambda value, flags: len(value) > PASSWORD_MAX_LENGTH,
+     f"La contraseña no puede exceder los {PASSWORD_MAX_LENGTH} caracteres"),
+    ('whitespace', lambda value, flags: ' ' in value, "La contraseña no puede contener espacios"),
+    ('missing_upper', _missing(UPPER), "La contraseña debe contener al menos una mayúscula"),
+    ('missing_lower', _missing(LOWER), "La contraseña debe contener al menos una minúscula"),
+    ('missing_digit', _missing(DIGIT), "La contraseña debe contener al menos un número"),
+    ('missing_special', _missing(SPECIAL), "La contraseña debe contener al menos un carácter especial"),
+])
+
+REGISTER_PASSWORD = RuleSet('contraseña (registro)', [
+    ('required', lambda value, flags: not value, "Por favor, ingresa tu contraseña"),
+    ('too_short', lambda value, flags: len(value) < PASSWORD_MIN_LENGTH,
+     f"La contraseña debe tener al menos {PASSWORD_MIN_LENGTH} caracteres"),
+    ('missing_upper', _missing(UPPER), "La contraseña debe contener al menos una mayúscula"),
+    ('missing_lower', _missing(LOWER), "La contraseña debe contener al menos una minúscula"),
+    ('missing_digit', _missing(DIGIT), "La contraseña debe contener al menos un número"),
+    ('missing_special', _missing(SPECIAL),
+     "La contraseña debe contener al menos un carácter especial (!@#$%^&*(),.?\":{|}|<>)"),
+])
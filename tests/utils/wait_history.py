@@ -0,0 +1,176 @@
+import hashlib
+import json
+import math
+import os
+
+from .file_lock import FileLock
+from .session_stats import session_stats
+
+STATS_SECTION = 'wait_history'
+
+DEFAULT_HISTORY_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'inlaze-qa', 'waits')
+
+
+def history_path_for(base_url, history_dir=None):
+    """Ruta del historial de esperas de una aplicación
+
+    Los tiempos dependen del entorno probado, por lo que cada URL base (o la
+    simulación local, ``local``) tiene su propio historial.
+    """
+    digest = hashlib.sha1(base_url.rstrip('/').encode('utf-8')).hexdigest()[:12]
+    return os.path.join(history_dir or DEFAULT_HISTORY_DIR, f"{digest}.json")
+
+
+class WaitHistory:
+    """Timeouts adaptativos a partir de la duración observada de cada espera
+
+    Registra cuánto tarda cada espera (por localizador y condición) y, cuando
+    hay suficientes muestras, usa como timeout ``multiplier`` veces su p99,
+    limitado entre ``floor`` y ``ceiling``.
+
+    Note:
+        - El historial se guarda en un JSON compartido entre ejecuciones y
+          workers de xdist; cada worker agrega sus muestras al terminar, bajo
+          un archivo de bloqueo
+        - Una espera que agota su timeout adaptativo recibe una única prórroga
+          de ``grace`` veces su p99 (sin superar el timeout fijo); si se
+          cumple se registra su duración real
+        - Una espera que falla se registra como muestra censurada: el tiempo
+          esperado, cota inferior de su duración real. Así el p99 de la
+          siguiente ejecución sube en lugar de quedar sesgado hacia las
+          esperas rápidas
+        - Un timeout indicado explícitamente en la llamada siempre tiene
+          prioridad sobre el adaptativo
+        - Con ``enabled`` en False se siguen registrando muestras, pero se usa
+          el timeout fijo
+    """
+
+    def __init__(self, path=None, enabled=True, multiplier=3.0, floor=1.0, ceiling=10.0,
+                 min_samples=20, max_samples=200, grace=1.5, stats=session_stats):
+        """
+        Args:
+            path: Ruta del historial JSON (None: solo en memoria)
+            enabled: Si se aplican los timeouts adaptativos
+            multiplier: Múltiplo del p99 usado como timeout
+            floor: Timeout mínimo en segundos
+            ceiling: Timeout máximo en segundos
+            min_samples: Muestras necesarias antes de adaptar el timeout
+            max_samples: Muestras que se conservan por espera (las más recientes)
+            grace: Múltiplo del p99 concedido como prórroga al agotarse el
+                   timeout adaptativo
+            stats: Acumulador de métricas de la sesión
+        """
+        self.stats = stats
+        self.path = None
+        self._history = {}
+        self._new = {}
+        self._timeouts = {}
+        self._p99 = {}
+        self.grace = float(grace)
+        self.configure(path, enabled, multiplier, floor, ceiling, min_samples, max_samples)
+        stats.register_section(STATS_SECTION, "Timeouts adaptativos")
+
+    def configure(self, path=None, enabled=None, multiplier=None, floor=None, ceiling=None,
+                  min_samples=None, max_samples=None):
+        """Cambiar la configuración y cargar el historial de ``path``"""
+        if enabled is not None:
+            self.enabled = enabled
+        if multiplier is not None:
+            self.multiplier = float(multiplier)
+        if floor is not None:
+            self.floor = float(floor)
+        if ceiling is not None:
+            self.ceiling = float(ceiling)
+        if min_samples is not None:
+            self.min_samples = int(min_samples)
+        if max_samples is not None:
+            self.max_samples = int(max_samples)
+        if path is not None:
+            self.path = path
+            self._history = self._read()
+        self._timeouts = {}
+        self._p99 = {}
+
+    def timeout_for(self, key, default):
+        """Timeout de una espera
+
+        Args:
+            key: Localizador y condición de la espera
+            default: Timeout fijo cuando no hay historial suficiente
+
+        Returns:
+            float: Timeout en segundos
+        """
+        if not self.enabled:
+            return default
+        timeout = self._timeouts.get(key)
+        if timeout is None:
+            samples = self._history.get(key, [])
+            if len(samples) < self.min_samples:
+                return default
+            p99 = self._p99[key] = percentile(samples, 99)
+            timeout = self._timeouts[key] = min(self.ceiling, max(self.floor, self.multiplier * p99))
+        self.stats.incr(STATS_SECTION, 'esperas con timeout adaptativo')
+        return timeout
+
+    def record(self, key, seconds):
+        """Registrar la duración de una espera que se cumplió"""
+        self._new.setdefault(key, []).append(round(seconds, 4))
+
+    def grace_deadline(self, key, timeout, default):
+        """Límite total de una espera que agotó su timeout adaptativo
+
+        Returns:
+            float: ``timeout`` más ``grace`` veces el p99, sin superar ``default``
+        """
+        return min(default, timeout + self.grace * self._p99.get(key, 0))
+
+    def record_timeout(self, key, timeout):
+        """Registrar una espera que agotó su timeout adaptativo"""
+        self.stats.incr(STATS_SECTION, 'timeouts adaptativos superados')
+        self.stats.add_timing(STATS_SECTION, 'timeout adaptativo agotado', timeout)
+
+    def record_censored(self, key, seconds):
+        """Registrar una espera que falló con timeout adaptativo
+
+        Se guarda el tiempo esperado: la duración real es al menos ese valor.
+        """
+        self._new.setdefault(key, []).append(round(seconds, 4))
+        self.stats.incr(STATS_SECTION, 'muestras censuradas (esperas fallidas)')
+
+    def save(self):
+        """Agregar las muestras nuevas al historial compartido
+
+        Returns:
+            str: Ruta del historial o None si no hay nada que guardar
+        """
+        if not self.path or not self._new:
+            return None
+        with FileLock(f"{self.path}.lock"):
+            history = self._read()
+            for key, samples in self._new.items():
+                history[key] = (history.get(key, []) + samples)[-self.max_samples:]
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(history, f, ensure_ascii=False, sort_keys=True)
+            os.replace(temporary, self.path)
+        self._new = {}
+        return self.path
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+
+def percentile(samples, percent):
+    """Percentil por el método del rango más cercano"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+wait_history = WaitHistory()